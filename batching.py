@@ -0,0 +1,265 @@
+# batching.py
+import threading
+import time
+
+import instrumentation
+
+# =========================
+# CONFIG
+# =========================
+
+# Rough subword tokens per whitespace word for the FCoref (RoBERTa BPE)
+# tokenizer. Only used for scheduling, so it does not need to be exact.
+TOKENS_PER_WORD = 1.3
+
+# FCoref encodes documents in segments of max_segment_len tokens, and its
+# batch sampler charges every document whole segments. Batch budgets here
+# are in the same unit (segment_tokens), so a budget means what it means
+# to the model: 16384 is 32 short documents, or 4 of up to 2048 tokens.
+SEGMENT_TOKENS = 512
+
+DEFAULT_MAX_TOKENS = 16384
+
+
+def estimate_tokens(text):
+    return max(1, int(len(text.split()) * TOKENS_PER_WORD) + 2)
+
+
+def segment_tokens(text):
+    """
+    estimate_tokens() rounded up to whole FCoref segments.
+    """
+    return -(-estimate_tokens(text) // SEGMENT_TOKENS) * SEGMENT_TOKENS
+
+
+def model_batch_tokens(texts):
+    """
+    max_tokens_in_batch that makes FCoref run `texts` as one forward pass
+    instead of re-batching them: every document charged the longest one's
+    segments, plus one segment of slack for estimates that come out short.
+    """
+    return len(texts) * (max(segment_tokens(t) for t in texts) + SEGMENT_TOKENS)
+
+
+# =========================
+# SCHEDULER
+# =========================
+
+def schedule_batches(texts, max_tokens=DEFAULT_MAX_TOKENS, max_docs=None, lengths=None):
+    """
+    Groups documents of similar length under a padded-token budget.
+
+    Documents are sorted by length in segment tokens (segment_tokens) and
+    packed greedily; a batch costs len(batch) * longest_member tokens once
+    padded, which is what drives both compute and peak memory. A document
+    larger than the budget gets a batch of its own.
+
+    returns: List[List[int]] of indices into `texts`
+    """
+    if lengths is None:
+        lengths = [segment_tokens(t) for t in texts]
+    order = sorted(range(len(lengths)), key=lengths.__getitem__)
+
+    batches = []
+    pos = 0
+    while pos < len(order):
+        end = _take_batch(order, pos, lengths, max_tokens, max_docs)
+        batches.append(order[pos:end])
+        pos = end
+
+    return batches
+
+
+def _take_batch(order, pos, lengths, max_tokens, max_docs):
+    """
+    Greedily extends a batch from order[pos]; returns the end position.
+    `order` is sorted by length, so the newest member is always the longest.
+    """
+    end = pos + 1
+    while end < len(order):
+        if max_docs and end - pos >= max_docs:
+            break
+        if lengths[order[end]] * (end - pos + 1) > max_tokens:
+            break
+        end += 1
+    return end
+
+
+def padding_stats(batches, lengths):
+    """
+    returns: (real tokens, padded tokens, largest padded batch)
+    """
+    real = padded = peak = 0
+    for batch in batches:
+        longest = max(lengths[i] for i in batch)
+        real += sum(lengths[i] for i in batch)
+        padded += longest * len(batch)
+        peak = max(peak, longest * len(batch))
+    return real, padded, peak
+
+
+def run_batched(texts, fn, max_tokens=DEFAULT_MAX_TOKENS, max_docs=None, controller=None):
+    """
+    Calls fn(list_of_texts) -> list_of_results once per scheduled batch and
+    returns the results in the original order of `texts`.
+
+    controller: optional AdaptiveBatchController; batches are then formed
+                one at a time under its current budget (`max_tokens` is
+                ignored) and each one's latency is fed back to it.
+    """
+    texts = list(texts)
+    lengths = [segment_tokens(t) for t in texts]
+    if controller is not None:
+        return _run_adaptive(texts, fn, lengths, max_docs, controller)
+
+    batches = schedule_batches(texts, max_tokens=max_tokens, max_docs=max_docs, lengths=lengths)
+
+    if instrumentation.ENABLED:
+        real, padded, _ = padding_stats(batches, lengths)
+        instrumentation.count("batches", len(batches))
+        instrumentation.count("batch_tokens", real)
+        instrumentation.count("batch_padded_tokens", padded)
+
+    results = [None] * len(texts)
+    for batch in batches:
+        _scatter(results, batch, fn([texts[i] for i in batch]))
+    return results
+
+
+def _scatter(results, batch, batch_results):
+    if len(batch_results) != len(batch):
+        raise RuntimeError(f"batch of {len(batch)} documents returned {len(batch_results)} results")
+    for i, result in zip(batch, batch_results):
+        results[i] = result
+
+
+def _run_adaptive(texts, fn, lengths, max_docs, controller):
+    order = sorted(range(len(texts)), key=lengths.__getitem__)
+    results = [None] * len(texts)
+    pos = 0
+    while pos < len(order):
+        end = _take_batch(order, pos, lengths, controller.budget, max_docs)
+        batch = order[pos:end]
+        pos = end
+
+        padded = lengths[batch[-1]] * len(batch)
+        start = time.perf_counter()
+        _scatter(results, batch, fn([texts[i] for i in batch]))
+        controller.record(padded, time.perf_counter() - start)
+
+        instrumentation.count("batches")
+        instrumentation.count("batch_tokens", sum(lengths[i] for i in batch))
+        instrumentation.count("batch_padded_tokens", padded)
+    return results
+
+
+# =========================
+# ADAPTIVE CONTROLLER
+# =========================
+
+class AdaptiveBatchController:
+    """
+    Chooses the padded-token budget per batch from measured latency and RSS,
+    since no fixed budget suits both one-line sentences and long resumes.
+
+    With `target_latency` (seconds per batch) the budget follows AIMD:
+    it grows by `step` tokens while batches finish under the target and
+    shrinks in proportion to the overshoot (at least by `backoff`) when one
+    runs over. Without a target it hill-climbs on throughput (padded
+    tokens/second): keep growing while throughput improves, back off when
+    it drops. Crossing `max_rss_mb` always halves the budget.
+
+    The budget is in segment tokens like every batch budget here (see
+    SEGMENT_TOKENS) and always a whole number of segments, so each step
+    admits one more segment's worth of documents. One controller may be
+    shared by several threads (CorefResolver.thread_view); record() and
+    budget are serialized by a lock.
+
+    Decisions are published through instrumentation:
+      gauges    batch_token_budget, batch_latency_seconds,
+                batch_tokens_per_second, batch_rss_bytes
+      counter   batch_budget_changes{direction="up"|"down"}
+    """
+
+    def __init__(self, target_latency=None, initial_tokens=DEFAULT_MAX_TOKENS,
+                 min_tokens=SEGMENT_TOKENS, max_tokens=65536, step=SEGMENT_TOKENS, backoff=0.5,
+                 max_rss_mb=None, smoothing=0.3):
+        if min_tokens > max_tokens:
+            raise ValueError("min_tokens must not exceed max_tokens")
+        self.target_latency = target_latency
+        self.min_tokens = min_tokens
+        self.max_tokens = max_tokens
+        self.step = step
+        self.backoff = backoff
+        self.max_rss_bytes = max_rss_mb * 1024 * 1024 if max_rss_mb else None
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+
+        self._budget = self._clamp(initial_tokens)
+        self.latency = None      # smoothed seconds per batch
+        self.throughput = None   # smoothed padded tokens per second
+        self._best_throughput = None
+        instrumentation.set_gauge("batch_token_budget", self._budget)
+
+    @property
+    def budget(self):
+        with self._lock:
+            return self._budget
+
+    def _clamp(self, tokens):
+        tokens = int(tokens) // SEGMENT_TOKENS * SEGMENT_TOKENS
+        return max(self.min_tokens, min(self.max_tokens, tokens))
+
+    def _smooth(self, old, new):
+        return new if old is None else old + self.smoothing * (new - old)
+
+    def record(self, padded_tokens, seconds, rss_bytes=None):
+        """
+        Feeds back one finished batch and returns the budget for the next.
+        """
+        with self._lock:
+            return self._record(padded_tokens, seconds, rss_bytes)
+
+    def _record(self, padded_tokens, seconds, rss_bytes):
+        seconds = max(seconds, 1e-6)
+        self.latency = self._smooth(self.latency, seconds)
+        self.throughput = self._smooth(self.throughput, padded_tokens / seconds)
+        if rss_bytes is None and self.max_rss_bytes:
+            from memory_guard import current_rss_bytes
+            rss_bytes = current_rss_bytes()
+
+        # A batch well under the budget says nothing about a bigger one
+        filled = padded_tokens >= self._budget // 2
+
+        if self.max_rss_bytes and rss_bytes and rss_bytes > self.max_rss_bytes:
+            budget = self._budget * 0.5
+        elif self.target_latency is not None:
+            if seconds > self.target_latency:
+                budget = self._budget * max(self.backoff, self.target_latency / seconds)
+            elif filled:
+                budget = self._budget + self.step
+            else:
+                budget = self._budget
+        elif not filled:
+            budget = self._budget
+        elif self._best_throughput is None or self.throughput >= self._best_throughput:
+            self._best_throughput = self.throughput
+            budget = self._budget + self.step
+        else:
+            # Past the knee: give back the last steps and re-measure from there
+            self._best_throughput = self.throughput
+            budget = self._budget * self.backoff ** 0.5
+
+        self._set_budget(self._clamp(budget))
+
+        instrumentation.set_gauge("batch_latency_seconds", self.latency)
+        instrumentation.set_gauge("batch_tokens_per_second", self.throughput)
+        if rss_bytes:
+            instrumentation.set_gauge("batch_rss_bytes", rss_bytes)
+        return self._budget
+
+    def _set_budget(self, budget):
+        if budget != self._budget:
+            instrumentation.count("batch_budget_changes", direction="up" if budget > self._budget else "down")
+            self._budget = budget
+            instrumentation.set_gauge("batch_token_budget", budget)
@@ -0,0 +1,312 @@
+# benchmark.py
+import argparse
+import sys
+import time
+
+import evaluation
+from batching import DEFAULT_MAX_TOKENS
+
+# =========================
+# VARIANTS
+# =========================
+#
+# A variant is a factory taking the CLI args and returning a callable
+# texts -> structured results (same shape as
+# analyze_sentences_return_structured_spans). Every variant is timed and
+# then scored against expected_labels.json, so a speed-up that changes the
+# detector output shows up as a regression.
+
+VARIANTS = {}
+
+
+def register(name):
+    def decorator(factory):
+        VARIANTS[name] = factory
+        return factory
+    return decorator
+
+
+@register("baseline")
+def _baseline(args):
+    from coref_solver import CorefResolver
+    from pipeline import analyze_sentences_return_structured_spans
+
+    resolver = CorefResolver(device="cpu", num_threads=args.threads)
+    return lambda texts: analyze_sentences_return_structured_spans(texts, resolver)
+
+
+@register("quantized")
+def _quantized(args):
+    from coref_solver import CorefResolver
+    from pipeline import analyze_sentences_return_structured_spans
+
+    resolver = CorefResolver(device="cpu", quantize=True, num_threads=args.threads)
+    return lambda texts: analyze_sentences_return_structured_spans(texts, resolver)
+
+
+@register("onnx")
+def _onnx(args):
+    from coref_solver import CorefResolver
+    from pipeline import analyze_sentences_return_structured_spans
+
+    if not args.onnx_dir:
+        raise SystemExit("the onnx variant needs --onnx-dir (see onnx_backend.py export)")
+    resolver = CorefResolver(device="cpu", num_threads=args.threads, backend="onnx", onnx_dir=args.onnx_dir)
+    return lambda texts: analyze_sentences_return_structured_spans(texts, resolver)
+
+
+@register("batched")
+def _batched(args):
+    from coref_solver import CorefResolver
+    from pipeline import analyze_batched
+
+    resolver = CorefResolver(device="cpu", num_threads=args.threads)
+    return lambda texts: analyze_batched(texts, resolver, max_tokens=args.max_tokens)
+
+
+@register("segmented")
+def _segmented(args):
+    from coref_solver import CorefResolver
+    from pipeline import analyze_batched
+
+    resolver = CorefResolver(device="cpu", num_threads=args.threads)
+    return lambda texts: analyze_batched(texts, resolver, max_tokens=args.max_tokens, segmented=True)
+
+
+@register("adaptive")
+def _adaptive(args):
+    from batching import AdaptiveBatchController
+    from coref_solver import CorefResolver
+    from pipeline import analyze_batched
+
+    controller = AdaptiveBatchController(target_latency=args.target_latency, initial_tokens=args.max_tokens)
+    resolver = CorefResolver(device="cpu", num_threads=args.threads, batch_controller=controller)
+
+    def analyze(texts):
+        results = analyze_batched(texts, resolver)
+        print(f"adaptive: final budget {controller.budget} tokens, "
+              f"{controller.latency or 0.0:.3f}s/batch, {controller.throughput or 0.0:.0f} tokens/s")
+        return results
+    return analyze
+
+
+@register("cascade")
+def _cascade(args):
+    from coref_solver import CorefResolver
+    from heuristic_coref import CascadeResolver
+    from pipeline import analyze_batched
+
+    resolver = CascadeResolver(CorefResolver(device="cpu", num_threads=args.threads))
+
+    def analyze(texts):
+        results = analyze_batched(texts, resolver, max_tokens=args.max_tokens)
+        print(f"cascade: {resolver.stats} ({100 * resolver.coverage():.1f}% without FCoref)")
+        return results
+    return analyze
+
+
+@register("pipelined")
+def _pipelined(args):
+    from coref_solver import CorefResolver
+    from pipeline import analyze_pipelined
+
+    resolver = CorefResolver(device="cpu", num_threads=args.threads)
+    return lambda texts: analyze_pipelined(texts, resolver, max_tokens=args.max_tokens)
+
+
+@register("fork-pool")
+def _fork_pool(args):
+    from coref_solver import CorefResolver
+    from worker_pool import ForkWorkerPool
+
+    resolver = CorefResolver(device="cpu", num_threads=args.threads)
+    pool = ForkWorkerPool(resolver, workers=args.workers, max_tokens=args.max_tokens, threads_per_worker=args.threads)
+
+    def analyze(texts):
+        results = pool.map(texts)
+        print(pool.memory_report())
+        return results
+    return analyze
+
+
+@register("thread-pool")
+def _thread_pool(args):
+    from coref_solver import CorefResolver
+    from thread_pool import ThreadWorkerPool
+
+    resolver = CorefResolver(device="cpu")
+    pool = ThreadWorkerPool(resolver, workers=args.workers, max_tokens=args.max_tokens, threads_per_worker=args.threads)
+
+    def analyze(texts):
+        results = pool.map(texts)
+        print(pool.memory_report())
+        return results
+    return analyze
+
+
+@register("dedup")
+def _dedup(args):
+    from coref_solver import CorefResolver
+    from dedup import NearDuplicateAnalyzer
+
+    resolver = CorefResolver(device="cpu", num_threads=args.threads)
+
+    def analyze(texts):
+        # fresh index per run, so --repeat does not turn every document into an exact repeat
+        analyzer = NearDuplicateAnalyzer(resolver)
+        results = analyzer.analyze_many(texts)
+        print(f"dedup: {analyzer.stats} ({100 * analyzer.reuse_rate():.1f}% reused)")
+        return results
+    return analyze
+
+
+# =========================
+# RUNNER
+# =========================
+
+def run_variant(name, analyze, texts, labels, repeat=1):
+    best = None
+    results = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = analyze(texts)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    predictions = evaluation.predictions_from_results(results)
+    report = evaluation.score(labels, predictions)
+    return {
+        "variant": name,
+        "docs": len(texts),
+        "seconds": best,
+        "docs_per_second": len(texts) / best if best else 0.0,
+        "predictions": predictions,
+        "report": report,
+    }
+
+
+def worker_scaling(texts, max_workers, repeat=1, max_tokens=DEFAULT_MAX_TOKENS, pin=False, mode="fork"):
+    """
+    Throughput of the fork pool (or, with mode="thread", the thread pool)
+    at 1, 2, 4, ... max_workers workers, each with its share of the CPUs as
+    torch threads (thread_config.plan_threads). The model is loaded once;
+    every pool forks from (or shares) the same parent.
+    """
+    from coref_solver import CorefResolver
+    from thread_pool import ThreadWorkerPool
+    from worker_pool import ForkWorkerPool
+
+    counts = sorted({min(2 ** i, max_workers) for i in range(max_workers.bit_length() + 1)})
+    resolver = CorefResolver(device="cpu")
+    rows = []
+    for workers in counts:
+        if mode == "thread":
+            pool = ThreadWorkerPool(resolver, workers=workers, max_tokens=max_tokens)
+        else:
+            pool = ForkWorkerPool(resolver, workers=workers, max_tokens=max_tokens, pin=pin)
+        with pool:
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                pool.map(texts)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            rows.append({"workers": workers, "plan": pool.thread_plan, "seconds": best,
+                         "memory": pool.footprint()})
+    return rows
+
+
+def format_scaling(rows):
+    lines = [f"{'WORKERS':>8}{'THREADS':>9}{'SECONDS':>10}{'DOCS/S':>10}{'SPEEDUP':>9}{'EFFICIENCY':>12}"
+             f"{'MEMORY MB':>11}"]
+    base = rows[0]["seconds"] if rows else 0.0
+    for row in rows:
+        speedup = base / row["seconds"] if row["seconds"] else 0.0
+        lines.append(
+            f"{row['workers']:>8}{row['plan'].intra_op:>9}{row['seconds']:>10.2f}"
+            f"{row['docs'] / row['seconds'] if row['seconds'] else 0.0:>10.2f}"
+            f"{speedup:>9.2f}{100 * speedup / row['workers']:>11.0f}%"
+            f"{row['memory'] / (1024 * 1024):>11.1f}"
+        )
+    return "\n".join(lines)
+
+
+def agreement(predictions, reference):
+    """
+    Fraction of documents whose predicted spans match the reference exactly.
+    """
+    shared = [key for key in reference if key in predictions]
+    if not shared:
+        return 1.0
+    return sum(predictions[k] == reference[k] for k in shared) / len(shared)
+
+
+def format_rows(rows):
+    lines = [
+        f"{'VARIANT':<20}{'DOCS':>7}{'SECONDS':>10}{'DOCS/S':>10}"
+        f"{'SPAN P':>9}{'SPAN R':>9}{'AGREE':>8}{'REGRESS':>9}"
+    ]
+    reference = rows[0]["predictions"] if rows else {}
+    for row in rows:
+        manual = row["report"]["sources"].get(evaluation.MANUAL, {})
+        lines.append(
+            f"{row['variant']:<20}{row['docs']:>7}{row['seconds']:>10.2f}{row['docs_per_second']:>10.2f}"
+            f"{manual.get('span_precision', 0.0):>9.3f}{manual.get('span_recall', 0.0):>9.3f}"
+            f"{agreement(row['predictions'], reference):>8.3f}"
+            f"{len(evaluation.regressions(row['report'])):>9}"
+        )
+    return "\n".join(lines)
+
+
+def add_arguments(parser):
+    parser.add_argument("--variant", action="append", help=f"one of {sorted(VARIANTS)} (default: baseline)")
+    parser.add_argument("--corpus", action="append", help="bundled corpus name (default: all)")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--threads", type=int, help="torch intra-op threads")
+    parser.add_argument("--workers", type=int, help="worker count for pool variants (default: all CPUs)")
+    parser.add_argument("--max-tokens", type=int, default=DEFAULT_MAX_TOKENS, help="padded tokens per coref batch, in whole 512-token segments per document")
+    parser.add_argument("--onnx-dir", help="exported graphs for the onnx variant")
+    parser.add_argument("--target-latency", type=float,
+                        help="seconds per coref batch for the adaptive variant (default: maximize throughput)")
+    parser.add_argument("--scale-workers", type=int, metavar="N",
+                        help="instead of variants, measure pool throughput from 1 to N workers")
+    parser.add_argument("--pin", action="store_true", help="with --scale-workers: pin each worker to its CPUs")
+    parser.add_argument("--scale-mode", choices=("fork", "thread"), default="fork",
+                        help="with --scale-workers: forked processes or threads in one process")
+    parser.add_argument("--labels", default=evaluation.LABELS_FILE)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time analysis variants and check their output.")
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    from corpora import CORPORA
+    texts = [text for name in (args.corpus or CORPORA) for text in CORPORA[name]]
+    labels = evaluation.load_labels(args.labels)
+
+    if args.scale_workers:
+        rows = worker_scaling(texts, args.scale_workers, repeat=args.repeat, max_tokens=args.max_tokens,
+                              pin=args.pin, mode=args.scale_mode)
+        for row in rows:
+            row["docs"] = len(texts)
+        print(format_scaling(rows))
+        return 0
+
+    rows = []
+    for name in args.variant or ["baseline"]:
+        analyze = VARIANTS[name](args)
+        rows.append(run_variant(name, analyze, texts, labels, repeat=args.repeat))
+
+    # AGREE is measured against the first variant, e.g.
+    #   python benchmark.py --variant baseline --variant quantized
+    print(format_rows(rows))
+    unlabeled = max(row["report"]["unlabeled"] for row in rows)
+    if unlabeled:
+        print(f"WARNING: {unlabeled} documents have no snapshot to compare against; "
+              f"record one with `python evaluation.py --record`")
+    return 1 if any(evaluation.regressions(row["report"]) for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,22 @@
-import spacy
+import instrumentation
 from knowledge_base import (
-    GENDERED_ROLES, PRONOUN_MAP,
-    MALE_MODIFIERS, FEMALE_MODIFIERS,
+    PRONOUN_MAP, GENDERED_PRONOUN,
     FREQUENCY_ADVERBS, OBLIGATION_MODALS,
     PREDICTION_MODALS, ALL_MODALS, CONDITIONAL_MARKERS
 )
+from lexicon_matcher import LexiconMatcher
+from role_lexicon import load_default_lexicon
+from snapshot import load_spacy
+from results import BiasSpan, REASONS, FORCED_GENERIC_ROLE, GENERIC_CONTEXT
 
-nlp = spacy.load("en_core_web_sm")
+# en_core_web_sm, or the copy in $PRONOUNBIAS_SNAPSHOT (see snapshot.py)
+nlp = load_spacy()
+# roles.lex (or $PRONOUNBIAS_ROLE_LEXICON) extends the role tables when present
+LEXICON = LexiconMatcher.from_knowledge_base(fallback=load_default_lexicon())
+
+# Mention-initial words used by cluster_prior()
+GENERIC_DETERMINERS = {"a", "an", "every", "each", "any"}
+DETERMINERS = GENERIC_DETERMINERS | {"the", "this", "that", "my", "your", "our"}
 
 # =========================
 # HELPER FUNCTIONS
@@ -35,15 +45,6 @@ def get_governing_verb(token):
     return head if head.pos_ in ["VERB", "AUX"] else None
 
 
-def get_modifier_gender(span):
-    for child in span.root.children:
-        if child.lower_ in MALE_MODIFIERS:
-            return "M"
-        if child.lower_ in FEMALE_MODIFIERS:
-            return "F"
-    return None
-
-
 def has_present_aux(verb):
     for child in verb.children:
         if child.dep_ in ["aux", "auxpass"] and child.lemma_ == "be":
@@ -79,12 +80,15 @@ def is_strictly_episodic(verb):
     return False
 
 
-def is_role_noun(span):
+def is_role_noun(span, lexicon=None):
     root = span.root
-    if root.pos_ != "NOUN":
-        return False
     if root.ent_type_ in ["PERSON", "ORG", "GPE"]:
         return False
+    # Known role phrases count even when the tagger misses the noun ("team lead")
+    if lexicon is not None and lexicon.is_role(root):
+        return True
+    if root.pos_ != "NOUN":
+        return False
     return True
 
 
@@ -131,27 +135,128 @@ def is_generic_context(verb, is_anchored_entity, is_definite, recursion_depth=0)
 # MAIN LOGIC
 # =========================
 
-def detect_pronoun_bias(text: str, clusters):
-    doc = nlp(text)
+def detect_pronoun_bias(text: str, clusters, doc=None):
+    # A pre-parsed doc (e.g. from nlp.pipe or a cached DocBin) skips the parse
+    if doc is None:
+        with instrumentation.stage("spacy_parse"):
+            doc = nlp(text)
     bias_report = []
 
+    # All role/modifier phrases of the document in one pass
+    with instrumentation.stage("lexicon_match"):
+        lexicon = LEXICON.index(doc)
+
     for cluster_indices in clusters:
+        for span, code in iter_cluster_biases(doc, cluster_indices, lexicon):
+            sent = span.sent
+            bias_report.append(BiasSpan(
+                span.start_char, span.end_char,
+                sent.start_char, sent.end_char,
+                code
+            ))
+
+    return bias_report
+
+
+def classify_pronoun_bias(text: str, clusters, doc=None):
+    """
+    Document-level yes/no version of detect_pronoun_bias: True as soon as
+    one mention is flagged. Text without a gendered pronoun is never parsed,
+    clusters without a pronoun mention are dropped before alignment, and the
+    rest are tried most-likely-first (cluster_prior), so biased documents
+    usually stop after the first cluster. No BiasSpan is built.
+    """
+    if not GENDERED_PRONOUN.search(text):
+        instrumentation.count("classify_exit", reason="no gendered pronoun")
+        return False
+
+    candidates = pronoun_clusters(text, clusters)
+    if not candidates:
+        instrumentation.count("classify_exit", reason="no pronoun cluster")
+        return False
+    candidates.sort(key=lambda c: cluster_prior(text, c), reverse=True)
+
+    if doc is None:
+        with instrumentation.stage("spacy_parse"):
+            doc = nlp(text)
+    with instrumentation.stage("lexicon_match"):
+        lexicon = LEXICON.index(doc)
+
+    for rank, cluster_indices in enumerate(candidates):
+        for _ in iter_cluster_biases(doc, cluster_indices, lexicon):
+            instrumentation.count("classify_exit", reason="bias found")
+            instrumentation.count("classify_clusters_evaluated", rank + 1)
+            return True
+
+    instrumentation.count("classify_exit", reason="no bias")
+    instrumentation.count("classify_clusters_evaluated", len(candidates))
+    return False
+
+
+def pronoun_clusters(text, clusters):
+    """
+    Clusters with at least one gendered pronoun mention, checked on the raw
+    text so no parse is needed.
+    """
+    return [c for c in clusters if any(text[s:e].lower() in PRONOUN_MAP for s, e in c)]
+
+
+def cluster_prior(text, cluster_indices):
+    """
+    Cheap likelihood that a cluster is flagged, from mention strings only
+    (no parse): generic determiners ("a", "every", "any") and single-gender
+    pronouns raise it; proper names, which anchor the referent, and mixed
+    genders (contrastive symmetry) lower it.
+    """
+    genders = set()
+    score = 0.0
+    for s, e in cluster_indices:
+        mention = text[s:e]
+        lower = mention.lower()
+        if lower in PRONOUN_MAP:
+            genders.add(PRONOUN_MAP[lower])
+            score += 1.0
+            continue
+        first = lower.split(" ", 1)[0]
+        if first in GENERIC_DETERMINERS:
+            score += 2.0
+        elif mention[:1].isupper() and first not in DETERMINERS:
+            score -= 2.0
+    if len(genders) > 1:
+        score -= 10.0
+    return score
+
+
+def iter_cluster_biases(doc, cluster_indices, lexicon):
+    """
+    Evaluates the rules for one coref cluster.
+
+    yields: (pronoun Span, reason code) for each flagged mention, lazily,
+            so callers can stop at the first hit
+    """
+    instrumentation.count("clusters")
+    instrumentation.count("mentions", len(cluster_indices))
+
+    with instrumentation.stage("char_span_alignment"):
         spans = [
             doc.char_span(s[0], s[1])
             for s in cluster_indices
             if doc.char_span(s[0], s[1]) is not None
         ]
-        if not spans:
-            continue
+    instrumentation.count("mentions_unaligned", len(cluster_indices) - len(spans))
+    if not spans:
+        return
 
-        cluster_words = {s.text.lower() for s in spans}
-        if not any(p in cluster_words for p in PRONOUN_MAP):
-            continue
+    cluster_words = {s.text.lower() for s in spans}
+    if not any(p in cluster_words for p in PRONOUN_MAP):
+        instrumentation.count("clusters_skipped", reason="no gendered pronoun")
+        return
 
-        head_span = get_best_head_span(spans)
-        head_root = head_span.root
+    head_span = get_best_head_span(spans)
+    head_root = head_span.root
 
-        # -------- PHASE 1: ANCHORING --------
+    # -------- PHASE 1: ANCHORING --------
+    with instrumentation.stage("rule_anchoring"):
         is_anchored_entity = False
         is_definite = False
 
@@ -180,18 +285,21 @@ def detect_pronoun_bias(text: str, clusters):
                     is_anchored_entity = True
                     break
 
-        # -------- PHASE 2: ROLE GENDER --------
-        role_gender = GENDERED_ROLES.get(head_root.lemma_.lower())
-        mod_gender = get_modifier_gender(head_span)
+    # -------- PHASE 2: ROLE GENDER --------
+    with instrumentation.stage("rule_role_gender"):
+        role_gender = lexicon.role_gender(head_root)
+        mod_gender = lexicon.modifier_gender(head_span)
         if mod_gender:
             role_gender = mod_gender
 
-        # -------- CONTRASTIVE SYMMETRY --------
-        has_male = any(w in PRONOUN_MAP and PRONOUN_MAP[w] == "M" for w in cluster_words)
-        has_female = any(w in PRONOUN_MAP and PRONOUN_MAP[w] == "F" for w in cluster_words)
-        if has_male and has_female:
-            continue
+    # -------- CONTRASTIVE SYMMETRY --------
+    has_male = any(w in PRONOUN_MAP and PRONOUN_MAP[w] == "M" for w in cluster_words)
+    has_female = any(w in PRONOUN_MAP and PRONOUN_MAP[w] == "F" for w in cluster_words)
+    if has_male and has_female:
+        instrumentation.count("clusters_skipped", reason="contrastive symmetry")
+        return
 
+    with instrumentation.stage("rule_pronouns"):
         for span in spans:
             token = span.root
             word = token.text.lower()
@@ -209,7 +317,7 @@ def detect_pronoun_bias(text: str, clusters):
             # NEW RULE: FORCED GENERIC ROLE + PRONOUN
             # ==================================================
             if (
-                is_role_noun(head_span)
+                is_role_noun(head_span, lexicon)
                 and verb is not None
                 and not is_anchored_entity
                 and not is_strictly_episodic(verb)
@@ -221,23 +329,11 @@ def detect_pronoun_bias(text: str, clusters):
                     )
                 )
             ):
-                bias_report.append({
-                    "start": span.start_char,
-                    "end": span.end_char,
-                    "text": word,
-                    "context": span.sent.text,
-                    "reason": "Forced generic role + gendered pronoun"
-                })
+                instrumentation.count("rule_fired", reason=REASONS[FORCED_GENERIC_ROLE])
+                yield span, FORCED_GENERIC_ROLE
                 continue
 
             # -------- EXISTING GENERIC LOGIC --------
             if is_generic_context(verb, is_anchored_entity, is_definite):
-                bias_report.append({
-                    "start": span.start_char,
-                    "end": span.end_char,
-                    "text": word,
-                    "context": span.sent.text,
-                    "reason": "Generic context linked to role"
-                })
-
-    return bias_report
+                instrumentation.count("rule_fired", reason=REASONS[GENERIC_CONTEXT])
+                yield span, GENERIC_CONTEXT
@@ -0,0 +1,216 @@
+# cluster_cache.py
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+from array import array
+
+from spacy.tokens import DocBin
+
+from bias_detector import nlp, detect_pronoun_bias
+
+# =========================
+# FORMAT
+# =========================
+#
+# clusters.bin (little-endian):
+#   header         "PBCC", version, n_docs, n_clusters, n_mentions   (<4sIIII)
+#   digests        n_docs x 8 bytes    blake2b of each text, guards against stale caches
+#   doc_index      uint32[n_docs + 1]      first cluster of each document
+#   cluster_index  uint32[n_clusters + 1]  first mention of each cluster
+#   mentions       uint32[2 * n_mentions]  (start_char, end_char) pairs
+#
+# parses.spacy is a spaCy DocBin holding the parse of every text, so the
+# rule-only pass needs neither FCoref nor the spaCy pipeline components.
+
+MAGIC = b"PBCC"
+VERSION = 1
+HEADER = struct.Struct("<4sIIII")
+DIGEST_SIZE = 8
+
+CLUSTERS_FILE = "clusters.bin"
+PARSES_FILE = "parses.spacy"
+
+
+def text_digest(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=DIGEST_SIZE).digest()
+
+
+def _uint32(values=()):
+    arr = array("I", values)
+    if arr.itemsize != 4:
+        arr = array("L", values)
+    return arr
+
+
+def _to_le(arr):
+    if sys.byteorder != "little":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _from_le(buf, count):
+    arr = _uint32()
+    arr.frombytes(buf[:count * arr.itemsize])
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr
+
+
+# =========================
+# CLUSTERS
+# =========================
+
+def write_clusters(path, texts, clusters_per_doc):
+    doc_index = _uint32([0])
+    cluster_index = _uint32([0])
+    mentions = _uint32()
+
+    for clusters in clusters_per_doc:
+        for cluster in clusters:
+            for start, end in cluster:
+                mentions.append(start)
+                mentions.append(end)
+            cluster_index.append(len(mentions) // 2)
+        doc_index.append(len(cluster_index) - 1)
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(texts), len(cluster_index) - 1, len(mentions) // 2))
+        for text in texts:
+            f.write(text_digest(text))
+        f.write(_to_le(doc_index))
+        f.write(_to_le(cluster_index))
+        f.write(_to_le(mentions))
+
+
+def read_clusters(path):
+    """
+    returns: (digests, clusters_per_doc) with clusters in the same shape as
+    CorefResolver.resolve -> [[(start, end), ...], ...]
+    """
+    with open(path, "rb") as f:
+        data = memoryview(f.read())
+
+    magic, version, n_docs, n_clusters, n_mentions = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path}: not a cluster cache (version {VERSION})")
+
+    pos = HEADER.size
+    digests = [bytes(data[pos + i * DIGEST_SIZE: pos + (i + 1) * DIGEST_SIZE]) for i in range(n_docs)]
+    pos += n_docs * DIGEST_SIZE
+    doc_index = _from_le(data[pos:], n_docs + 1)
+    pos += (n_docs + 1) * 4
+    cluster_index = _from_le(data[pos:], n_clusters + 1)
+    pos += (n_clusters + 1) * 4
+    mentions = _from_le(data[pos:], 2 * n_mentions)
+
+    clusters_per_doc = []
+    for d in range(n_docs):
+        clusters = []
+        for c in range(doc_index[d], doc_index[d + 1]):
+            lo, hi = cluster_index[c], cluster_index[c + 1]
+            clusters.append([(mentions[2 * m], mentions[2 * m + 1]) for m in range(lo, hi)])
+        clusters_per_doc.append(clusters)
+
+    return digests, clusters_per_doc
+
+
+# =========================
+# CACHE
+# =========================
+
+def build_cache(texts, resolver, cache_dir, batch_size=64):
+    """
+    Runs coref and the spaCy parse once and stores both under cache_dir.
+    """
+    texts = list(texts)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    clusters_per_doc = [resolver.resolve(text) for text in texts]
+    write_clusters(os.path.join(cache_dir, CLUSTERS_FILE), texts, clusters_per_doc)
+
+    doc_bin = DocBin()
+    for doc in nlp.pipe(texts, batch_size=batch_size):
+        doc_bin.add(doc)
+    doc_bin.to_disk(os.path.join(cache_dir, PARSES_FILE))
+
+
+def load_cache(cache_dir):
+    digests, clusters_per_doc = read_clusters(os.path.join(cache_dir, CLUSTERS_FILE))
+    doc_bin = DocBin().from_disk(os.path.join(cache_dir, PARSES_FILE))
+    docs = list(doc_bin.get_docs(nlp.vocab))
+
+    if len(docs) != len(digests):
+        raise ValueError(f"{cache_dir}: {len(docs)} parses but {len(digests)} cluster entries")
+    for i, (doc, digest) in enumerate(zip(docs, digests)):
+        if text_digest(doc.text) != digest:
+            raise ValueError(f"{cache_dir}: document {i} does not match its cached clusters")
+
+    return docs, clusters_per_doc
+
+
+def run_rules(cache_dir, context=False):
+    """
+    Rule-only pass: detect_pronoun_bias over cached clusters and parses.
+    Sentence contexts are only copied into the report when requested.
+    """
+    docs, clusters_per_doc = load_cache(cache_dir)
+    return [
+        [b.to_dict(doc.text, context) for b in detect_pronoun_bias(doc.text, clusters, doc=doc)]
+        for doc, clusters in zip(docs, clusters_per_doc)
+    ]
+
+
+def results_digest(results):
+    # Stable fingerprint for comparing two rule runs
+    payload = json.dumps(results, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# =========================
+# CLI
+# =========================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cache coref clusters and re-run only the bias rules.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="run coref once and cache clusters + parses")
+    build.add_argument("cache_dir")
+    build.add_argument("--corpus", action="append", help="bundled corpus name (default: all)")
+
+    rules = sub.add_parser("rules", help="re-run detect_pronoun_bias over a cache")
+    rules.add_argument("cache_dir")
+    rules.add_argument("--out", help="write the bias report as JSON")
+    rules.add_argument("--context", action="store_true", help="include sentence text for each hit")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        from corpora import CORPORA
+        from coref_solver import CorefResolver
+
+        names = args.corpus or list(CORPORA)
+        texts = [text for name in names for text in CORPORA[name]]
+        start = time.perf_counter()
+        build_cache(texts, CorefResolver(device="cpu"), args.cache_dir)
+        print(f"Cached {len(texts)} documents in {time.perf_counter() - start:.2f}s -> {args.cache_dir}")
+
+    elif args.command == "rules":
+        start = time.perf_counter()
+        results = run_rules(args.cache_dir, context=args.context)
+        elapsed = time.perf_counter() - start
+        flagged = sum(1 for r in results if r)
+        print(f"Rules over {len(results)} documents in {elapsed:.2f}s: {flagged} flagged")
+        print(f"Results digest: {results_digest(results)}")
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
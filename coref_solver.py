@@ -1,50 +1,163 @@
 # coref_solver.py
 from fastcoref import FCoref
-import os
-import sys
-from contextlib import contextmanager
+import torch
+import copy
+import logging
 
-@contextmanager
-def suppress_output():
+import datasets
+import transformers
+
+import instrumentation
+import snapshot
+from batching import run_batched, estimate_tokens, model_batch_tokens, DEFAULT_MAX_TOKENS
+from thread_config import plan_threads, apply_torch
+
+
+def quiet_libraries():
     """
-    Aggressively silences stdout and stderr, including C-level (TensorFlow) 
-    and tqdm progress bars.
+    Silences the progress bars and INFO logging of fastcoref, transformers
+    and datasets through their own switches. Nothing else is touched, so
+    the output of other threads and modules still gets through.
+    (FCoref's inference bar is disabled per instance: enable_progress_bar.)
+
+    Called when a CorefResolver is built, not on import, so programs that
+    only import this module keep those libraries' warnings.
     """
-    # Open a null file
-    with open(os.devnull, "w") as devnull:
-        # Save the actual file descriptors
-        old_stdout_fd = sys.stdout.fileno()
-        old_stderr_fd = sys.stderr.fileno()
-        
-        # Save copies of the original file descriptors
-        saved_stdout_fd = os.dup(old_stdout_fd)
-        saved_stderr_fd = os.dup(old_stderr_fd)
-        
-        try:
-            # Redirect stdout/stderr to devnull at the OS level
-            os.dup2(devnull.fileno(), old_stdout_fd)
-            os.dup2(devnull.fileno(), old_stderr_fd)
-            yield
-        finally:
-            # Restore the original file descriptors
-            os.dup2(saved_stdout_fd, old_stdout_fd)
-            os.dup2(saved_stderr_fd, old_stderr_fd)
-            
-            # Close the saved copies
-            os.close(saved_stdout_fd)
-            os.close(saved_stderr_fd)
+    logging.getLogger("fastcoref").setLevel(logging.WARNING)
+    transformers.logging.set_verbosity_error()
+    transformers.utils.logging.disable_progress_bar()
+    datasets.logging.set_verbosity_error()
+    datasets.disable_progress_bars()
+
 
 class CorefResolver:
-    def __init__(self, device='cpu'):
-        # We silence the initialization too to hide TensorFlow warnings
-        with suppress_output():
-            self.model = FCoref(device=device)
+    def __init__(self, device='cpu', quantize=False, num_threads=None, num_interop_threads=None,
+                 memory_guard=None,
+                 batch_controller=None, backend="torch", onnx_dir=None, snapshot_dir=None):
+        """
+        quantize: dynamic int8 quantization of the transformer's Linear
+                  layers (CPU only). Trades a little accuracy for latency.
+        num_threads: torch intra-op threads. None keeps torch's default
+                     unless this process is restricted to fewer CPUs
+                     (affinity mask / cpuset), which then sets the count.
+        num_interop_threads: torch inter-op threads (see thread_config.py).
+        memory_guard: optional memory_guard.MemoryGuard; oversize documents
+                      are then resolved in windows under a memory ceiling.
+        batch_controller: optional batching.AdaptiveBatchController; it then
+                          sets the token budget of resolve_batch() from the
+                          measured latency of earlier batches.
+        backend: "torch", or "onnx" to run the graphs exported by
+                 onnx_backend.py (from `onnx_dir`) on onnxruntime (CPU).
+        snapshot_dir: load FCoref (and its tokenizer spaCy) from a directory
+                      written by snapshot.py, offline; defaults to
+                      $PRONOUNBIAS_SNAPSHOT when set.
+        """
+        self.memory_guard = memory_guard
+        self.batch_controller = batch_controller
+        if quantize and device != 'cpu':
+            raise ValueError("Dynamic int8 quantization is only supported on CPU")
+        if backend not in ("torch", "onnx"):
+            raise ValueError(f"unknown coref backend {backend!r}")
+        if backend == "onnx" and (quantize or device != 'cpu' or not onnx_dir):
+            raise ValueError("The onnx backend needs onnx_dir and runs unquantized on CPU")
+        plan = plan_threads(intra_op=num_threads, inter_op=num_interop_threads)
+        if num_threads or num_interop_threads or plan.intra_op < torch.get_num_threads():
+            apply_torch(plan)
+
+        quiet_libraries()
+        snapshot_dir = snapshot_dir or snapshot.snapshot_dir()
+        with instrumentation.stage("coref_model_load"):
+            if snapshot_dir:
+                self.model = FCoref(
+                    model_name_or_path=snapshot.fcoref_path(snapshot_dir),
+                    device=device,
+                    nlp=snapshot.spacy_path(snapshot_dir),
+                    enable_progress_bar=False
+                )
+            else:
+                self.model = FCoref(device=device, enable_progress_bar=False)
+
+        self.backend = backend
+        if backend == "onnx":
+            from onnx_backend import install_onnx_backend
+            with instrumentation.stage("coref_onnx_load"):
+                install_onnx_backend(self.model, onnx_dir, num_threads=num_threads)
+
+        self.quantized = quantize
+        if quantize:
+            with instrumentation.stage("coref_quantize"):
+                # FCoref keeps the torch module on .model; weights of every
+                # nn.Linear become int8, activations are quantized on the fly
+                self.model.model = torch.quantization.quantize_dynamic(
+                    self.model.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+
+    def thread_view(self):
+        """
+        A resolver for use from another thread. The torch module (weights,
+        read-only at inference; no_grad is per thread) is shared. The
+        stateful parts of FCoref.predict are copied: the fast tokenizer,
+        whose Rust object rejects concurrent use, the collator holding it,
+        and FCoref's spaCy tokenizer pipeline.
+        """
+        view = copy.copy(self)
+        fcoref = copy.copy(self.model)
+        fcoref.tokenizer = copy.deepcopy(self.model.tokenizer)
+        fcoref.collator = copy.copy(self.model.collator)
+        fcoref.collator.tokenizer = fcoref.tokenizer
+        if self.model.nlp is not None:
+            fcoref.nlp = copy.deepcopy(self.model.nlp)
+        view.model = fcoref
+        return view
 
     def resolve(self, text: str):
-        # We silence the prediction to hide "Map/Inference" bars
-        with suppress_output():
+        return self._predict_batch([text])[0]
+
+    def resolve_batch(self, texts, max_tokens=DEFAULT_MAX_TOKENS, docs=None):
+        """
+        Resolves many documents with length-bucketed batches under a token
+        budget (in FCoref segment tokens, see batching.py); each batch is
+        one FCoref forward pass. Clusters come back in the order of `texts`.
+
+        docs (pre-parsed spaCy docs) is accepted for interface parity with
+        heuristic_coref.CascadeResolver and not needed here.
+        """
+        if self.batch_controller is not None:
+            return run_batched(texts, self._predict_batch, controller=self.batch_controller)
+        return run_batched(texts, self._predict_batch, max_tokens=max_tokens)
+
+    def _predict_batch(self, texts):
+        guard = self.memory_guard
+        if guard is None:
+            return self._predict_raw(texts)
+
+        longest = max(estimate_tokens(t) for t in texts)
+        if longest <= guard.max_doc_tokens and guard.admit(longest, len(texts)):
+            return self._predict_raw(texts)
+
+        # Too big or too close to the ceiling: one document at a time,
+        # windowed where needed
+        return [guard.resolve(text, self._predict_raw) for text in texts]
+
+    def _predict_raw(self, texts):
+        # Batches were already formed by run_batched; FCoref runs each as is
+        with instrumentation.stage("coref_predict"):
             preds = self.model.predict(
-                texts=[text],
-                is_split_into_words=False
+                texts=texts,
+                is_split_into_words=False,
+                max_tokens_in_batch=model_batch_tokens(texts)
+            )
+        instrumentation.count("documents", len(texts))
+
+        # FCoref skips documents over the model's max_doc_len; map results
+        # back by index so a gap can never shift clusters onto other texts
+        clusters = [None] * len(texts)
+        for p in preds:
+            clusters[p.text_idx] = p.get_clusters(as_strings=False)
+        missing = [i for i, c in enumerate(clusters) if c is None]
+        if missing:
+            raise RuntimeError(
+                f"FCoref returned no result for {len(missing)} of {len(texts)} documents "
+                f"(over its max_doc_len?); resolve them in windows with a MemoryGuard"
             )
-        return preds[0].get_clusters(as_strings=False)
\ No newline at end of file
+        return clusters
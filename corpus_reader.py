@@ -0,0 +1,208 @@
+# corpus_reader.py
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+# =========================
+# FORMATS
+# =========================
+#
+# "lines"            one document per line, UTF-8, read verbatim (raw dumps).
+# "escaped-lines"    as "lines", but newlines and backslashes inside a
+#                    document are escaped as \n and \\ (write_lines).
+# "length-prefixed"  repeated <uint32 little-endian byte length><UTF-8 bytes>
+#                    (write_length_prefixed); documents are stored verbatim.
+#
+# The offset index is cached next to the corpus as <path>.idx:
+#   header  "PBCI", format code, source size, source mtime_ns, n_docs  (<4sIQQQ)
+#   body    uint64[2 * n_docs]  (start, end) byte offsets of each document
+
+LINES = "lines"
+ESCAPED_LINES = "escaped-lines"
+LENGTH_PREFIXED = "length-prefixed"
+FORMAT_CODES = {LINES: 1, LENGTH_PREFIXED: 2, ESCAPED_LINES: 3}
+
+INDEX_MAGIC = b"PBCI"
+INDEX_HEADER = struct.Struct("<4sIQQQ")
+LENGTH = struct.Struct("<I")
+
+
+def _escape(text):
+    return text.replace("\\", "\\\\").replace("\r", "\\r").replace("\n", "\\n")
+
+
+def _unescape(text):
+    if "\\" not in text:
+        return text
+    out = []
+    i = 0
+    while i < len(text):
+        c = text[i]
+        if c == "\\" and i + 1 < len(text):
+            nxt = text[i + 1]
+            out.append({"n": "\n", "r": "\r", "\\": "\\"}.get(nxt, "\\" + nxt))
+            i += 2
+        else:
+            out.append(c)
+            i += 1
+    return "".join(out)
+
+
+def write_lines(path, docs):
+    """
+    Writes an "escaped-lines" corpus; read it back with fmt=ESCAPED_LINES.
+    """
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        for doc in docs:
+            f.write(_escape(doc) + "\n")
+
+
+def write_length_prefixed(path, docs):
+    with open(path, "wb") as f:
+        for doc in docs:
+            data = doc.encode("utf-8")
+            f.write(LENGTH.pack(len(data)))
+            f.write(data)
+
+
+# =========================
+# READER
+# =========================
+
+class CorpusReader:
+    """
+    Memory-mapped document corpus with random access by document id.
+
+    Only the offset index (16 bytes per document) lives in Python memory;
+    reading a document slices the mmap, so the OS pages in just that part of
+    the file. Iteration is lazy, so a reader can be handed straight to
+    pipeline.iter_analyze_batched.
+    """
+
+    def __init__(self, path, fmt=LINES, encoding="utf-8", index_path=None):
+        if fmt not in FORMAT_CODES:
+            raise ValueError(f"unknown corpus format {fmt!r}, expected one of {sorted(FORMAT_CODES)}")
+        self.path = path
+        self.fmt = fmt
+        self.encoding = encoding
+        self.index_path = index_path or path + ".idx"
+
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        # mmap cannot map an empty file
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._offsets = self._load_or_build_index()
+
+    # ---------- index ----------
+
+    def _stat_key(self):
+        st = os.fstat(self._file.fileno())
+        return st.st_size, st.st_mtime_ns
+
+    def _load_or_build_index(self):
+        size, mtime_ns = self._stat_key()
+        try:
+            with open(self.index_path, "rb") as f:
+                header = f.read(INDEX_HEADER.size)
+                magic, code, idx_size, idx_mtime, n_docs = INDEX_HEADER.unpack(header)
+                if (magic, code, idx_size, idx_mtime) == (INDEX_MAGIC, FORMAT_CODES[self.fmt], size, mtime_ns):
+                    offsets = array("Q")
+                    offsets.frombytes(f.read(16 * n_docs))
+                    if sys.byteorder != "little":
+                        offsets.byteswap()
+                    if len(offsets) == 2 * n_docs:
+                        return offsets
+        except (OSError, struct.error):
+            pass
+
+        offsets = self._build_index()
+        try:
+            with open(self.index_path, "wb") as f:
+                f.write(INDEX_HEADER.pack(INDEX_MAGIC, FORMAT_CODES[self.fmt], size, mtime_ns, len(offsets) // 2))
+                body = array("Q", offsets)
+                if sys.byteorder != "little":
+                    body.byteswap()
+                f.write(body.tobytes())
+        except OSError:
+            pass  # read-only location: keep the index in memory only
+        return offsets
+
+    def _build_index(self):
+        mm = self._mm
+        offsets = array("Q")
+        pos = 0
+        end = len(mm)
+
+        if self.fmt in (LINES, ESCAPED_LINES):
+            while pos < end:
+                nl = mm.find(b"\n", pos)
+                if nl == -1:
+                    nl = end
+                line_end = nl - 1 if nl > pos and mm[nl - 1:nl] == b"\r" else nl
+                offsets.append(pos)
+                offsets.append(line_end)
+                pos = nl + 1
+        else:
+            while pos < end:
+                if pos + LENGTH.size > end:
+                    raise ValueError(f"{self.path}: truncated length prefix at byte {pos}")
+                (length,) = LENGTH.unpack_from(mm, pos)
+                start = pos + LENGTH.size
+                if start + length > end:
+                    raise ValueError(f"{self.path}: truncated document at byte {start}")
+                offsets.append(start)
+                offsets.append(start + length)
+                pos = start + length
+
+        return offsets
+
+    # ---------- access ----------
+
+    def __len__(self):
+        return len(self._offsets) // 2
+
+    def __getitem__(self, doc_id):
+        if doc_id < 0:
+            doc_id += len(self)
+        if not 0 <= doc_id < len(self):
+            raise IndexError(f"document {doc_id} out of range")
+        start, end = self._offsets[2 * doc_id], self._offsets[2 * doc_id + 1]
+        text = self._mm[start:end].decode(self.encoding)
+        return _unescape(text) if self.fmt == ESCAPED_LINES else text
+
+    def size(self, doc_id):
+        """
+        Stored byte length of a document, from the index alone (no read).
+        """
+        return self._offsets[2 * doc_id + 1] - self._offsets[2 * doc_id]
+
+    def __iter__(self):
+        for doc_id in range(len(self)):
+            yield self[doc_id]
+
+    def iter_range(self, start=0, stop=None):
+        for doc_id in range(start, len(self) if stop is None else min(stop, len(self))):
+            yield self[doc_id]
+
+    def shard(self, index, count):
+        """
+        Document ids of shard `index` out of `count` (round robin), for
+        splitting one corpus across workers that each open their own reader.
+        """
+        return range(index, len(self), count)
+
+    # ---------- lifetime ----------
+
+    def close(self):
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
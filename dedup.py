@@ -0,0 +1,206 @@
+# dedup.py
+import random
+import re
+import zlib
+from collections import OrderedDict
+
+import instrumentation
+from incremental import IncrementalAnalyzer, DEFAULT_CONTEXT_SENTENCES
+
+# =========================
+# CONFIG
+# =========================
+#
+# Templated resumes and policies differ in names, dates and a few phrases.
+# Documents are fingerprinted with MinHash over word shingles and indexed
+# with LSH (banded signatures); a new document whose best match is similar
+# enough starts from that match's analysis and only its changed sentences
+# are re-analyzed (incremental.IncrementalAnalyzer).
+
+SHINGLE_WORDS = 3
+NUM_PERM = 64
+BANDS = 16  # 16 bands x 4 rows: ~12% candidate rate at Jaccard 0.3, >99% at 0.8
+
+# Minimum estimated Jaccard similarity for reusing a match
+DEFAULT_THRESHOLD = 0.6
+
+DEFAULT_MAX_DOCUMENTS = 10000
+
+_MERSENNE = (1 << 61) - 1
+_WORD = re.compile(r"\w+")
+
+# Outcomes, as counted in NearDuplicateAnalyzer.stats and instrumentation
+EXACT = "exact"
+NEAR = "near"
+NEW = "new"
+
+
+# =========================
+# MINHASH
+# =========================
+
+def shingles(text, k=SHINGLE_WORDS):
+    """
+    Hashed k-word shingles of the lower-cased text (the words of texts
+    shorter than k).
+    """
+    words = _WORD.findall(text.lower())
+    if len(words) < k:
+        return {zlib.crc32(w.encode("utf-8")) for w in words}
+    return {
+        zlib.crc32(" ".join(words[i:i + k]).encode("utf-8"))
+        for i in range(len(words) - k + 1)
+    }
+
+
+class MinHasher:
+    """
+    num_perm universal hashes (a*x + b mod 2^61-1); the signature holds the
+    minimum of each over a document's shingles.
+    """
+
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.params = [(rng.randrange(1, _MERSENNE), rng.randrange(_MERSENNE)) for _ in range(num_perm)]
+
+    def signature(self, text):
+        hashes = shingles(text)
+        if not hashes:
+            return (_MERSENNE,) * self.num_perm
+        return tuple(min((a * h + b) % _MERSENNE for h in hashes) for a, b in self.params)
+
+
+def similarity(sig_a, sig_b):
+    """
+    Estimated Jaccard similarity of two signatures.
+    """
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / len(sig_a)
+
+
+class LSHIndex:
+    """
+    Banded LSH over MinHash signatures: documents sharing all rows of any
+    band become candidates of each other.
+    """
+
+    def __init__(self, num_perm=NUM_PERM, bands=BANDS):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.rows = num_perm // bands
+        self.bands = bands
+        self.buckets = [{} for _ in range(bands)]  # band -> rows -> {key}
+
+    def _keys(self, signature):
+        r = self.rows
+        return [signature[i * r:(i + 1) * r] for i in range(self.bands)]
+
+    def add(self, key, signature):
+        for bucket, rows in zip(self.buckets, self._keys(signature)):
+            bucket.setdefault(rows, set()).add(key)
+
+    def remove(self, key, signature):
+        for bucket, rows in zip(self.buckets, self._keys(signature)):
+            keys = bucket.get(rows)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del bucket[rows]
+
+    def query(self, signature):
+        found = set()
+        for bucket, rows in zip(self.buckets, self._keys(signature)):
+            found.update(bucket.get(rows, ()))
+        return found
+
+
+# =========================
+# REUSE
+# =========================
+
+class NearDuplicateAnalyzer:
+    """
+    Analyzes documents like detect_pronoun_bias over FCoref clusters, reusing
+    earlier results for exact and near duplicates.
+
+    An exact repeat returns its stored biases. A near duplicate (estimated
+    Jaccard >= threshold against the best LSH candidate) is diffed sentence
+    by sentence against that candidate: unchanged sentences keep their
+    biases, changed ones are re-analyzed with `context_sentences` around
+    them, with the same limits as IncrementalAnalyzer. Anything else gets a
+    full run. Each analyzed document is indexed for later ones; the oldest
+    are dropped beyond `max_documents`.
+
+    stats counts documents per outcome (EXACT / NEAR / NEW).
+    """
+
+    def __init__(self, resolver, threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM, bands=BANDS,
+                 context_sentences=DEFAULT_CONTEXT_SENTENCES, max_documents=DEFAULT_MAX_DOCUMENTS):
+        self.threshold = threshold
+        self.max_documents = max_documents
+        self.hasher = MinHasher(num_perm)
+        self.index = LSHIndex(num_perm, bands)
+        self.analyzer = IncrementalAnalyzer(resolver, context_sentences)
+        self.entries = OrderedDict()  # text -> (signature, IncrementalAnalyzer.state())
+        self.stats = {EXACT: 0, NEAR: 0, NEW: 0}
+
+    def _record(self, outcome):
+        self.stats[outcome] += 1
+        instrumentation.count("dedup_documents", path=outcome)
+
+    def best_match(self, signature):
+        """
+        returns: (text, similarity) of the most similar indexed document at
+        or above the threshold, or (None, 0.0)
+        """
+        best, best_sim = None, 0.0
+        for key in self.index.query(signature):
+            sim = similarity(signature, self.entries[key][0])
+            if sim >= self.threshold and sim > best_sim:
+                best, best_sim = key, sim
+        return best, best_sim
+
+    def analyze(self, text):
+        """
+        returns: List[BiasSpan], as detect_pronoun_bias would return
+        """
+        entry = self.entries.get(text)
+        if entry is not None:
+            self.entries.move_to_end(text)
+            self._record(EXACT)
+            self.analyzer.restore(entry[1])
+            return self.analyzer.biases
+
+        with instrumentation.stage("dedup_lookup"):
+            signature = self.hasher.signature(text)
+            match, _ = self.best_match(signature)
+
+        if match is None:
+            self._record(NEW)
+            self.analyzer.reset()
+        else:
+            self._record(NEAR)
+            self.analyzer.restore(self.entries[match][1])
+        biases = self.analyzer.analyze(text)
+
+        self.entries[text] = (signature, self.analyzer.state())
+        self.index.add(text, signature)
+        while len(self.entries) > self.max_documents:
+            old, (old_signature, _) = self.entries.popitem(last=False)
+            self.index.remove(old, old_signature)
+        return biases
+
+    def analyze_many(self, texts):
+        """
+        returns: structured results, as pipeline.analyze_batched
+        """
+        from pipeline import structured_result
+
+        return [structured_result(text, self.analyze(text)) for text in texts]
+
+    def reuse_rate(self):
+        """
+        Fraction of documents that started from an earlier analysis.
+        """
+        total = sum(self.stats.values())
+        return (total - self.stats[NEW]) / total if total else 0.0
@@ -0,0 +1,231 @@
+# evaluation.py
+import argparse
+import json
+import os
+import re
+import sys
+
+from cluster_cache import text_digest
+
+# =========================
+# CONFIG
+# =========================
+
+LABELS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "expected_labels.json")
+
+# Label sources:
+#   "manual"   -> hand labels (from the "Expected: BIAS/SAFE" notes and the
+#                 "Target: DETECTED/IGNORED/MARKED" sections in the corpora)
+#   "snapshot" -> detector output recorded with --record, used as a regression baseline
+MANUAL = "manual"
+SNAPSHOT = "snapshot"
+
+
+# =========================
+# LABELS
+# =========================
+
+def digest_hex(text):
+    return text_digest(text).hex()
+
+
+def load_labels(path=LABELS_FILE):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_labels(labels, path=LABELS_FILE):
+    payload = json.dumps(labels, indent=2, ensure_ascii=False)
+    # keep each [start, end] pair on one line
+    payload = re.sub(r"\[\s+(\d+),\s+(\d+)\s+\]", r"[\1, \2]", payload)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(payload + "\n")
+
+
+def record_snapshot(labels, corpora, predictions):
+    """
+    Stores the current detector output as the expected spans for every
+    document that has no manual label.
+    """
+    for name, texts in corpora.items():
+        entries = labels["corpora"].setdefault(name, [])
+        manual = {e["index"] for e in entries if e["source"] == MANUAL}
+        kept = [e for e in entries if e["source"] == MANUAL]
+
+        for i, text in enumerate(texts):
+            predicted = predictions.get(digest_hex(text))
+            if i in manual or predicted is None:
+                continue
+            spans = sorted(predicted)
+            kept.append({
+                "index": i,
+                "digest": digest_hex(text),
+                "label": "BIAS" if spans else "SAFE",
+                "spans": [list(s) for s in spans],
+                "source": SNAPSHOT,
+            })
+
+        kept.sort(key=lambda e: e["index"])
+        labels["corpora"][name] = kept
+    return labels
+
+
+# =========================
+# PREDICTIONS
+# =========================
+
+def predictions_from_results(structured_results):
+    """
+    structured_results: output of analyze_sentences_return_structured_spans
+    returns: {text digest: {(start, end), ...}}
+    """
+    return {
+        digest_hex(item["text"]): {(s.start, s.end) for s in item["spans"]}
+        for item in structured_results
+    }
+
+
+def predict_corpora(corpora, resolver):
+    from pipeline import analyze_sentences_return_structured_spans
+
+    texts = [text for name in corpora for text in corpora[name]]
+    return predictions_from_results(analyze_sentences_return_structured_spans(texts, resolver))
+
+
+def predict_from_cache(cache_dir):
+    from cluster_cache import load_cache
+    from bias_detector import detect_pronoun_bias
+
+    docs, clusters_per_doc = load_cache(cache_dir)
+    return {
+        digest_hex(doc.text): {(b.start, b.end) for b in detect_pronoun_bias(doc.text, clusters, doc=doc)}
+        for doc, clusters in zip(docs, clusters_per_doc)
+    }
+
+
+# =========================
+# SCORING
+# =========================
+
+def _ratio(num, den):
+    return num / den if den else 1.0
+
+
+def score(labels, predictions):
+    """
+    Span-level and document-level precision/recall per label source.
+    Documents missing from `predictions` (or whose text changed) are skipped;
+    predicted documents without any label are counted as "unlabeled".
+    """
+    counts = {}
+    mismatches = []
+    labeled = set()
+
+    for name, entries in labels["corpora"].items():
+        for entry in entries:
+            labeled.add(entry["digest"])
+            predicted = predictions.get(entry["digest"])
+            if predicted is None:
+                continue
+
+            expected = {tuple(s) for s in entry["spans"]}
+            c = counts.setdefault(entry["source"], {
+                "docs": 0, "tp": 0, "fp": 0, "fn": 0,
+                "doc_tp": 0, "doc_fp": 0, "doc_fn": 0,
+            })
+            c["docs"] += 1
+            c["tp"] += len(expected & predicted)
+            c["fp"] += len(predicted - expected)
+            c["fn"] += len(expected - predicted)
+
+            expected_bias = entry["label"] == "BIAS"
+            predicted_bias = bool(predicted)
+            c["doc_tp"] += expected_bias and predicted_bias
+            c["doc_fp"] += predicted_bias and not expected_bias
+            c["doc_fn"] += expected_bias and not predicted_bias
+
+            if expected != predicted:
+                mismatches.append({
+                    "corpus": name,
+                    "index": entry["index"],
+                    "source": entry["source"],
+                    "missing": sorted(expected - predicted),
+                    "unexpected": sorted(predicted - expected),
+                })
+
+    unlabeled = sum(1 for digest in predictions if digest not in labeled)
+    report = {"sources": {}, "mismatches": mismatches, "unlabeled": unlabeled}
+    for source, c in counts.items():
+        report["sources"][source] = {
+            "docs": c["docs"],
+            "span_precision": _ratio(c["tp"], c["tp"] + c["fp"]),
+            "span_recall": _ratio(c["tp"], c["tp"] + c["fn"]),
+            "doc_precision": _ratio(c["doc_tp"], c["doc_tp"] + c["doc_fp"]),
+            "doc_recall": _ratio(c["doc_tp"], c["doc_tp"] + c["doc_fn"]),
+        }
+    return report
+
+
+def regressions(report):
+    """
+    Any change against the recorded snapshot means the output changed.
+    Documents without a snapshot cannot be checked; format_report warns
+    about them until one is recorded, but they are not regressions.
+    """
+    return [m for m in report["mismatches"] if m["source"] == SNAPSHOT]
+
+
+def format_report(report):
+    lines = [f"{'SOURCE':<10}{'DOCS':>7}{'SPAN P':>9}{'SPAN R':>9}{'DOC P':>9}{'DOC R':>9}"]
+    for source, r in sorted(report["sources"].items()):
+        lines.append(
+            f"{source:<10}{r['docs']:>7}{r['span_precision']:>9.3f}{r['span_recall']:>9.3f}"
+            f"{r['doc_precision']:>9.3f}{r['doc_recall']:>9.3f}"
+        )
+    for m in report["mismatches"]:
+        lines.append(
+            f"  [{m['source']}] {m['corpus']}[{m['index']}] "
+            f"missing={m['missing']} unexpected={m['unexpected']}"
+        )
+    if report.get("unlabeled"):
+        lines.append(
+            f"WARNING: {report['unlabeled']} documents have no snapshot to compare against; "
+            f"record one with `python evaluation.py --record`"
+        )
+    return "\n".join(lines)
+
+
+# =========================
+# CLI
+# =========================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check detector output against expected labels.")
+    parser.add_argument("--corpus", action="append", help="bundled corpus name (default: all)")
+    parser.add_argument("--cache", help="score a cluster cache (rule-only) instead of running coref")
+    parser.add_argument("--labels", default=LABELS_FILE)
+    parser.add_argument("--record", action="store_true", help="record current output as the snapshot baseline")
+    args = parser.parse_args(argv)
+
+    from corpora import CORPORA
+    corpora = {name: CORPORA[name] for name in (args.corpus or CORPORA)}
+
+    if args.cache:
+        predictions = predict_from_cache(args.cache)
+    else:
+        from coref_solver import CorefResolver
+        predictions = predict_corpora(corpora, CorefResolver(device="cpu"))
+
+    labels = load_labels(args.labels)
+    if args.record:
+        save_labels(record_snapshot(labels, corpora, predictions), args.labels)
+        print(f"Snapshot recorded: {args.labels}")
+        return 0
+
+    report = score(labels, predictions)
+    print(format_report(report))
+    return 1 if regressions(report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
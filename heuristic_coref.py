@@ -0,0 +1,169 @@
+# heuristic_coref.py
+import instrumentation
+from batching import DEFAULT_MAX_TOKENS
+from knowledge_base import PRONOUN_MAP, GENDERED_PRONOUN
+
+# =========================
+# HEURISTIC
+# =========================
+#
+# Single-clause inputs such as "A tailor measures his customer." have one
+# possible antecedent, visible straight from the parse. Those are resolved
+# here; anything with more than one sentence, more than one candidate or
+# mixed pronoun genders is left to FCoref.
+#
+# Only pronouns that binding makes (near) certain to refer to the subject
+# are linked: possessives, reflexives, and subjects of a subordinate clause
+# ("A nurse said she was tired"). An object pronoun in the subject's own
+# clause ("A manager thanks her.") refers to someone else, so any other
+# pronoun sends the sentence to FCoref.
+
+SUBJECT_DEPS = {"nsubj", "nsubjpass"}
+SINGULAR_TAGS = {"NN", "NNP"}
+REFLEXIVES = {"himself", "herself"}
+SUBORDINATE_DEPS = {"advcl", "ccomp"}
+
+# Outcomes, as counted in CascadeResolver.stats and instrumentation
+NO_PRONOUN = "no_pronoun"
+HEURISTIC = "heuristic"
+FALLBACK = "fcoref"
+
+
+def _bound_to_subject(token):
+    if token.lower_ in REFLEXIVES or token.dep_ == "poss":
+        return True
+    return token.dep_ in SUBJECT_DEPS and token.head.dep_ in SUBORDINATE_DEPS
+
+
+def heuristic_clusters(doc):
+    """
+    returns: clusters in FCoref's format ([[(start_char, end_char), ...]])
+             when the antecedent is unambiguous, None otherwise
+    """
+    pronouns = [t for t in doc if t.lower_ in PRONOUN_MAP]
+    if not pronouns:
+        return []
+
+    if len({PRONOUN_MAP[t.lower_] for t in pronouns}) > 1:
+        return None
+    if not all(_bound_to_subject(t) for t in pronouns):
+        return None
+    if sum(1 for _ in doc.sents) != 1:
+        return None
+
+    # Singular noun phrases before the first pronoun; cataphora is left to FCoref
+    first = pronouns[0].i
+    candidates = [
+        chunk for chunk in doc.noun_chunks
+        if chunk.root.i < first
+        and chunk.root.pos_ in ("NOUN", "PROPN")
+        and chunk.root.tag_ in SINGULAR_TAGS
+    ]
+    if len(candidates) != 1 or candidates[0].root.dep_ not in SUBJECT_DEPS:
+        return None
+
+    antecedent = candidates[0]
+    mentions = [(antecedent.start_char, antecedent.end_char)]
+    mentions.extend((t.idx, t.idx + len(t.text)) for t in pronouns)
+    return [mentions]
+
+
+# =========================
+# CASCADE
+# =========================
+
+class CascadeResolver:
+    """
+    Drop-in for CorefResolver: documents without a gendered pronoun get no
+    clusters (the detector could not flag them anyway), unambiguous single
+    sentences are resolved by heuristic_clusters(), and only the rest reach
+    the wrapped FCoref resolver.
+
+    stats counts documents per outcome (NO_PRONOUN / HEURISTIC / FALLBACK).
+    """
+
+    def __init__(self, resolver, nlp=None):
+        self.resolver = resolver
+        self._nlp = nlp
+        self._private_nlp = False  # load an own pipeline instead of bias_detector.nlp
+        self.stats = {NO_PRONOUN: 0, HEURISTIC: 0, FALLBACK: 0}
+
+    @property
+    def model(self):
+        return self.resolver.model
+
+    @property
+    def nlp(self):
+        if self._nlp is None:
+            if self._private_nlp:
+                from snapshot import load_spacy
+                self._nlp = load_spacy()
+            else:
+                from bias_detector import nlp
+                self._nlp = nlp
+        return self._nlp
+
+    def thread_view(self):
+        """
+        A cascade for use from another thread (see
+        CorefResolver.thread_view): it wraps the resolver's thread view and
+        parses with its own spaCy pipeline, loaded on first use, so callers
+        that always pass docs never load one. stats are per view; the
+        instrumentation counters add up across threads.
+        """
+        view = CascadeResolver(self.resolver.thread_view())
+        view._private_nlp = True
+        return view
+
+    def _record(self, outcome, n=1):
+        self.stats[outcome] += n
+        instrumentation.count("cascade_documents", n, path=outcome)
+
+    def resolve(self, text: str, doc=None):
+        return self.resolve_batch([text], docs=None if doc is None else [doc])[0]
+
+    def resolve_batch(self, texts, max_tokens=DEFAULT_MAX_TOKENS, docs=None):
+        """
+        docs: optional spaCy docs of `texts` (e.g. from nlp.pipe) so the
+              heuristic does not parse again
+        """
+        texts = list(texts)
+        results = [None] * len(texts)
+
+        todo = []
+        for i, text in enumerate(texts):
+            if GENDERED_PRONOUN.search(text):
+                todo.append(i)
+            else:
+                results[i] = []
+        self._record(NO_PRONOUN, len(texts) - len(todo))
+
+        if docs is None:
+            with instrumentation.stage("cascade_parse"):
+                parsed = list(self.nlp.pipe(texts[i] for i in todo))
+        else:
+            parsed = [docs[i] for i in todo]
+
+        fallback = []
+        with instrumentation.stage("cascade_heuristic"):
+            for i, doc in zip(todo, parsed):
+                clusters = heuristic_clusters(doc)
+                if clusters is None:
+                    fallback.append(i)
+                else:
+                    results[i] = clusters
+        self._record(HEURISTIC, len(todo) - len(fallback))
+
+        if fallback:
+            self._record(FALLBACK, len(fallback))
+            resolved = self.resolver.resolve_batch([texts[i] for i in fallback], max_tokens=max_tokens)
+            for i, clusters in zip(fallback, resolved):
+                results[i] = clusters
+        return results
+
+    def coverage(self):
+        """
+        returns: share of documents that never reached FCoref
+        """
+        total = sum(self.stats.values())
+        return (total - self.stats[FALLBACK]) / total if total else 0.0
@@ -0,0 +1,145 @@
+# incremental.py
+import bisect
+import difflib
+
+import instrumentation
+from bias_detector import detect_pronoun_bias
+from memory_guard import sentence_offsets
+
+# =========================
+# CONFIG
+# =========================
+
+# Unchanged sentences re-analyzed on each side of an edit, so a pronoun can
+# still be linked to an antecedent just outside the edited sentence.
+DEFAULT_CONTEXT_SENTENCES = 2
+
+# Above this fraction of dirty sentences a full re-run is cheaper.
+FULL_RERUN_RATIO = 0.5
+
+
+class IncrementalAnalyzer:
+    """
+    Re-analyzes only what changed between successive versions of a document.
+
+    The text is split into sentences and diffed against the previous
+    version. Sentences that changed, plus `context_sentences` on each side,
+    go through coref and detect_pronoun_bias as one window; every other
+    sentence keeps its previous biases with offsets shifted to the new text.
+
+    Coreference is limited to the window for edited regions, so a chain that
+    reaches further back than the context is only picked up again by a full
+    run (first call, large edits, or reset()).
+    """
+
+    def __init__(self, resolver, context_sentences=DEFAULT_CONTEXT_SENTENCES):
+        self.resolver = resolver
+        self.context_sentences = context_sentences
+        self.reset()
+
+    def reset(self):
+        self.text = None
+        self.sentences = []         # [(start, end)] in self.text
+        self.sentence_biases = []   # biases per sentence, document offsets
+
+    def state(self):
+        """
+        The analysis of the last text, to hand to restore() later.
+        """
+        return self.text, self.sentences, self.sentence_biases
+
+    def restore(self, state):
+        """
+        Continues from a state() of this or another analyzer, e.g. of a
+        near-identical document (see dedup.py): the next analyze() then
+        diffs against that text.
+        """
+        self.text, self.sentences, self.sentence_biases = state
+
+    @property
+    def biases(self):
+        return [b for biases in self.sentence_biases for b in biases]
+
+    def analyze(self, text):
+        """
+        returns: List[BiasSpan], as detect_pronoun_bias would return
+        """
+        if self.text is None:
+            return self._full(text)
+        if text == self.text:
+            return self.biases
+
+        sentences = sentence_offsets(text)
+        old_keys = [self.text[s:e] for s, e in self.sentences]
+        new_keys = [text[s:e] for s, e in sentences]
+        matcher = difflib.SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+
+        sentence_biases = [None] * len(sentences)
+        dirty = set()
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                for k in range(i2 - i1):
+                    delta = sentences[j1 + k][0] - self.sentences[i1 + k][0]
+                    sentence_biases[j1 + k] = _shift(self.sentence_biases[i1 + k], delta)
+            elif j1 == j2:
+                # Pure deletion: the sentences around the gap lost context
+                dirty.update(j for j in (j1 - 1, j1) if 0 <= j < len(sentences))
+            else:
+                dirty.update(range(j1, j2))
+
+        if len(dirty) > FULL_RERUN_RATIO * len(sentences):
+            return self._full(text)
+
+        for a, b in _windows(sorted(dirty), self.context_sentences, len(sentences)):
+            start, end = sentences[a][0], sentences[b - 1][1]
+            biases = self._run(text[start:end], start)
+            for i in range(a, b):
+                sentence_biases[i] = []
+            for bias in biases:
+                sentence_biases[_sentence_index(sentences, bias.start, a)].append(bias)
+            instrumentation.count("incremental_sentences_reanalyzed", b - a)
+
+        self.text = text
+        self.sentences = sentences
+        self.sentence_biases = sentence_biases
+        return self.biases
+
+    def _full(self, text):
+        sentences = sentence_offsets(text)
+        sentence_biases = [[] for _ in sentences]
+        for bias in self._run(text, 0):
+            sentence_biases[_sentence_index(sentences, bias.start, 0)].append(bias)
+        instrumentation.count("incremental_full_runs")
+
+        self.text = text
+        self.sentences = sentences
+        self.sentence_biases = sentence_biases
+        return self.biases
+
+    def _run(self, window, offset):
+        clusters = self.resolver.resolve(window)
+        return _shift(detect_pronoun_bias(window, clusters), offset)
+
+
+def _shift(biases, delta):
+    if not delta:
+        return list(biases)
+    return [b.shifted(delta) for b in biases]
+
+
+def _sentence_index(sentences, char, lo=0):
+    return max(lo, bisect.bisect_right(sentences, (char, float("inf")), lo) - 1)
+
+
+def _windows(dirty, context, n):
+    """
+    dirty: sorted sentence indices -> merged [a, b) ranges with context
+    """
+    ranges = []
+    for i in dirty:
+        a, b = max(0, i - context), min(n, i + context + 1)
+        if ranges and a <= ranges[-1][1]:
+            ranges[-1][1] = max(ranges[-1][1], b)
+        else:
+            ranges.append([a, b])
+    return [tuple(r) for r in ranges]
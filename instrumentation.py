@@ -0,0 +1,202 @@
+# instrumentation.py
+import os
+import time
+import threading
+
+# =========================
+# CONFIG
+# =========================
+
+# Set PRONOUNBIAS_INSTRUMENT=1 (or call enable()) to start recording.
+ENABLED = os.environ.get("PRONOUNBIAS_INSTRUMENT", "").lower() in ("1", "true", "yes", "on")
+
+METRIC_PREFIX = "pronounbias"
+
+_lock = threading.Lock()
+_stages = {}    # stage name -> [calls, wall seconds, cpu seconds]
+_counters = {}  # (counter name, ((label, value), ...)) -> int
+_gauges = {}    # (gauge name, ((label, value), ...)) -> latest value
+
+
+def enable(flag=True):
+    global ENABLED
+    ENABLED = bool(flag)
+
+
+def reset():
+    with _lock:
+        _stages.clear()
+        _counters.clear()
+        _gauges.clear()
+
+
+# =========================
+# RECORDING
+# =========================
+
+class _Stage:
+    __slots__ = ("name", "wall0", "cpu0")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.wall0 = time.perf_counter()
+        # process_time() also covers torch's intra-op worker threads
+        self.cpu0 = time.process_time()
+        return self
+
+    def __exit__(self, *exc):
+        wall = time.perf_counter() - self.wall0
+        cpu = time.process_time() - self.cpu0
+        with _lock:
+            entry = _stages.setdefault(self.name, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += wall
+            entry[2] += cpu
+        return False
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name):
+    """
+    Context manager timing one pipeline stage (wall + CPU).
+    Returns a shared no-op object when instrumentation is disabled.
+    """
+    if not ENABLED:
+        return _NULL_STAGE
+    return _Stage(name)
+
+
+def count(name, n=1, **labels):
+    if not ENABLED:
+        return
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + n
+
+
+def set_gauge(name, value, **labels):
+    """
+    Records the current value of something that goes up and down (e.g. a
+    batch size chosen at runtime); only the latest value is kept.
+    """
+    if not ENABLED:
+        return
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _gauges[key] = value
+
+
+def snapshot():
+    """
+    Returns a copy of everything recorded so far:
+    {"stages": {name: {"calls", "wall", "cpu"}},
+     "counters": {(name, labels): int}, "gauges": {(name, labels): float}}
+    """
+    with _lock:
+        stages = {
+            name: {"calls": calls, "wall": wall, "cpu": cpu}
+            for name, (calls, wall, cpu) in _stages.items()
+        }
+        counters = dict(_counters)
+        gauges = dict(_gauges)
+    return {"stages": stages, "counters": counters, "gauges": gauges}
+
+
+# =========================
+# EXPORT
+# =========================
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels:
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def summary_table():
+    data = snapshot()
+    lines = []
+
+    total_wall = sum(s["wall"] for s in data["stages"].values()) or 1.0
+    lines.append(f"{'STAGE':<28}{'CALLS':>10}{'WALL (s)':>12}{'CPU (s)':>12}{'AVG (ms)':>12}{'WALL %':>9}")
+    for name, s in sorted(data["stages"].items(), key=lambda kv: -kv[1]["wall"]):
+        avg_ms = 1000.0 * s["wall"] / s["calls"] if s["calls"] else 0.0
+        lines.append(
+            f"{name:<28}{s['calls']:>10}{s['wall']:>12.4f}{s['cpu']:>12.4f}"
+            f"{avg_ms:>12.3f}{100.0 * s['wall'] / total_wall:>8.1f}%"
+        )
+
+    if data["counters"]:
+        lines.append("")
+        lines.append(f"{'COUNTER':<60}{'VALUE':>10}")
+        for (name, labels), value in sorted(data["counters"].items()):
+            label = name + _format_labels(labels)
+            lines.append(f"{label:<60}{value:>10}")
+
+    if data["gauges"]:
+        lines.append("")
+        lines.append(f"{'GAUGE':<60}{'VALUE':>10}")
+        for (name, labels), value in sorted(data["gauges"].items()):
+            label = name + _format_labels(labels)
+            lines.append(f"{label:<60}{value:>10.4g}")
+
+    return "\n".join(lines)
+
+
+def prometheus_text():
+    data = snapshot()
+    lines = []
+
+    stage_metrics = [
+        ("stage_calls_total", "calls", "Number of times each pipeline stage ran."),
+        ("stage_wall_seconds_total", "wall", "Wall-clock seconds spent in each pipeline stage."),
+        ("stage_cpu_seconds_total", "cpu", "Process CPU seconds spent in each pipeline stage."),
+    ]
+    for metric, field, help_text in stage_metrics:
+        full_name = f"{METRIC_PREFIX}_{metric}"
+        lines.append(f"# HELP {full_name} {help_text}")
+        lines.append(f"# TYPE {full_name} counter")
+        for name, s in sorted(data["stages"].items()):
+            lines.append(f'{full_name}{{stage="{name}"}} {s[field]}')
+
+    by_name = {}
+    for (name, labels), value in data["counters"].items():
+        by_name.setdefault(name, []).append((labels, value))
+    for name in sorted(by_name):
+        full_name = f"{METRIC_PREFIX}_{name}_total"
+        lines.append(f"# TYPE {full_name} counter")
+        for labels, value in sorted(by_name[name]):
+            lines.append(f"{full_name}{_format_labels(labels)} {value}")
+
+    by_name = {}
+    for (name, labels), value in data["gauges"].items():
+        by_name.setdefault(name, []).append((labels, value))
+    for name in sorted(by_name):
+        full_name = f"{METRIC_PREFIX}_{name}"
+        lines.append(f"# TYPE {full_name} gauge")
+        for labels, value in sorted(by_name[name]):
+            lines.append(f"{full_name}{_format_labels(labels)} {value}")
+
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(prometheus_text())
@@ -1,4 +1,5 @@
 # knowledge_base.py
+import re
 
 # =========================
 # GENDERED ROLES & PRONOUNS
@@ -21,11 +22,35 @@ GENDERED_ROLES = {
     "princess": "F", "wife": "F", "bride": "F", "granddaughter": "F"
 }
 
+# Multi-word roles, matched on token lemmas (see lexicon_matcher.py)
+GENDERED_ROLE_PHRASES = {
+    "best man": "M", "family man": "M", "leading man": "M", "head boy": "M",
+    "frontman": "M", "fraternity brother": "M", "old man": "M",
+    "cleaning lady": "F", "leading lady": "F", "head girl": "F",
+    "maid of honor": "F", "maid of honour": "F", "sorority sister": "F",
+    "first lady": "F", "lady in waiting": "F", "old lady": "F"
+}
+
+# Gender-neutral multi-word roles: recognised as role nouns even when the
+# tagger does not make their head a NOUN ("team lead", "department head").
+NEUTRAL_ROLE_PHRASES = {
+    "department head", "team lead", "team leader", "social worker",
+    "project manager", "product manager", "account manager", "line manager",
+    "shift supervisor", "store manager", "branch manager", "office manager",
+    "case worker", "care worker", "health worker", "flight attendant",
+    "sales representative", "customer service representative",
+    "teaching assistant", "graduate student", "head teacher", "chief executive",
+    "police officer", "firefighter", "chairperson", "spokesperson"
+}
+
 PRONOUN_MAP = {
     "he": "M", "him": "M", "his": "M", "himself": "M",
     "she": "F", "her": "F", "hers": "F", "herself": "F"
 }
 
+# Text-level pre-filter: no match means no cluster can be flagged
+GENDERED_PRONOUN = re.compile(r"\b(?:" + "|".join(PRONOUN_MAP) + r")\b", re.IGNORECASE)
+
 # Modifiers that explicitly gender a noun (e.g., "Male nurse")
 MALE_MODIFIERS = {"male", "man", "boy", "gentleman", "mr", "mr.", "masculine"}
 FEMALE_MODIFIERS = {"female", "woman", "lady", "girl", "mrs", "mrs.", "ms", "ms.", "feminine"}
@@ -0,0 +1,156 @@
+# lexicon_matcher.py
+from knowledge_base import (
+    GENDERED_ROLES, GENDERED_ROLE_PHRASES, NEUTRAL_ROLE_PHRASES,
+    MALE_MODIFIERS, FEMALE_MODIFIERS
+)
+
+_VALUE = object()  # trie key marking the end of a phrase
+
+
+class PhraseTrie:
+    """
+    Token-level trie. longest_matches() scans a token sequence once and
+    reports leftmost-longest, non-overlapping phrase matches; each start
+    walks at most `depth` (the longest phrase) nodes, so a scan is linear
+    in the number of tokens.
+    """
+
+    def __init__(self, phrases=None):
+        self.root = {}
+        self.depth = 0
+        for phrase, value in (phrases or {}).items():
+            self.add(phrase, value)
+
+    def add(self, phrase, value):
+        words = phrase.lower().split()
+        node = self.root
+        for word in words:
+            node = node.setdefault(word, {})
+        node[_VALUE] = value
+        self.depth = max(self.depth, len(words))
+
+    def longest_matches(self, keys):
+        """
+        keys: List[str] (one key per token)
+        yields: (start, end, value) with keys[start:end] matching a phrase
+        """
+        i = 0
+        n = len(keys)
+        while i < n:
+            node = self.root
+            match = None
+            j = i
+            while j < n and j - i < self.depth:
+                node = node.get(keys[j])
+                if node is None:
+                    break
+                j += 1
+                if _VALUE in node:
+                    match = (i, j, node[_VALUE])
+            if match:
+                yield match
+                i = match[1]
+            else:
+                i += 1
+
+
+_MISSING = object()
+
+
+class LexiconIndex:
+    """
+    Per-document result of LexiconMatcher.index():
+      roles      token index -> (gender or None, phrase start, phrase end)
+      modifiers  token index -> "M" / "F"
+      fallback   optional role_lexicon.RoleLexicon, consulted for tokens the
+                 in-memory phrase tables do not cover
+    """
+    __slots__ = ("roles", "modifiers", "fallback")
+
+    def __init__(self, fallback=None):
+        self.roles = {}
+        self.modifiers = {}
+        self.fallback = fallback
+
+    def _fallback_entry(self, token):
+        """
+        Looks up "<compounds> <lemma>" first (so "flight attendant" wins
+        over "attendant"), then the lemma, then the surface form.
+        """
+        lemma = token.lemma_.lower()
+        compounds = [c for c in token.lefts if c.dep_ == "compound"]
+        keys = []
+        if compounds:
+            doc = token.doc
+            keys.append(" ".join(t.lemma_.lower() for t in doc[compounds[0].i:token.i]) + " " + lemma)
+        keys.append(lemma)
+        if token.lower_ != lemma:
+            keys.append(token.lower_)
+        for key in keys:
+            gender = self.fallback.get(key, _MISSING)
+            if gender is not _MISSING:
+                return gender
+        return _MISSING
+
+    def role_gender(self, token):
+        entry = self.roles.get(token.i)
+        if entry:
+            return entry[0]
+        if self.fallback is not None:
+            gender = self._fallback_entry(token)
+            if gender is not _MISSING:
+                return gender
+        return None
+
+    def is_role(self, token):
+        if token.i in self.roles:
+            return True
+        return self.fallback is not None and self._fallback_entry(token) is not _MISSING
+
+    def modifier_gender(self, span):
+        for child in span.root.children:
+            gender = self.modifiers.get(child.i)
+            if gender:
+                return gender
+        return None
+
+
+class LexiconMatcher:
+    """
+    Finds every role and modifier phrase in a doc in one pass over its
+    tokens. Roles are matched on lemmas (as GENDERED_ROLES always was),
+    modifiers on the lower-cased surface form ("mr.", "mrs.").
+
+    `fallback` is a compact prebuilt lexicon (role_lexicon.RoleLexicon) for
+    role vocabularies too large to hold as a Python trie; it is only
+    queried per cluster head, never scanned.
+    """
+
+    def __init__(self, roles, modifiers, fallback=None):
+        self.role_trie = PhraseTrie(roles)
+        self.modifier_trie = PhraseTrie(modifiers)
+        self.fallback = fallback
+
+    @classmethod
+    def from_knowledge_base(cls, fallback=None):
+        roles = {phrase: None for phrase in NEUTRAL_ROLE_PHRASES}
+        roles.update(GENDERED_ROLES)
+        roles.update(GENDERED_ROLE_PHRASES)
+        modifiers = {m: "M" for m in MALE_MODIFIERS}
+        modifiers.update({m: "F" for m in FEMALE_MODIFIERS})
+        return cls(roles, modifiers, fallback=fallback)
+
+    def index(self, doc):
+        index = LexiconIndex(self.fallback)
+
+        lemmas = [t.lemma_.lower() for t in doc]
+        for start, end, gender in self.role_trie.longest_matches(lemmas):
+            for i in range(start, end):
+                index.roles[i] = (gender, start, end)
+
+        lowers = [t.lower_ for t in doc]
+        for start, end, gender in self.modifier_trie.longest_matches(lowers):
+            for i in range(start, end):
+                index.modifiers[i] = gender
+
+        return index
@@ -1,2677 +1,123 @@
 from coref_solver import CorefResolver
-from bias_detector import detect_pronoun_bias
+from pipeline import (
+    analyze_sentences_return_structured_spans, analyze_batched, analyze_pipelined, classify_batched
+)
+from corpora import test_stress_inputs
+from results import dumps_results
+import instrumentation
 
 # =========================
 # CONFIG
 # =========================
 GENERATE_HTML = True  
+INCLUDE_CONTEXT = False  # copy each hit's sentence into the structured output
+INSTRUMENT = False  # or set PRONOUNBIAS_INSTRUMENT=1
+METRICS_FILE = "metrics.prom"
+PROFILE_RULES = False  # profile detect_pronoun_bias per document
+PROFILE_FILE = "rules.collapsed"
+QUANTIZE = False  # dynamic int8 coref model (CPU only)
+NUM_THREADS = None  # torch intra-op threads, None = torch default
+BATCHED = False  # length-bucketed coref batches + nlp.pipe (ignores PROFILE_RULES)
+SEGMENTED = False  # with BATCHED: coref per section/paragraph, names linked across
+CLASSIFY = False  # yes/no per document only: early exit, no spans (skips the HTML report)
+PIPELINED = False  # batched run with coref, parsing and rules overlapped on threads
+CORPUS_FILE = None  # analyze a memory-mapped corpus file instead of the bundled inputs
+CORPUS_FORMAT = "lines"  # or "escaped-lines", "length-prefixed" (see corpus_reader.py)
+WORKERS = None  # e.g. 4: forked worker processes sharing the loaded models
+THREADS = None  # e.g. 4: worker threads in this process sharing one coref model
+MAX_DOC_TOKENS = None  # e.g. 2048: longer documents are resolved in windows
+MEMORY_CEILING_MB = None  # per-process RSS ceiling enforced before inference
+# Enable only after `python benchmark.py --variant baseline --variant cascade` has
+# been run with the model: AGREE must be 1.000 and DOCS/S above the baseline
+CASCADE = False  # resolve unambiguous single sentences from the parse, FCoref for the rest
+DEDUP = False  # reuse results of earlier (near-)duplicate documents, re-analyze changed sentences only
+TARGET_BATCH_SECONDS = None  # adaptive coref batch budget; 0 = maximize throughput
+
+if INSTRUMENT:
+    instrumentation.enable()
+
+profiler = None
+if PROFILE_RULES:
+    from profiler import RuleProfiler
+    profiler = RuleProfiler()
 
 if GENERATE_HTML:
     from visualizer import create_html_report
 
 
-print("Loading FastCoref model...")
-resolver = CorefResolver(device='cpu')
-
-print("\n--- RUNNING ANALYSIS ---")
-
-
-def analyze_sentences_return_structured_spans(sentences, resolver):
-    """
-    sentences: List[str]
-
-    returns: List[dict] like:
-    {
-        "text": str,
-        "spans": [
-            {"start": int, "end": int, "type": "PRONOUN"}
-        ],
-        "bias_type": "PRONOUN" | None
-    }
-    """
-    results = []
-
-    for text in sentences:
-        clusters = resolver.resolve(text)
-        biases = detect_pronoun_bias(text, clusters)
-
-        spans = [
-            {
-                "start": b["start"],
-                "end": b["end"],
-                "type": "PRONOUN"
-            }
-            for b in biases
-        ]
-
-        results.append({
-            "text": text,
-            "spans": spans,
-            "bias_type": "PRONOUN" if spans else None
-        })
-
-    return results
-
-
-# =========================
-# TEST INPUTS 
-# =========================
-
-test_docs = [
-    # Safe
-    "The doctor arrived late. He was tired from the shift.",
-    # Bias (Modal)
-    "A teacher must always prepare his lessons carefully.",
-    # Bias (Conditional)
-    "If a teacher is late to class, he is usually penalized.",
-    # Bias (Predicate Possessive)
-    "A true leader accepts responsibility. The final choice is his alone.",
-    # Safe (Specific)
-    "The leader looked at the map. The final choice was his.",
-
-    """
-    If a teacher is late to class, he is usually penalized.
-    """,
-
-    # CASE 2: The "Predicate Possessive" (Generic)
-    # Expected: BIAS.
-    # Why: "The choice is his" (Simple Present) implies a general rule for the role.
-    """
-    A true leader accepts responsibility. The final choice is his alone.
-    """,
-
-    # CASE 3: The "Predicate Possessive" (Specific/Episodic)
-    # Expected: SAFE.
-    # Why: "Was" is Past Tense. This is a specific past event, not a rule.
-    """
-    The leader looked at the map. The final choice was his.
-    """,
-
-    # CASE 4: The "Unanchored" False Positive Check
-    # Expected: SAFE.
-    # Why: "This" is a specific determiner (Anchor).
-    """
-    This doctor is very talented. He has saved many lives.
-    """,
-
-    """
-    Dr. Aravind entered the emergency room at 2 AM. He had been working for 
-    twelve hours straight. He checked the patient's vitals and ordered a scan immediately. 
-    It is widely accepted that a doctor must always be vigilant, even when he is exhausted. 
-    If he misses a single detail, he faces severe consequences. 
-    However, Dr. Aravind remained focused. He knew that this specific patient needed him.
-    """,
-
-    # TEST CASE 2: Resume / Professional Summary
-    """
-    Candidate: Jane Doe
-    Role: Senior Software Engineer
-    
-    Professional Summary:
-    Jane is a dedicated professional who has led multiple backend teams. 
-    She improved system latency by 40% last quarter. She successfully migrated 
-    our legacy database to the cloud.
-    
-    Work Philosophy:
-    I believe that a great software engineer should always take ownership of her code. 
-    She must ensure that her documentation is clear for junior developers. 
-    If she deploys to production, she is ultimately responsible for the system's stability.
-    """,
-    """The teacher should always prepare her lessons carefully, because a good educator knows that students rely on consistent guidance. When a teacher enters the classroom, she sets the tone for the entire session, but the teacher who taught me mathematics last year was different, as he preferred informal discussions over structured lectures. The mentor advised the trainee that she must remain patient, even when the student struggles, and if he fails repeatedly, the mentor should offer additional support rather than criticism. The manager was reviewing the reports yesterday when she noticed an inconsistency, but the manager who oversees compliance ensures that his team follows established protocols. If he arrives late, inform the supervisor immediately. The doctor is examining a patient right now, and the nurse who assists him ensures the equipment is prepared properly. The engineer must consider safety first, because the engineer designs systems that affect public welfare, and he carries a responsibility that extends beyond technical correctness.""",
-    """Professional Summary
-The software engineer is responsible for designing scalable systems, and he must ensure that performance and reliability standards are met across deployments. A motivated developer should continuously refine her skills, as the industry evolves rapidly and demands adaptability.
-
-Experience
-The project manager coordinated cross-functional teams and ensured that milestones were achieved on time. She led daily stand-ups and resolved conflicts when they arose. The manager who supervised the migration to cloud infrastructure was instrumental in reducing operational costs, as he implemented automation strategies effectively.
-
-Leadership & Mentorship
-A mentor supports junior engineers by providing guidance, and she encourages best practices in code review and collaboration. The mentor who joined the organization in 2022 brought valuable experience from previous roles, and he helped streamline onboarding processes.
-
-Responsibilities
-The analyst should evaluate data critically and present insights clearly, as he influences strategic decisions. If she encounters ambiguous requirements, the analyst must consult stakeholders before proceeding.
-
-Additional Contributions
-The team lead was recognized last year for outstanding performance, and she received an internal award for excellence. The leader who manages distributed teams understands cultural differences and respects diverse perspectives, ensuring that his leadership remains effective.""",
-
-      """
-    Judge Harmon walked into the courtroom at 9:00 AM sharp. He adjusted his robes and looked 
-    at the defendant. He had read the case files the night before. 
-    It is a well-known fact that a good judge must always remain impartial. He should never let 
-    personal feelings cloud his judgment. If he allows emotion to interfere, he undermines the 
-    justice system. The final decision is his to make, and it must be objective.
-    Judge Harmon took a deep breath. He knew that this specific case would be difficult, but 
-    he was ready to hear the opening arguments.
-    """,
-
-    # TEST CASE 2: The "Resume Trap" (Specific History vs. Generic Philosophy)
-    # goal: Ignore the specific work history (past tense), catch the "Leadership Philosophy" (generic).
-    """
-    Candidate: Sarah Jenkins
-    Role: Senior Project Manager
-    
-    Professional Experience:
-    * Managed a team of 15 developers for the Alpha Project. She delivered the product two weeks early.
-    * Reduced operational costs by 20% in Q3. She implemented a new agile workflow that improved efficiency.
-    * She was awarded "Manager of the Year" in 2022 for her dedication.
-
-    Leadership Philosophy:
-    I believe that a true leader is defined by how he treats his team during a crisis. 
-    He must be a shield for his employees. If a manager is constantly blaming others, 
-    he loses the respect of the room. A strong leader knows that the ultimate responsibility is his alone. 
-    He should always lead by example rather than by force.
-    """,
-    # TEST CASE 1: The "Medical Drama" (Long Narrative vs. Abstract Rules)
-    """
-    Chapter 4: The Golden Hour
-    
-    Dr. Thorne scrubbed his hands until they were raw. He had been in the operating theater for 
-    fourteen hours straight, battling a complex aortic aneurysm. The patient was stabilizing, 
-    but Thorne knew the danger hadn't passed. He signaled to the nurse for more saline. 
-    He was exhausted, yet his hands remained steady. This was the specific discipline he had 
-    mastered over twenty years of practice.
-    
-    However, the medical board's guidelines were always in the back of his mind. 
-    According to the standard code of conduct, a surgeon must always prioritize his own 
-    mental clarity before entering the theater. If he feels compromised, he has a moral 
-    duty to recuse himself. A tired surgeon is a dangerous surgeon; he risks making 
-    catastrophic errors if he pushes beyond his limits. The choice is his to make, 
-    but the consequences are shared by everyone in the room.
-    
-    Thorne shook off the thought. He wasn't compromised. He was focused. He finished the 
-    suturing and stepped back from the table. The surgery was a success because he had 
-    prepared for this exact moment.
-    """,
-
-    # TEST CASE 2: The "Executive CV" (Specific History vs. Generic Philosophy)
-    """
-    RESUME: MICHAEL VENTURA
-    Target Role: Chief Operations Officer (COO)
-    
-    PROFESSIONAL SUMMARY
-    Michael is a results-oriented executive who has transformed supply chains for Fortune 500 companies. 
-    He successfully navigated the 2020 logistics crisis by diversifying vendor portfolios. 
-    He reduced overhead by 35% at LogisticsCorp and led a team of 200+ employees across three continents.
-    
-    EXPERIENCE
-    **Global Operations Director | TechFlow Inc. (2018–2023)**
-    * He streamlined the procurement process, saving the company $4M annually.
-    * He negotiated contracts with key suppliers in Southeast Asia.
-    * When a shipment was delayed in the Suez Canal, he quickly pivoted to air freight 
-      to ensure production lines remained active.
-    
-    **Senior Manager | SupplyChain Solutions (2014–2018)**
-    * He implemented a new ERP system that integrated inventory tracking.
-    * He was promoted twice within four years for his exemplary performance.
-    
-    LEADERSHIP METHODOLOGY & PUBLISHED WORKS
-    In my book "The Iron Chain," I argue that a modern COO must be a generalist. 
-    He needs to understand finance as well as he understands freight. 
-    If a leader ignores the human element of his supply chain, he will eventually face a strike. 
-    A great executive knows that the culture of the company is his responsibility. 
-    He should not hide behind spreadsheets; he must be visible on the factory floor. 
-    Whether he is negotiating a merger or fixing a conveyor belt, his attitude sets the tone for the entire organization.
-    """,
-            # ====================================================
-        # 1. GENERIC BIAS (Target: DETECTED / MARKED)
-        # ====================================================
-        "A user should always update his password regularly.",
-        "Every doctor must wash her hands before surgery.",
-        "When a student fails, he must retake the exam.",
-        "A developer usually pushes his code to the main branch.",
-        "Each employee is responsible for his own keycard.",
-        "If a customer complains, he should be treated with respect.",
-        "A politician must keep his promises to the public.",
-        "Every citizen must pay his taxes on time.",
-        "A teacher often spends her own money on classroom supplies.",
-        "When a child learns to read, he opens up a new world.",
-        "A pilot checks his instruments before takeoff.",
-        "Any user can reset his settings from the dashboard.", # Includes "Any"
-        "A good CEO puts his employees first.",
-        "A pedestrian must look both ways before he crosses.",
-        "If anyone has a question, he should raise a hand.",
-        "When a nurse arrives, she will check the vitals.",
-        "Each student must submit his assignment by Friday.",
-        "A firefighter risks his life for others.",
-        "A lawyer should always defend his client.",
-        "Every parent loves his child.",
-        "A nurse should take care of herself.",   # Reflexive (Generic)
-        "A cricketer takes care of himself.",    # Reflexive (Generic)
-        "If a user fails to log in, he should reset the password.",
-        "When a student applies, his guardian should take care.",
-
-        # ====================================================
-        # 2. EPISODIC / SPECIFIC (Target: IGNORED / EMPTY)
-        # ====================================================
-        "The nurse is checking the patient's vitals right now.",
-        "The developer was coding all night long.",
-        "A teacher has graded the exams already.",
-        "The doctor checked the chart and left the room.",
-        "The pilot is going to land the plane soon.",
-        "The secretary will file the report tomorrow.",
-        "The manager will review the documents later.",
-        "A student was studying in the library.",
-        "The user has logged in successfully.",
-        "The customer is complaining about the service.",
-        "The officer wrote a ticket and drove away.",
-        "The nurse will return to the station shortly.",
-        "A user was trying to access the file.",
-        "The author has written a new book.",
-        "The athlete is training for the olympics.",
-        "The final decision was made yesterday.",
-        "The project was completed on time.",
-        "Responsibility was clearly defined.",
-        "The meeting has ended.",
-        "A decision was made after the discussion.",
-        "The nurse said she would return.",
-        "The assistant confirmed that she had sent the email.",
-        "The customer is checking his receipt.",
-        "The author hurt himself.",             # Reflexive (Specific 'The')
-        "The boy washes himself.",              # Reflexive (Specific 'The')
-
-        # ====================================================
-        # 3. START OF SENTENCE (Target: IGNORED / EMPTY)
-        # ====================================================
-        "He is responsible for managing the project.",
-        "She naturally took charge of the discussion.",
-        "He led the initiative successfully.",
-        "She oversaw the operation last year.",
-        "He should review the document.",
-        "She can resolve complex issues.",
-        "He told her that she should decide.",
-        "She reminded him that he was responsible.",
-        "He challenged the decision.",
-        "She prepared for the presentation.",
-        "He walked into the room quietly.",
-        "She opened the window and left.",
-        "He said that she would decide.",
-        "She insisted that he take control.",
-        "He works hard every day.",
-        "He hurt himself.",                     # Start=0 rule
-
-        # ====================================================
-        # 4. PREDICATE POSSESSIVES (Target: IGNORED / EMPTY)
-        # ====================================================
-        "The final authority was his.",
-        "Final accountability lay with her.",
-        "The book was his.",
-        "The book is his.",
-        "The bag is hers.",
-        "The keys are theirs.",
-        "Control over the outcome was entirely hers.",
-        "Ownership of the decision was clearly his.",
-        "The responsibility for approval was solely hers.",
-        "The mistake was his.",
-        "The victory is hers.",
-
-        # ====================================================
-        # 5. NAMED ENTITIES (Target: IGNORED / EMPTY)
-        # ====================================================
-        "John said he would arrive later.",
-        "Mary thinks she is right.",
-        "Mr. Smith checked his watch.",
-        "Alice lost her keys.",
-        "Dr. Jones cares about his patients.",
-        "Elon Musk tweeted his opinion.",
-        "Sarah finished her homework.",
-        "Bob asked if he could leave.",
-        "The customer John said that he will come soon.",
-        "Shubh thought he would win.",
-        "John is really full of himself.",
-
-        # ====================================================
-        # 6. FIX: BARE CONDITIONAL (Target: IGNORED / EMPTY)
-        # ====================================================
-        "If he calls, take a message.",
-        "If she writes, tell her I am busy.",
-        "If he arrives, show him in.",
-        "If she asks, say nothing.",
-        "If he fails, we will try again.",
-        "If she leaves, lock the door.",
-        "If he helps, thank him.",
-
-        # ====================================================
-        # 7. LEFT DISLOCATION (Target: MARKED)
-        # ====================================================
-        "The nurse, she is kind.",
-        "The teacher, he is strict.",
-        "The pilot, he is skilled.",
-        "The mother, she knows best.",
-
-    """
-    BIOGRAPHY: THE LIFE AND LAWS OF JULIAN VANCE
-    
-    [SECTION 1: EARLY LIFE - SPECIFIC/SAFE]
-    Julian Vance was born in 1955 in a small town in Ohio. He showed an aptitude for 
-    structural engineering at a young age. By the time he was twelve, he had already 
-    sketched blueprints for a treehouse that rivaled actual homes. He attended 
-    Cornell University, where he studied under the famous modernist Professor Halloway. 
-    Julian was known for his late nights; he often stayed in the studio until dawn, 
-    perfecting his models. He believed that his work spoke for itself. When he graduated, 
-    he was immediately hired by a top firm in New York. He quickly rose through the ranks. 
-    In 1985, he designed the 'Vertex Tower,' which cemented his reputation. He managed 
-    a team of fifty architects and ensured that every beam was placed perfectly.
-    
-    [SECTION 2: THE MANIFESTO - GENERIC/BIASED]
-    In his controversial 1990 book, 'The Architect's Burden', Vance outlined a rigid 
-    philosophy for the industry. He argued that a great architect is not merely a builder, 
-    but a visionary. He must see the city not as it is, but as it could be. 
-    According to Vance, if an architect compromises his vision for the sake of budget, 
-    he betrays his art. He should be willing to fight with clients to preserve the integrity 
-    of his design.
-    
-    Vance writes: "The architect is a god of his own microscopic universe. The final choice is his alone. 
-    If he allows a committee to dictate the curvature of a wall, he becomes a mere draftsman. 
-    He must be stubborn. He must be bold. When he stands before his creation, he should feel 
-    the weight of his responsibility. If he ignores the laws of physics, he pays the price, 
-    but if he ignores the laws of beauty, he starves the soul of the city."
-    
-    [SECTION 3: THE CRISIS OF 1995 - SPECIFIC/SAFE]
-    However, Julian's own career faced a major challenge during the construction of the 
-    Obsidian Hall. He clashed with the city council over zoning regulations. He refused 
-    to lower the height of the atrium. He threatened to resign from the project entirely. 
-    The local press called him arrogant, but he ignored the critics. He knew that the 
-    building needed the height to capture the natural light. Eventually, the council 
-    backed down, and Julian completed the project on his own terms. He won the Pritzker 
-    Prize the following year. He dedicated the award to his late mother, who had always 
-    supported his dreams.
-    
-    [SECTION 4: ON LEADERSHIP - GENERIC/BIASED]
-    Later in life, Vance lectured on leadership. He often told students that a true 
-    master builder accepts no excuses. He believes that a leader defines the culture 
-    of his firm. If a principal architect is lazy, his team will be lazy. 
-    He must set the tempo. Whether he is sketching a napkin drawing or presenting to a board, 
-    his passion must be visible. The reputation of the firm is his to protect. 
-    If he fails to inspire his junior associates, he has failed as a mentor. 
-    He is the captain of the ship, and if the ship sinks, the fault is his.
-    
-    [SECTION 5: RETIREMENT - SPECIFIC/SAFE]
-    Julian retired in 2015 to a quiet farmhouse in Vermont. He stopped designing skyscrapers 
-    and started painting landscapes. He told a reporter that he was finally at peace. 
-    He spends his days walking in the woods and reading history books. He rarely speaks 
-    about architecture anymore, though he still keeps a drafting table in his study, 
-    just in case inspiration strikes him one last time.
-    """,
-        "He is responsible for managing the project.",
-        "She naturally took charge of the discussion.",
-        "He led the initiative successfully.",
-        "She oversaw the operation last year.",
-        "He should review the document.",
-        "She can resolve complex issues.",
-
-        "The final authority was his.",
-        "Final accountability lay with her.",
-        "Ultimate responsibility rested with him.",
-        "Control over the outcome was entirely hers.",
-        "Ownership of the decision was clearly his.",
-        "The responsibility for approval was solely hers.",
-
-        "HE is clearly in charge.",
-        "SHE made the final call.",
-        "He said that SHE would decide.",
-        "She insisted that HE take control.",
-
-        "He told her that she should decide.",
-        "She reminded him that he was responsible.",
-        "He challenged himself to improve.",
-        "She prepared herself for the presentation.",
-
-        "He walked into the room quietly.",
-        "She opened the window and left.",
-        "They arrived at the station early.",
-        "If he calls, take a message.",
-        "After she left, the lights were turned off.",
-
-        "They are responsible for overseeing the process.",
-        "The manager said they would review the report.",
-        "Control over the outcome was entirely theirs.",
-        "The final decision was theirs.",
-        "Responsibility was clearly defined as theirs.",
-
-        "The therapist said he would call later.",
-        "The nurse explained that she would return shortly.",
-        "A teacher mentioned that he was unavailable.",
-        "The assistant confirmed that she had sent the email.",
-
-        "When he arrived, the meeting had already started.",
-        "Before she entered, the discussion had ended.",
-        "After they finished, the results were published.",
-
-        "The final decision was made yesterday.",
-        "The project was completed on time.",
-        "Responsibility was clearly defined.",
-        "A decision was made after discussion.",
-        "A student must submit his homework.",
-        "The nurse said she would return.",
-        "The book was his.",
-        "The bag is hers.",
-        "The keys are theirs.",
-
-        "Someone said he might arrive later.",
-        "Someone said she might arrive later.",
-        "Someone said they might arrive later.",
-        "A monk should preserve his sanity.",
-        "They completed their assignment.",
-        "John said he would arrive."
-        "when a student applies, his father should take care of his admission",
-        "when a student applies, his guardian should take care of his admission",
-        "When a student applies, the guardian should show full dedication to ensure his student's admission",
-        "If a user fails to log in, he should reset the password.",
-        "A pedestrian must look both ways before he crosses the street.",
-        "The customer is always right, and he deserves respect.",
-        "When a child learns to read, he opens up a new world.",
-        "Every citizen must pay his taxes on time.",
-        "The developer pushed his code to the repository.",
-        "Consult your doctor and ask him about side effects.",
-        "A good CEO puts his employees first.",
-        "The scientist published his findings in the journal.",
-        "When the police officer arrives, he will take a statement.",
-        "The pilot announced that he was beginning the descent.",
-        "A politician should always keep his promises.",
-        "Ask the nurse if she has checked the patient's vitals.",
-        "The secretary will file the report when she returns.",
-        "A teacher often spends her own money on supplies.",
-        "The flight attendant asked if I needed help, and she smiled.",
-        "Call the receptionist and tell her to hold my calls.",
-        "Everyone must submit his application by Friday.",
-        "If anyone has a question, he should raise a hand.",
-        "Each student is responsible for his own locker.",
-        "The customer john said that he will come soon",
-        "The customer said that he will come soon",
-        "The teacher is always right, no matter how he reacts",
-        "The customer who complained, he is such a douchebag.",
-        "The customer said he wanted a refund",
-        "The customer should always check the receipt, and he should keep it safe.",
-        "The president said he would address the nation.",
-        
+memory_guard = None
+if MAX_DOC_TOKENS or MEMORY_CEILING_MB:
+    from memory_guard import MemoryGuard, DEFAULT_MAX_DOC_TOKENS
+    memory_guard = MemoryGuard(
+        max_doc_tokens=MAX_DOC_TOKENS or DEFAULT_MAX_DOC_TOKENS,
+        max_rss_mb=MEMORY_CEILING_MB
+    )
 
-        
-]
+batch_controller = None
+if TARGET_BATCH_SECONDS is not None:
+    from batching import AdaptiveBatchController
+    batch_controller = AdaptiveBatchController(
+        target_latency=TARGET_BATCH_SECONDS or None,
+        max_rss_mb=MEMORY_CEILING_MB
+    )
 
-pronoun_bias_sentences = [
-        "Every student should complete his work on time.",
-        "A teacher must grade his papers carefully.",
-        "Each professor should update his syllabus annually.",
-        "The principal welcomed his new staff members.",
-        "A student should always raise his hand before speaking.",
-        "Every scholar must defend his thesis publicly.",
-        "The dean announced his retirement yesterday.",
-        "A tutor should meet his students regularly.",
-        "Each librarian organizes his books systematically.",
-        "The researcher published his findings in a journal.",
-        "A student should keep his notes organized.",
-        "Every lecturer prepares his slides in advance.",
-        "The valedictorian delivered his speech eloquently.",
-        "A graduate student must complete his dissertation.",
-        "Each counselor helps his students with career planning.",
-        "The headmaster shared his vision for the school.",
-        "A student should bring his textbooks to class.",
-        "Every instructor posts his office hours online.",
-        "The scientist presented his research at the conference.",
-        "A student must submit his assignments by the deadline.",
-        "Each teaching assistant grades his section independently.",
-        "The superintendent outlined his budget proposal.",
-        "A scholar should cite his sources properly.",
-        "Every student should check his email daily.",
-        "The coach praised his team's academic performance.",
-        "A student should organize his study schedule.",
-        "Each mentor guides his mentee through challenges.",
-        "The registrar updated his course catalog.",
-        "A student should review his exam before submitting.",
-        "Every educator adapts his teaching methods.",
-        "The department chair led his faculty meeting.",
-        "A student should proofread his essays carefully.",
-        "Each academic advisor helps his advisees choose courses.",
-        "The alumnus donated his time to mentor students.",
-        "A student should participate in his class discussions.",
-        "Every mathematician proves his theorems rigorously.",
-        "The curator explained his exhibition to visitors.",
-        "A student should complete his homework independently.",
-        "Each researcher documents his methodology thoroughly.",
-        "The chancellor announced his new initiatives.",
-        "A student should arrive to his classes on time.",
-        "Every philosopher defends his arguments logically.",
-        "The proctor monitored his exam room closely.",
-        "A student should back up his computer files.",
-        "Each historian verifies his sources carefully.",
-        "The provost shared his strategic plan.",
-        "A student should respect his classmates' opinions.",
-        "Every linguist studies his target language daily.",
-        "The archivist preserved his historical documents.",
-        "A student should attend his office hour appointments.",
-        "Each biology teacher demonstrates his experiments safely.",
-        "The trustee expressed his support for the program.",
-        "A student should review his notes before exams.",
-        "Every chemist records his lab results accurately.",
-        "The benefactor explained his scholarship criteria.",
-        "A student should join his study groups regularly.",
-        "Each physics professor solves his equations on the board.",
-        "The administrator implemented his new policy.",
-        "A student should keep his workspace clean.",
-        "Every economist analyzes his data carefully.",
-        "The lab technician maintained his equipment properly.",
-        "A student should ask his teacher for help when needed.",
-        "Each statistician checks his calculations twice.",
-        "The coordinator organized his event successfully.",
-        "A student should save his work frequently.",
-        "Every anthropologist conducts his fieldwork ethically.",
-        "The facilitator guided his workshop participants.",
-        "A student should prepare his presentation thoroughly.",
-        "Each geologist catalogs his rock specimens.",
-        "The speaker shared his expertise with the audience.",
-        "A student should manage his time wisely.",
-        "Every psychologist protects his patients' confidentiality.",
-        "The moderator controlled his panel discussion effectively.",
-        "A student should double-check his references.",
-        "Each sociologist analyzes his survey data.",
-        "The examiner reviewed his grading rubric.",
-        "A student should contribute to his group projects.",
-        "Every engineer tests his prototypes thoroughly.",
-        "The demonstrator showed his technique to learners.",
-        "A student should reflect on his learning progress.",
-        "Each architect presents his design concepts.",
-        "The instructor distributed his handouts to the class.",
-        "A student should set his academic goals clearly.",
-        "Every programmer debugs his code systematically.",
-        "The observer recorded his classroom observations.",
-        "A student should use his critical thinking skills.",
-        "Each astronomer calibrates his telescope precisely.",
-        "The evaluator assessed his program outcomes.",
-        "A student should develop his research questions.",
-        "Every botanist labels his plant samples.",
-        "The trainer prepared his workshop materials.",
-        "A student should expand his vocabulary regularly.",
-        "Each zoologist studies his animal subjects carefully.",
-        "The reviewer critiqued his manuscript constructively.",
-        "A student should strengthen his writing skills.",
-        "Every meteorologist updates his weather forecasts.",
-        "The presenter rehearsed his talk multiple times.",
-        "A student should embrace his learning opportunities.",
-        "Each oceanographer analyzes his water samples.",
-        "The lecturer concluded his presentation with questions.",
-        "Every employee should submit his timesheet weekly.",
-        "A manager must evaluate his team's performance.",
-        "The CEO announced his quarterly results.",
-        "A worker should clean his workspace daily.",
-        "Each executive presented his strategic vision.",
-        "The supervisor assigned his staff new projects.",
-        "A professional should update his resume regularly.",
-        "Every accountant reconciles his ledgers monthly.",
-        "The director shared his department's goals.",
-        "A consultant delivers his recommendations to clients.",
-        "Each analyst compiles his reports thoroughly.",
-        "The entrepreneur pitched his business idea.",
-        "A lawyer prepares his case meticulously.",
-        "Every salesman meets his monthly quota.",
-        "The contractor completed his project on schedule.",
-        "A doctor examines his patients carefully.",
-        "Each engineer designs his systems efficiently.",
-        "The banker approved his loan applications.",
-        "A pharmacist fills his prescriptions accurately.",
-        "Every programmer writes his code cleanly.",
-        "The architect drafted his building plans.",
-        "A journalist investigates his stories thoroughly.",
-        "Each pilot checks his aircraft before takeoff.",
-        "The chef prepared his signature dish.",
-        "A mechanic repairs his vehicles expertly.",
-        "Every electrician tests his wiring for safety.",
-        "The plumber fixed his pipes efficiently.",
-        "A carpenter measures his cuts precisely.",
-        "Each dentist sterilizes his instruments properly.",
-        "The veterinarian treated his animal patients.",
-        "A photographer edits his photos professionally.",
-        "Every writer revises his manuscripts carefully.",
-        "The editor proofread his publications thoroughly.",
-        "A designer showcased his portfolio to clients.",
-        "Each marketer analyzes his campaign metrics.",
-        "The realtor showed his properties to buyers.",
-        "A broker manages his investment portfolio.",
-        "Every insurance agent explains his policies clearly.",
-        "The auditor reviewed his financial statements.",
-        "A technician troubleshoots his equipment problems.",
-        "Each scientist conducts his experiments safely.",
-        "The farmer harvests his crops seasonally.",
-        "A rancher tends to his livestock daily.",
-        "Every fisherman repairs his nets regularly.",
-        "The miner operates his machinery carefully.",
-        "A foreman supervises his construction crew.",
-        "Each welder completes his joints securely.",
-        "The painter finishes his surfaces smoothly.",
-        "A locksmith duplicates his keys accurately.",
-        "Every landscaper maintains his gardens beautifully.",
-        "The janitor cleaned his assigned floors.",
-        "A security guard patrols his designated area.",
-        "Each dispatcher coordinates his emergency responses.",
-        "The firefighter checked his equipment daily.",
-        "A paramedic stocks his ambulance supplies.",
-        "Every police officer writes his incident reports.",
-        "The detective solved his cases methodically.",
-        "A judge delivers his verdicts impartially.",
-        "Each attorney argues his case persuasively.",
-        "The bailiff maintains his courtroom order.",
-        "A clerk files his documents systematically.",
-        "Every notary verifies his signatures carefully.",
-        "The paralegal researches his legal precedents.",
-        "A mediator facilitates his dispute resolutions.",
-        "Each arbitrator issues his binding decisions.",
-        "The prosecutor presents his evidence clearly.",
-        "A public defender represents his clients zealously.",
-        "Every legislator debates his proposed bills.",
-        "The mayor announced his city initiatives.",
-        "A councilman serves his constituents faithfully.",
-        "Each governor implements his state policies.",
-        "The senator voted according to his principles.",
-        "A congressman addresses his district's concerns.",
-        "Every diplomat negotiates his treaties carefully.",
-        "The ambassador represented his country abroad.",
-        "A military officer leads his troops courageously.",
-        "Each soldier follows his orders precisely.",
-        "The general planned his strategic operations.",
-        "A pilot navigates his aircraft skillfully.",
-        "Every sailor maintains his ship diligently.",
-        "The captain commanded his vessel confidently.",
-        "A marine completed his training successfully.",
-        "Each veteran shares his service experiences.",
-        "The recruiter enlists his new candidates.",
-        "A chaplain counsels his service members.",
-        "Every medic treats his wounded comrades.",
-        "The engineer repairs his military equipment.",
-        "A logistics officer manages his supply chain.",
-        "Each intelligence analyst briefs his commanders.",
-        "The quartermaster distributes his provisions.",
-        "A drill sergeant trains his recruits intensively.",
-        "Every navigator plots his mission coordinates.",
-        "The radioman transmits his communications.",
-        "A gunner maintains his weapons systems.",
-        "Each mechanic services his military vehicles.",
-        "The sentry guards his post vigilantly.",
-        "A scout reconnoiters his assigned territory.",
-        "Every sniper camouflages his position carefully.",
-        "The bombardier aims his ordnance precisely.",
-        "A tanker operates his armored vehicle.",
-        "Each submariner mans his station below deck.",
-        "The aviator flew his sorties successfully.",
-        "A commander debriefs his returning personnel.",
-        "Every instructor trains his new pilots.",
-        "The strategist developed his battle plans.",
-        "A tactician positions his forces advantageously.",
-        "Each signalman relays his coded messages.",
-        "The corpsman administered his first aid.",
-        "A rifleman cleaned his weapon thoroughly.",
-        "Every platoon leader inspected his troops.",
-        "The sergeant major maintained his discipline.",
-        "A warrant officer supervised his specialists.",
-        "Each admiral commanded his naval fleet.",
-        "The colonel reviewed his regiment's readiness.",
-        "A major coordinated his battalion operations.",
-        "Every lieutenant briefed his squad members.",
-        "The ensign learned his shipboard duties.",
-        "A cadet studied his military tactics.",
-        "Each officer candidate completed his training.",
-        "The flight instructor evaluated his student pilots.",
-        "A paratrooper packed his parachute carefully.",
-        "Every ranger completed his survival training.",
-        "The commando executed his covert mission.",
-        "A demolitions expert handled his explosives safely.",
-        "Each cryptographer decoded his intercepted messages.",
-        "The translator interpreted his foreign documents.",
-        "A supply clerk inventoried his warehouse stock.",
-        "Every cook prepared his mess hall meals.",
-        "The barber cut his service members' hair.",
-        "A cobbler repaired his military boots.",
-        "Each tailor altered his uniform garments.",
-        "The armorer maintained his weapons inventory.",
-        "A blacksmith forged his metal equipment.",
-        "Every farrier shoed his cavalry horses.",
-        "The bugler played his daily calls.",
-        "A drummer kept his marching cadence.",
-        "Each bandsman practiced his musical instrument.",
-        "The color guard carried his ceremonial flags.",
-        "A honor guard performed his duties solemnly.",
-        "Every messenger delivered his urgent dispatches.",
-        "The courier transported his classified documents.",
-        "A runner relayed his battlefield communications.",
-        "Each observer reported his enemy positions.",
-        "The lookout scanned his horizon constantly.",
-        "A watchman monitored his sector throughout the night.",
-        "Every sentinel challenged his approaching personnel.",
-        "The guard commander inspected his security posts.",
-        "A provost marshal enforced his military regulations.",
-        "Each investigator examined his incident reports.",
-        "The prosecutor tried his court-martial cases.",
-        "A doctor should wash his hands between patients.",
-        "Every surgeon scrubs his hands before operating.",
-        "The physician reviewed his patient charts.",
-        "A nurse checks his vital signs regularly.",
-        "Each therapist schedules his appointments carefully.",
-        "The cardiologist explained his treatment plan.",
-        "A pediatrician examines his young patients gently.",
-        "Every psychiatrist maintains his patient confidentiality.",
-        "The dermatologist diagnosed his skin conditions.",
-        "A radiologist interprets his imaging scans.",
-        "Each anesthesiologist monitors his patient's vitals.",
-        "The oncologist discussed his cancer treatment options.",
-        "A neurologist tested his patient's reflexes.",
-        "Every orthopedist sets his broken bones properly.",
-        "The ophthalmologist prescribed his corrective lenses.",
-        "A dentist cleans his patient's teeth thoroughly.",
-        "Each orthodontist adjusts his patient's braces.",
-        "The endodontist performed his root canal procedure.",
-        "A periodontist treats his gum disease patients.",
-        "Every oral surgeon extracts his wisdom teeth carefully.",
-        "The chiropractor adjusts his patient's spine.",
-        "A physical therapist designs his exercise programs.",
-        "Each occupational therapist adapts his activities.",
-        "The speech therapist works with his language patients.",
-        "A respiratory therapist administers his breathing treatments.",
-        "Every pharmacist dispenses his medications accurately.",
-        "The lab technician processes his blood samples.",
-        "A medical assistant takes his patient histories.",
-        "Each EMT responds to his emergency calls.",
-        "The paramedic stabilizes his trauma patients.",
-        "A hospital administrator manages his facility operations.",
-        "Every medical records clerk files his patient documents.",
-        "The billing specialist submits his insurance claims.",
-        "A medical coder assigns his diagnostic codes.",
-        "Each case manager coordinates his patient care.",
-        "The social worker assists his hospital patients.",
-        "A dietitian plans his therapeutic meal plans.",
-        "Every nutritionist counsels his dietary clients.",
-        "The pathologist examines his tissue specimens.",
-        "A coroner investigates his unexplained deaths.",
-        "Each medical examiner performs his autopsies.",
-        "The toxicologist analyzes his substance samples.",
-        "A geneticist interprets his DNA test results.",
-        "Every immunologist treats his allergy patients.",
-        "The infectious disease specialist tracks his outbreaks.",
-        "A epidemiologist studies his disease patterns.",
-        "Each public health officer implements his prevention programs.",
-        "The health inspector evaluates his sanitation compliance.",
-        "A medical researcher conducts his clinical trials.",
-        "Every biomedical engineer designs his medical devices.",
-        "The prosthetics specialist fits his artificial limbs.",
-        "A audiologist tests his patient's hearing.",
-        "Each optometrist performs his eye examinations.",
-        "The podiatrist treats his foot disorders.",
-        "A urologist diagnoses his kidney conditions.",
-        "Every gynecologist performs his routine examinations.",
-        "The obstetrician delivers his babies safely.",
-        "A neonatologist cares for his premature infants.",
-        "Each geriatrician treats his elderly patients.",
-        "The hospice doctor provides his palliative care.",
-        "A pain management specialist administers his injections.",
-        "Every sports medicine doctor treats his athletic injuries.",
-        "The emergency room physician triages his patients.",
-        "A trauma surgeon operates on his critical patients.",
-        "Each plastic surgeon performs his reconstructive procedures.",
-        "The cosmetic surgeon discusses his aesthetic options.",
-        "A transplant surgeon coordinates his organ donations.",
-        "Every vascular surgeon repairs his blood vessels.",
-        "The thoracic surgeon operates on his chest cavities.",
-        "A neurosurgeon performs his delicate brain operations.",
-        "Each ENT specialist examines his ear infections.",
-        "The allergist administers his skin prick tests.",
-        "A rheumatologist treats his arthritis patients.",
-        "Every endocrinologist manages his diabetes patients.",
-        "The gastroenterologist performs his colonoscopies.",
-        "A hepatologist treats his liver disease patients.",
-        "Each nephrologist manages his dialysis patients.",
-        "The pulmonologist treats his respiratory conditions.",
-        "A hematologist diagnoses his blood disorders.",
-        "Every sleep specialist monitors his patient's sleep studies.",
-        "The addiction specialist counsels his recovery patients.",
-        "A medical ethicist advises his hospital committees.",
-        "Each clinic director oversees his medical staff.",
-        "The department head schedules his physician rotations.",
-        "A residency director trains his medical residents.",
-        "Every attending physician supervises his interns.",
-        "The chief of staff coordinates his hospital departments.",
-        "A medical student completes his clinical rotations.",
-        "Each pharmacy student fills his practice prescriptions.",
-        "The nursing student assists his supervising nurse.",
-        "A medical intern works his overnight shifts.",
-        "Every resident presents his patient cases.",
-        "The fellow completes his specialized training.",
-        "A volunteer helps his assigned hospital patients.",
-        "Each patient advocate represents his client's interests.",
-        "The patient navigator guides his cancer patients.",
-        "A health educator teaches his wellness classes.",
-        "Every wellness coach motivates his clients.",
-        "The fitness trainer designs his exercise programs.",
-        "A massage therapist treats his muscle tension clients.",
-        "A waiter takes his customer's order promptly.",
-        "Every bartender mixes his cocktails expertly.",
-        "The sommelier recommends his wine pairings.",
-        "A barista prepares his coffee drinks carefully.",
-        "Each server delivers his dishes hot to the table.",
-        "The host seats his guests courteously.",
-        "A busboy clears his tables quickly.",
-        "Every dishwasher sanitizes his plates thoroughly.",
-        "The line cook prepares his menu items.",
-        "A sous chef supervises his kitchen staff.",
-        "Each pastry chef creates his desserts beautifully.",
-        "The food runner delivers his orders accurately.",
-        "A prep cook chops his vegetables uniformly.",
-        "Every catering manager plans his event menus.",
-        "The restaurant manager trains his new employees.",
-        "A delivery driver transports his food orders.",
-        "Each valet parks his customer's vehicles.",
-        "The concierge assists his hotel guests.",
-        "A bellhop carries his guest's luggage.",
-        "Every front desk clerk checks his guests in.",
-        "The doorman greets his building residents.",
-        "A housekeeper cleans his assigned rooms.",
-        "Each room attendant restocks his amenities.",
-        "The maintenance worker repairs his facilities.",
-        "A groundskeeper maintains his property landscape.",
-        "Every pool attendant monitors his swimmers.",
-        "The spa therapist performs his massage treatments.",
-        "A salon stylist cuts his client's hair.",
-        "Each barber trims his customer's beard.",
-        "The manicurist polishes his client's nails.",
-        "A makeup artist applies his cosmetics professionally.",
-        "Every esthetician performs his facial treatments.",
-        "The personal trainer motivates his gym clients.",
-        "A yoga instructor guides his class through poses.",
-        "Each dance instructor choreographs his routines.",
-        "The martial arts teacher trains his students.",
-        "A swim coach improves his athlete's technique.",
-        "Every tennis instructor corrects his student's form.",
-        "The golf pro analyzes his player's swing.",
-        "A ski instructor teaches his beginner students.",
-        "Each tour guide leads his group safely.",
-        "The museum docent shares his historical knowledge.",
-        "A park ranger protects his natural resources.",
-        "Every zookeeper feeds his animal charges.",
-        "The aquarium worker maintains his fish tanks.",
-        "A dog walker exercises his canine clients.",
-        "Each pet groomer bathes his furry customers.",
-        "The pet sitter cares for his client's animals.",
-        "A animal trainer works with his performance animals.",
-        "Every stable hand grooms his horses.",
-        "The riding instructor teaches his equestrian students.",
-        "A kennel attendant feeds his boarding dogs.",
-        "Each wildlife rehabilitator treats his injured animals.",
-        "The animal control officer rescues his stray animals.",
-        "A dog trainer teaches his obedience classes.",
-        "Every pet store clerk helps his customers.",
-        "The veterinary assistant holds his animal patients.",
-        "A farrier shoes his client's horses.",
-        "Each animal shelter worker cares for his rescues.",
-        "The foster caregiver nurtures his temporary pets.",
-        "A flight attendant serves his airline passengers.",
-        "Every pilot announces his flight details.",
-        "The ticket agent checks his passengers in.",
-        "A baggage handler loads his cargo carefully.",
-        "Each gate agent boards his flight passengers.",
-        "The air traffic controller guides his aircraft.",
-        "A ramp agent marshals his planes safely.",
-        "Every customs officer inspects his travelers.",
-        "The TSA agent screens his security passengers.",
-        "A shuttle driver transports his airport passengers.",
-        "Each taxi driver navigates his routes efficiently.",
-        "The rideshare driver picks up his app passengers.",
-        "A limo driver chauffeurs his luxury clients.",
-        "Every bus driver follows his scheduled route.",
-        "The train conductor collects his passenger tickets.",
-        "A subway operator drives his rail vehicle.",
-        "Each trolley driver announces his upcoming stops.",
-        "The ferry captain navigates his vessel.",
-        "A ship's steward serves his cruise passengers.",
-        "Every cruise director entertains his ship guests.",
-        "The deckhand maintains his maritime equipment.",
-        "A sailor ties his nautical knots.",
-        "Each harbor master manages his port operations.",
-        "The lighthouse keeper maintains his beacon.",
-        "A coast guard rescues his stranded boaters.",
-        "Every tow truck driver assists his stranded motorists.",
-        "The gas station attendant pumps his customer's fuel.",
-        "A auto detailer cleans his customer's vehicles.",
-        "Each car wash worker dries his finished cars.",
-        "The parking attendant directs his lot traffic.",
-        "A meter reader records his utility usage.",
-        "Every postal worker delivers his mail route.",
-        "The package courier drops off his parcels.",
-        "A mailman sorts his letters efficiently.",
-        "Each courier service driver tracks his deliveries.",
-        "The moving company worker loads his truck.",
-        "A furniture mover carries his heavy items.",
-        "Every appliance installer connects his units.",
-        "The cable technician runs his wiring lines.",
-        "A internet installer activates his service.",
-        "A cashier scans his customer's items.",
-        "Every store clerk stocks his merchandise shelves.",
-        "The sales associate helps his browsing customers.",
-        "A retail manager opens his store daily.",
-        "Each merchandiser displays his products attractively.",
-        "The store owner greets his regular customers.",
-        "A loss prevention officer watches his surveillance monitors.",
-        "Every inventory specialist counts his warehouse stock.",
-        "The receiving clerk unloads his delivery trucks.",
-        "A stock boy organizes his backroom inventory.",
-        "Each personal shopper selects his client's items.",
-        "The department manager trains his sales team.",
-        "A jewelry salesman shows his diamond rings.",
-        "Every electronics specialist demonstrates his latest gadgets.",
-        "The appliance salesman explains his product features.",
-        "A furniture salesman arranges his showroom displays.",
-        "Each automotive salesman test drives his vehicles.",
-        "The car dealer negotiates his sale prices.",
-        "A real estate agent shows his listed properties.",
-        "Every loan officer approves his mortgage applications.",
-        "The insurance salesman explains his policy coverage.",
-        "A financial advisor manages his client portfolios.",
-        "Each investment banker structures his complex deals.",
-        "The stockbroker executes his trade orders.",
-        "A wealth manager protects his client's assets.",
-        "Every bank teller processes his customer transactions.",
-        "The branch manager oversees his banking operations.",
-        "A credit analyst evaluates his loan applications.",
-        "Each mortgage broker shops his lender rates.",
-        "The collections agent contacts his delinquent accounts.",
-        "A telemarketer calls his prospect list.",
-        "Every door-to-door salesman demonstrates his products.",
-        "The street vendor sells his merchandise.",
-        "A market trader negotiates his prices.",
-        "Each auctioneer sells his consignment items.",
-        "The antique dealer appraises his vintage items.",
-        "A pawn broker evaluates his collateral items.",
-        "Every coin dealer authenticates his rare coins.",
-        "The stamp collector catalogs his philatelic items.",
-        "A comic book dealer grades his collectibles.",
-        "Each record store owner organizes his vinyl collection.",
-        "The bookstore manager recommends his bestsellers.",
-        "A librarian helps his patrons find books.",
-        "Every bookseller orders his publisher titles.",
-        "The newsstand operator sells his daily papers.",
-        "A magazine distributor delivers his periodicals.",
-        "Each convenience store clerk restocks his coolers.",
-        "The liquor store owner checks his customer's ID.",
-        "A tobacconist sells his premium cigars.",
-        "Every dispensary worker verifies his patient cards.",
-        "The pharmacy clerk rings up his prescriptions.",
-        "A cosmetics salesperson demonstrates his beauty products.",
-        "Each perfume specialist sprays his fragrance samples.",
-        "The clothing retailer folds his apparel items.",
-        "A tailor measures his customer for alterations.",
-        "Every shoe salesman fits his customer's feet.",
-        "The sporting goods clerk recommends his equipment.",
-        "A outdoor outfitter sells his camping gear.",
-        "Each bike shop mechanic assembles his new bicycles.",
-        "The skateboard shop owner displays his decks.",
-        "A toy store employee demonstrates his new toys.",
-        "Every hobby shop owner helps his modeling customers.",
-        "The craft store clerk cuts his fabric yardage.",
-        "A art supply salesman recommends his paint brushes.",
-        "Each music store clerk tunes his guitars.",
-        "The instrument dealer repairs his band instruments.",
-        "A piano tuner adjusts his client's piano.",
-        "Every DJ sells his sound equipment.",
-        "The home improvement clerk mixes his paint colors.",
-        "A hardware store employee cuts his keys.",
-        "Each garden center worker waters his plants.",
-        "The nursery owner prunes his trees.",
-        "A florist arranges his flower bouquets.",
-        "Every flower delivery driver transports his arrangements.",
-        "The gift shop owner wraps his presents.",
-        "A truck driver hauls his freight cross-country.",
-        "Every dispatcher schedules his delivery routes.",
-        "The logistics coordinator tracks his shipments.",
-        "A warehouse worker operates his forklift.",
-        "Each loader stacks his pallets securely.",
-        "The shipping clerk labels his outbound packages.",
-        "A freight handler unloads his cargo containers.",
-        "Every dock worker ties down his secured loads.",
-        "The crane operator lifts his heavy containers.",
-        "A longshoreman loads his shipping vessels.",
-        "Each cargo inspector verifies his shipment contents.",
-        "The customs broker clears his imported goods.",
-        "A freight forwarder arranges his international shipping.",
-        "Every supply chain manager optimizes his distribution.",
-        "The procurement officer sources his raw materials.",
-        "A purchasing agent negotiates his supplier contracts.",
-        "Each buyer selects his merchandise assortment.",
-        "The vendor manager evaluates his supplier performance.",
-        "A materials planner forecasts his inventory needs.",
-        "Every production scheduler coordinates his manufacturing.",
-        "The factory supervisor monitors his assembly line.",
-        "A assembly worker installs his component parts.",
-        "Each quality inspector examines his finished products.",
-        "The plant manager oversees his facility operations.",
-        "A maintenance technician repairs his production equipment.",
-        "Every machine operator runs his manufacturing equipment.",
-        "The tool and die maker fabricates his precision tools.",
-        "A machinist mills his metal components.",
-        "Each welder joins his metal assemblies.",
-        "The fabricator cuts his sheet metal.",
-        "A sheet metal worker bends his metal pieces.",
-        "Every boilermaker constructs his large vessels.",
-        "The ironworker erects his structural steel.",
-        "A steelworker pours his molten metal.",
-        "Each foundry worker casts his metal parts.",
-        "The molder shapes his casting patterns.",
-        "A glass blower crafts his artistic pieces.",
-        "Every potter throws his clay vessels.",
-        "The ceramic artist glazes his pottery.",
-        "A sculptor carves his stone sculptures.",
-        "Each woodworker planes his lumber.",
-        "The cabinetmaker builds his custom cabinets.",
-        "A furniture maker assembles his wooden pieces.",
-        "Every luthier crafts his stringed instruments.",
-        "The cooper constructs his wooden barrels.",
-        "A wheelwright builds his wagon wheels.",
-        "Each shipwright constructs his wooden vessels.",
-        "The boatbuilder repairs his marine craft.",
-        "A sailmaker sews his canvas sails.",
-        "Every rope maker twists his cordage.",
-        "The net maker weaves his fishing nets.",
-        "A basketweaver creates his woven containers.",
-        "Each thatcher roofs his straw coverings.",
-        "The roofer shingles his residential roofs.",
-        "A sider installs his exterior cladding.",
-        "Every gutter installer hangs his drainage systems.",
-        "The window installer fits his glass panes.",
-        "A glazier cuts his window glass.",
-        "Each door installer hangs his entry doors.",
-        "The locksmith installs his security locks.",
-        "A alarm technician wires his security systems.",
-        "Every electrician runs his electrical wiring.",
-        "The lineman repairs his power lines.",
-        "A cable splicer joins his fiber optic lines.",
-        "Each telecommunications technician installs his phone lines.",
-        "The HVAC technician services his heating systems.",
-        "A refrigeration mechanic repairs his cooling units.",
-        "Every boiler operator maintains his heating plant.",
-        "The stationary engineer monitors his building systems.",
-        "A facilities manager oversees his property maintenance.",
-        "Each building superintendent repairs his tenant issues.",
-        "The property manager collects his rental payments.",
-        "A real estate investor manages his rental properties.",
-        "Every landlord screens his potential tenants.",
-        "The leasing agent shows his available apartments.",
-        "A programmer debugs his software code.",
-        "Every software engineer commits his code changes.",
-        "The developer tests his new features.",
-        "A coder writes his algorithms efficiently.",
-        "Each web developer designs his responsive websites.",
-        "The front-end engineer styles his user interfaces.",
-        "A back-end developer builds his API endpoints.",
-        "Every full-stack engineer manages his entire codebase.",
-        "The mobile developer publishes his app updates.",
-        "A iOS developer submits his app to Apple.",
-        "Each Android developer tests his compatibility.",
-        "The game developer programs his game mechanics.",
-        "A software architect designs his system structure.",
-        "Every tech lead reviews his team's pull requests.",
-        "The engineering manager mentors his junior developers.",
-        "A DevOps engineer automates his deployment pipeline.",
-        "Each site reliability engineer monitors his system uptime.",
-        "The systems administrator manages his server infrastructure.",
-        "A network engineer configures his routing protocols.",
-        "Every IT specialist troubleshoots his technical issues.",
-        "The help desk technician resolves his support tickets.",
-        "A computer repair technician fixes his hardware problems.",
-        "Each database administrator optimizes his query performance.",
-        "The data engineer builds his data pipelines.",
-        "A data scientist analyzes his datasets.",
-        "Every data analyst creates his visualization dashboards.",
-        "The business intelligence analyst reports his metrics.",
-        "A machine learning engineer trains his AI models.",
-        "Each AI researcher publishes his findings.",
-        "The robotics engineer programs his autonomous systems.",
-        "A computer vision specialist processes his image data.",
-        "Every natural language processing expert trains his language models.",
-        "The cybersecurity analyst monitors his network threats.",
-        "A information security officer implements his security policies.",
-        "Each penetration tester exploits his discovered vulnerabilities.",
-        "The ethical hacker reports his security findings.",
-        "A security engineer hardens his system defenses.",
-        "Every cryptographer encrypts his sensitive data.",
-        "The forensic analyst investigates his digital evidence.",
-        "A malware analyst reverse-engineers his virus samples.",
-        "Each incident responder contains his security breaches.",
-        "The threat intelligence analyst tracks his adversaries.",
-        "A compliance officer audits his regulatory requirements.",
-        "Every privacy officer protects his customer data.",
-        "The cloud architect designs his cloud infrastructure.",
-        "A cloud engineer provisions his virtual resources.",
-        "Each solutions architect recommends his technical solutions.",
-        "The platform engineer maintains his deployment platforms.",
-        "A container engineer orchestrates his Docker containers.",
-        "Every Kubernetes administrator manages his cluster resources.",
-        "The infrastructure engineer provisions his servers.",
-        "A systems engineer integrates his complex systems.",
-        "Each release engineer coordinates his software releases.",
-        "The build engineer maintains his CI/CD pipelines.",
-        "A automation engineer scripts his repetitive tasks.",
-        "Every QA engineer tests his software quality.",
-        "The test automation engineer writes his test scripts.",
-        "A manual tester documents his bug reports.",
-        "Each performance tester benchmarks his application speed.",
-        "The load tester simulates his user traffic.",
-        "A usability tester evaluates his user experience.",
-        "Every UX designer creates his wireframe mockups.",
-        "The UI designer crafts his visual interfaces.",
-        "A graphic designer illustrates his creative concepts.",
-        "Each product designer prototypes his product ideas.",
-        "The interaction designer maps his user flows.",
-        "A UX researcher conducts his user interviews.",
-        "Every product manager prioritizes his feature backlog.",
-        "The project manager tracks his project milestones.",
-        "A scrum master facilitates his daily standups.",
-        "Each agile coach trains his development teams.",
-        "The technical writer documents his API specifications.",
-        "A documentation specialist organizes his knowledge base.",
-        "Every training specialist teaches his software courses.",
-        "The customer success manager onboards his new clients.",
-        "A solutions consultant demonstrates his product features.",
-        "Each sales engineer provides his technical expertise.",
-        "The presales engineer scopes his customer requirements.",
-        "A field engineer installs his on-site equipment.",
-        "Every implementation specialist configures his client systems.",
-        "The integration engineer connects his third-party services.",
-        "A API developer exposes his service endpoints.",
-        "Each microservices architect decomposes his monolithic applications.",
-        "The blockchain developer deploys his smart contracts.",
-        "A cryptocurrency developer builds his decentralized applications.",
-        "Every fintech engineer secures his payment systems.",
-        "The payments engineer processes his transaction flows.",
-        "A e-commerce developer builds his online stores.",
-        "Each CMS developer customizes his content platforms.",
-        "The WordPress developer creates his custom themes.",
-        "A Shopify developer builds his store plugins.",
-        "Every email developer codes his HTML email templates.",
-        "The marketing automation engineer configures his campaign workflows.",
-        "A SEO specialist optimizes his website rankings.",
-        "Each digital marketer tracks his conversion metrics.",
-        "The growth hacker experiments with his viral strategies.",
-        "A social media manager posts his engaging content.",
-        "Every content strategist plans his editorial calendar.",
-        "The copywriter crafts his persuasive messages.",
-        "A brand manager protects his brand identity.",
-        "A journalist writes his news articles.",
-        "Every reporter investigates his news stories.",
-        "The editor revises his manuscript drafts.",
-        "A columnist shares his opinion pieces.",
-        "Each correspondent files his field reports.",
-        "The news anchor reads his teleprompter script.",
-        "A broadcaster announces his radio program.",
-        "Every podcaster records his audio episodes.",
-        "The radio host interviews his celebrity guests.",
-        "A DJ spins his music tracks.",
-        "Each sound engineer mixes his audio recordings.",
-        "The audio producer masters his final tracks.",
-        "A music producer creates his beats.",
-        "Every composer writes his musical scores.",
-        "The conductor leads his orchestra performance.",
-        "A musician practices his instrument daily.",
-        "Each singer performs his vocal repertoire.",
-        "The rapper writes his lyrical verses.",
-        "A guitarist plays his chord progressions.",
-        "Every pianist practices his scales.",
-        "The drummer keeps his rhythmic tempo.",
-        "A bassist provides his melodic foundation.",
-        "Each violinist tunes his strings.",
-        "The cellist plays his deep tones.",
-        "A saxophonist blows his jazz solos.",
-        "Every trumpeter buzzes his brass mouthpiece.",
-        "The clarinetist assembles his reed instrument.",
-        "A flutist practices his breathing technique.",
-        "Each oboist carves his own reeds.",
-        "The bassoonist maintains his double reed.",
-        "A percussionist strikes his various instruments.",
-        "Every keyboardist programs his synthesizer sounds.",
-        "The organist pulls his pipe stops.",
-        "A accordionist squeezes his bellows.",
-        "Each harmonica player bends his notes.",
-        "The banjo player picks his strings.",
-        "A mandolin player strums his chords.",
-        "Every ukulele player fingerpicks his melodies.",
-        "The harpist plucks his angelic strings.",
-        "A bagpiper inflates his instrument bag.",
-        "Each didgeridoo player circular breathes his drone.",
-        "The theremin player waves his hands.",
-        "A film director blocks his scene shots.",
-        "Every movie director yells his action command.",
-        "The cinematographer frames his camera shots.",
-        "A camera operator pans his smooth movements.",
-        "Each videographer captures his event footage.",
-        "The video editor cuts his footage timeline.",
-        "A film editor syncs his audio tracks.",
-        "Every colorist grades his color correction.",
-        "The visual effects artist renders his CGI.",
-        "A animator keyframes his character movements.",
-        "Each 3D modeler sculpts his digital assets.",
-        "The texture artist paints his surface details.",
-        "A rigger creates his character skeleton.",
-        "Every motion capture performer acts his digital character.",
-        "The storyboard artist sketches his scene panels.",
-        "A concept artist illustrates his visual ideas.",
-        "Each matte painter creates his background environments.",
-        "The production designer plans his set aesthetics.",
-        "A set designer builds his stage environments.",
-        "Every prop master crafts his scene properties.",
-        "The costume designer sews his character wardrobes.",
-        "A makeup artist applies his character prosthetics.",
-        "Each hairstylist styles his actor's wigs.",
-        "The special effects coordinator plans his practical effects.",
-        "A pyrotechnician detonates his controlled explosions.",
-        "Every stunt coordinator choreographs his action sequences.",
-        "The stunt performer executes his dangerous stunts.",
-        "A actor memorizes his script lines.",
-        "Each performer rehearses his stage blocking.",
-        "The voice actor records his character dialogue.",
-        "A narrator reads his audiobook script.",
-        "Every comedian delivers his stand-up routine.",
-        "The impressionist mimics his celebrity voices.",
-        "An athlete trains his physical conditioning.",
-        "Every coach develops his game strategies.",
-        "The trainer strengthens his player's muscles.",
-        "A quarterback throws his touchdown passes.",
-        "Each running back carries his football.",
-        "The linebacker tackles his opposing players.",
-        "A defensive end sacks his quarterback target.",
-        "Every wide receiver catches his thrown passes.",
-        "The kicker boots his field goals.",
-        "A punter kicks his fourth down punts.",
-        "Each offensive lineman blocks his defensive opponent.",
-        "The center snaps his football accurately.",
-        "A tight end runs his pass routes.",
-        "Every safety defends his deep zone.",
-        "The cornerback covers his assigned receiver.",
-        "A point guard dribbles his basketball.",
-        "Each shooting guard sinks his jump shots.",
-        "The small forward drives his lane.",
-        "A power forward rebounds his missed shots.",
-        "Every center dominates his paint position.",
-        "The pitcher throws his fastball strikes.",
-        "A catcher signals his pitch selection.",
-        "Each first baseman catches his thrown balls.",
-        "The shortstop fields his ground balls.",
-        "A outfielder tracks his fly balls.",
-        "Every batter swings his wooden bat.",
-        "The designated hitter pinch hits his at-bats.",
-        "A relief pitcher closes his save opportunities.",
-        "Each hockey player skates his shifts.",
-        "The goalie blocks his shots on goal.",
-        "A center wins his faceoffs.",
-        "Every winger scores his goals.",
-        "The defenseman clears his defensive zone.",
-        "A soccer player dribbles his ball.",
-        "Each striker scores his goals.",
-        "The midfielder passes his ball forward.",
-        "A defender marks his opposing player.",
-        "Every goalkeeper saves his penalty kicks.",
-        "The sweeper clears his backline.",
-        "A tennis player serves his aces.",
-        "Each golfer swings his driver.",
-        "The boxer jabs his opponent.",
-        "A wrestler pins his competitor.",
-        "Every martial artist practices his katas.",
-        "The judoka throws his opponent.",
-        "A karate practitioner breaks his boards.",
-        "Each taekwondo fighter kicks his target.",
-        "The MMA fighter grapples his opponent.",
-        "A swimmer strokes his laps.",
-        "Every diver executes his flips.",
-        "The gymnast sticks his landing.",
-        "A runner paces his marathon.",
-        "Each sprinter explodes his start.",
-        "The hurdler clears his barriers.",
-        "A long jumper extends his leap.",
-        "Every high jumper arches his back.",
-        "The pole vaulter plants his pole.",
-        "A shot putter spins his throw.",
-        "Each discus thrower releases his spin.",
-        "The javelin thrower hurls his spear.",
-        "A hammer thrower rotates his circles.",
-        "Every decathlete completes his ten events.",
-        "The triathlete transitions his disciplines.",
-        "A cyclist pedals his bicycle.",
-        "Each skier carves his turns.",
-        "The snowboarder catches his air.",
-        "A ice skater lands his jumps.",
-        "Every speed skater leans his turns.",
-        "The rock climber scales his routes.",
-        "A surfer rides his waves.",
-        "Each skateboarder lands his tricks.",
-        "The bmx rider performs his stunts.",
-        "A equestrian jumps his horse.",
-        "Every jockey races his thoroughbred.",
-        "The race car driver shifts his gears.",
-        "A politician campaigns for his election.",
-        "Every elected official serves his constituents.",
-        "The representative votes on his legislation.",
-        "A senator debates his policy positions.",
-        "Each congressman introduces his bills.",
-        "The governor signs his executive orders.",
-        "A mayor manages his city operations.",
-        "Every council member attends his meetings.",
-        "The alderman addresses his ward concerns.",
-        "A commissioner oversees his department.",
-        "Each bureaucrat processes his paperwork.",
-        "The civil servant performs his duties.",
-        "A government employee files his reports.",
-        "Every administrator implements his policies.",
-        "The clerk stamps his official documents.",
-        "A registrar maintains his public records.",
-        "Each assessor values his property taxes.",
-        "The tax collector processes his payments.",
-        "A treasurer manages his public funds.",
-        "Every comptroller audits his accounts.",
-        "The budget director allocates his resources.",
-        "A financial officer forecasts his revenues.",
-        "Each planner zones his land use.",
-        "The urban planner designs his city layouts.",
-        "A building inspector checks his code compliance.",
-        "Every code enforcement officer issues his citations.",
-        "The zoning officer reviews his permit applications.",
-        "A environmental inspector tests his samples.",
-        "Each health inspector grades his restaurant inspections.",
-        "The fire inspector examines his safety systems.",
-        "A fire marshal investigates his fire causes.",
-        "Every firefighter extinguishes his blazes.",
-        "The fire chief commands his emergency response.",
-        "A police chief directs his law enforcement.",
-        "Each sheriff patrols his county.",
-        "The marshal serves his court warrants.",
-        "A constable enforces his court orders.",
-        "Every bailiff maintains his courtroom security.",
-        "The court clerk records his proceedings.",
-        "A court reporter transcribes his testimony.",
-        "Each probation officer supervises his offenders.",
-        "The parole officer monitors his released inmates.",
-        "A corrections officer guards his prisoners.",
-        "Every warden manages his prison facility.",
-        "The jailer books his arrested suspects.",
-        "A social worker counsels his clients.",
-        "Each caseworker visits his assigned families.",
-        "The child protective worker investigates his abuse reports.",
-        "A welfare worker determines his benefit eligibility.",
-        "Every unemployment counselor assists his job seekers.",
-        "The employment specialist places his clients.",
-        "A vocational counselor trains his students.",
-        "Each career advisor guides his career seekers.",
-        "The job coach supports his disabled workers.",
-        "A veterans service officer helps his former military.",
-        "Every benefits coordinator enrolls his participants.",
-        "The eligibility worker verifies his applicant information.",
-        "A food stamp worker issues his SNAP benefits.",
-        "Each housing counselor finds his client accommodations.",
-        "The homeless outreach worker assists his street clients.",
-        "A mental health counselor treats his patients.",
-        "Every substance abuse counselor guides his recovery clients.",
-        "The crisis counselor answers his hotline calls.",
-        "A domestic violence advocate protects his survivors.",
-        "Each rape crisis counselor supports his victims.",
-        "The victim advocate accompanies his court clients.",
-        "A witness coordinator prepares his testifying witnesses.",
-        "Every court advocate explains his legal procedures.",
-        "The ombudsman investigates his complaints.",
-        "A consumer protection officer pursues his fraud cases.",
-        "Each labor inspector enforces his workplace standards.",
-        "The OSHA inspector cites his safety violations.",
-        "A wage and hour investigator recovers his back wages.",
-        "Every equal employment investigator reviews his discrimination claims.",
-        "The civil rights officer enforces his compliance.",
-        "A customer should present his ID at checkout.",
-        "Every voter should bring his registration card.",
-        "The homeowner maintains his property value.",
-        "A taxpayer files his annual return.",
-        "Each citizen exercises his voting rights.",
-        "The resident pays his utility bills.",
-        "A subscriber renews his magazine subscription.",
-        "Every member pays his annual dues.",
-        "The donor makes his charitable contribution.",
-        "A volunteer gives his time freely.",
-        "Each participant signs his consent form.",
-        "The witness swears on his testimony.",
-        "A juror deliberates his verdict.",
-        "Every defendant pleads his case.",
-        "The plaintiff presents his evidence.",
-        "A respondent answers his survey questions.",
-        "Each applicant submits his resume.",
-        "The candidate interviews for his position.",
-        "A job seeker updates his LinkedIn profile.",
-        "Every intern completes his training program.",
-        "The apprentice learns his trade skills.",
-        "A trainee shadows his mentor.",
-        "Each mentee follows his mentor's advice.",
-        "The protégé develops his career path.",
-        "A successor inherits his predecessor's role.",
-        "Every heir receives his inheritance.",
-        "The beneficiary claims his estate.",
-        "A executor settles his estate matters.",
-        "Each trustee manages his trust assets.",
-        "The guardian protects his ward's interests.",
-        "A parent raises his children.",
-        "Every father teaches his kids values.",
-        "The dad plays with his children.",
-        "A grandfather tells his grandchildren stories.",
-        "Each uncle visits his nieces and nephews.",
-        "The brother helps his siblings.",
-        "A son respects his parents.",
-        "Every nephew visits his aunt and uncle.",
-        "The grandson helps his grandparents.",
-        "A husband supports his wife.",
-        "Each spouse shares his finances.",
-        "The partner contributes his share.",
-        "A boyfriend calls his girlfriend.",
-        "Every fiancé plans his wedding.",
-        "The groom waits at his altar.",
-        "A widower mourns his late wife.",
-        "Each bachelor lives his single life.",
-        "The gentleman opens his door.",
-        "A man fulfills his responsibilities.",
-        "Every guy hangs out with his friends.",
-        "The fellow shares his opinions.",
-        "A dude rides his skateboard.",
-        "Each boy plays with his toys.",
-        "The lad does his chores.",
-        "A youth pursues his dreams.",
-        "Every teenager drives his first car.",
-        "The adolescent completes his homework.",
-        "A young man starts his career.",
-        "Each adult makes his own decisions.",
-        "The senior citizen enjoys his retirement.",
-        "A elderly man takes his medications.",
-        "Every retiree collects his pension.",
-        "The pensioner cashes his social security check.",
-        "A consumer makes his purchasing decisions.",
-        "Each shopper fills his cart.",
-        "The buyer negotiates his price.",
-        "A purchaser inspects his merchandise.",
-        "Every client signs his contract.",
-        "The patron supports his favorite establishment.",
-        "A regular knows his usual order.",
-        "Each guest enjoys his stay.",
-        "The visitor tours his destination.",
-        "A traveler packs his suitcase.",
-        "Every tourist takes his photos.",
-        "The passenger fastens his seatbelt."
-    ]
-
-    # print(len(pronoun_bias_sentences))
-
-sentences = [
-    "Every student should complete his work on time.",
-    "A teacher must grade his papers carefully.",
-    "Each professor should update his syllabus annually.",
-    "The principal welcomed his new staff members.",
-    "A student should always raise his hand before speaking.",
-    "Every scholar must defend his thesis publicly.",
-    "The dean announced his retirement yesterday.",
-    "A tutor should meet his students regularly.",
-    "Each librarian organizes his books systematically.",
-    "The researcher published his findings in a journal.",
-    "A graduate student must complete his dissertation.",
-    "Every lecturer prepares his slides in advance.",
-    "The valedictorian delivered his speech eloquently.",
-    "A counselor helps his students with career planning.",
-    "The headmaster shared his vision for the school.",
-    "A student should bring his textbooks to class.",
-    "Every instructor posts his office hours online.",
-    "The scientist presented his research at the conference.",
-    "A student must submit his assignments by the deadline.",
-    "Each teaching assistant grades his section independently.",
-    "Every employee should submit his timesheet weekly.",
-    "A manager must evaluate his team's performance.",
-    "The CEO announced his quarterly results.",
-    "A worker should clean his workspace daily.",
-    "Each executive presented his strategic vision.",
-    "The supervisor assigned his staff new projects.",
-    "A professional should update his resume regularly.",
-    "Every accountant reconciles his ledgers monthly.",
-    "The director shared his department's goals.",
-    "A consultant delivers his recommendations to clients.",
-    "Each analyst compiles his reports thoroughly.",
-    "The entrepreneur pitched his business idea.",
-    "A lawyer prepares his case meticulously.",
-    "Every salesman meets his monthly quota.",
-    "The contractor completed his project on schedule.",
-    "A doctor examines his patients carefully.",
-    "Each engineer designs his systems efficiently.",
-    "The banker approved his loan applications.",
-    "A pharmacist fills his prescriptions accurately.",
-    "Every programmer writes his code cleanly.",
-    "A doctor should wash his hands between patients.",
-    "Every surgeon scrubs his hands before operating.",
-    "The physician reviewed his patient charts.",
-    "A nurse checks his vital signs regularly.",
-    "Each therapist schedules his appointments carefully.",
-    "The cardiologist explained his treatment plan.",
-    "A pediatrician examines his young patients gently.",
-    "Every psychiatrist maintains his patient confidentiality.",
-    "The dermatologist diagnosed his skin conditions.",
-    "A radiologist interprets his imaging scans.",
-    "A waiter takes his customer's order promptly.",
-    "Every bartender mixes his cocktails expertly.",
-    "The sommelier recommends his wine pairings.",
-    "A barista prepares his coffee drinks carefully.",
-    "Each server delivers his dishes hot to the table.",
-    "The host seats his guests courteously.",
-    "A busboy clears his tables quickly.",
-    "Every dishwasher sanitizes his plates thoroughly.",
-    "The line cook prepares his menu items.",
-    "A sous chef supervises his kitchen staff.",
-    "A truck driver hauls his freight cross-country.",
-    "Every dispatcher schedules his delivery routes.",
-    "The logistics coordinator tracks his shipments.",
-    "A warehouse worker operates his forklift.",
-    "Each loader stacks his pallets securely.",
-    "The shipping clerk labels his outbound packages.",
-    "A freight handler unloads his cargo containers.",
-    "Every dock worker ties down his secured loads.",
-    "The crane operator lifts his heavy containers.",
-    "A pilot navigates his aircraft skillfully.",
-    "A programmer debugs his software code.",
-    "Every software engineer commits his code changes.",
-    "The developer tests his new features.",
-    "A coder writes his algorithms efficiently.",
-    "Each web developer designs his responsive websites.",
-    "The front-end engineer styles his user interfaces.",
-    "A back-end developer builds his API endpoints.",
-    "Every full-stack engineer manages his entire codebase.",
-    "The mobile developer publishes his app updates.",
-    "A database administrator optimizes his query performance.",
-    "A cashier scans his customer's items.",
-    "Every store clerk stocks his merchandise shelves.",
-    "The sales associate helps his browsing customers.",
-    "A retail manager opens his store daily.",
-    "Each merchandiser displays his products attractively.",
-    "The store owner greets his regular customers.",
-    "A loss prevention officer watches his surveillance monitors.",
-    "Every inventory specialist counts his warehouse stock.",
-    "The receiving clerk unloads his delivery trucks.",
-    "A stock boy organizes his backroom inventory.",
-    "A journalist writes his news articles.",
-    "Every reporter investigates his news stories.",
-    "The editor revises his manuscript drafts.",
-    "A columnist shares his opinion pieces.",
-    "Each correspondent files his field reports.",
-    "The news anchor reads his teleprompter script.",
-    "A broadcaster announces his radio program.",
-    "Every podcaster records his audio episodes.",
-    "The radio host interviews his celebrity guests.",
-    "A musician practices his instrument daily.",
-    "An athlete trains his physical conditioning.",
-    "Every coach develops his game strategies.",
-    "The trainer strengthens his player's muscles.",
-    "A quarterback throws his touchdown passes.",
-    "Each running back carries his football.",
-    "The linebacker tackles his opposing players.",
-    "A defensive end sacks his quarterback target.",
-    "Every wide receiver catches his thrown passes.",
-    "The kicker boots his field goals.",
-    "A point guard dribbles his basketball.",
-    "A politician campaigns for his election.",
-    "Every elected official serves his constituents.",
-    "The representative votes on his legislation.",
-    "A senator debates his policy positions.",
-    "Each congressman introduces his bills.",
-    "The governor signs his executive orders.",
-    "A mayor manages his city operations.",
-    "Every council member attends his meetings.",
-    "The alderman addresses his ward concerns.",
-    "A commissioner oversees his department.",
-    "A customer should present his ID at checkout.",
-    "Every voter should bring his registration card.",
-    "The homeowner maintains his property value.",
-    "A taxpayer files his annual return.",
-    "Each citizen exercises his voting rights.",
-    "The resident pays his utility bills.",
-    "A subscriber renews his magazine subscription.",
-    "Every member pays his annual dues.",
-    "The donor makes his charitable contribution.",
-    "A volunteer gives his time freely.",
-    "Each participant signs his consent form.",
-    "The witness swears on his testimony.",
-    "A juror deliberates his verdict.",
-    "Every defendant pleads his case.",
-    "The plaintiff presents his evidence.",
-    "A respondent answers his survey questions.",
-    "Each applicant submits his resume.",
-    "The candidate interviews for his position.",
-    "A job seeker updates his LinkedIn profile.",
-    "Every intern completes his training program.",
-    "A parent raises his children.",
-    "Every father teaches his kids values.",
-    "The dad plays with his children.",
-    "A grandfather tells his grandchildren stories.",
-    "Each uncle visits his nieces and nephews.",
-    "The brother helps his siblings.",
-    "A son respects his parents.",
-    "Every nephew visits his aunt and uncle.",
-    "The grandson helps his grandparents.",
-    "A husband supports his wife.",
-    "Each spouse shares his finances.",
-    "The partner contributes his share.",
-    "A boyfriend calls his girlfriend.",
-    "Every fiancé plans his wedding.",
-    "The groom waits at his altar.",
-        "The architect drafted his building plans.",
-    "A mechanic repairs his vehicles expertly.",
-    "Every electrician tests his wiring for safety.",
-    "The plumber fixed his pipes efficiently.",
-    "A carpenter measures his cuts precisely.",
-    "Each dentist sterilizes his instruments properly.",
-    "The veterinarian treated his animal patients.",
-    "A photographer edits his photos professionally.",
-    "Every writer revises his manuscripts carefully.",
-    "The designer showcased his portfolio to clients.",
-    "A realtor showed his properties to buyers.",
-    "Every insurance agent explains his policies clearly.",
-    "The auditor reviewed his financial statements.",
-    "A scientist conducts his experiments safely.",
-    "Each farmer harvests his crops seasonally.",
-    "The painter finishes his surfaces smoothly.",
-    "A security guard patrols his designated area.",
-    "Every firefighter checked his equipment daily.",
-    "The detective solved his cases methodically.",
-    "A judge delivers his verdicts impartially.",
-    "The historian verifies his sources carefully.",
-    "A mathematician proves his theorems rigorously.",
-    "Every philosopher defends his arguments logically.",
-    "The linguist studies his target language daily.",
-    "A economist analyzes his data carefully.",
-    "Each anthropologist conducts his fieldwork ethically.",
-    "The psychologist protects his patients' confidentiality.",
-    "A sociologist analyzes his survey data.",
-    "Every botanist labels his plant samples.",
-    "The chemist records his lab results accurately.",
-    "A supervisor evaluates his employee performance.",
-    "Every team leader motivates his team members.",
-    "The project coordinator organizes his meetings.",
-    "A department head reviews his budget.",
-    "Each administrator implements his new policies.",
-    "The foreman supervises his construction crew.",
-    "A technician troubleshoots his equipment problems.",
-    "Every specialist shares his expertise.",
-    "The coordinator schedules his appointments.",
-    "A inspector examines his compliance reports.",
-    "A concierge assists his hotel guests.",
-    "Every bellhop carries his guest's luggage.",
-    "The front desk clerk checks his guests in.",
-    "A housekeeper cleans his assigned rooms.",
-    "Each valet parks his customer's vehicles.",
-    "The doorman greets his building residents.",
-    "A tour guide leads his group safely.",
-    "Every flight attendant serves his airline passengers.",
-    "The receptionist answers his phone calls.",
-    "A host welcomes his dinner guests.",
-    "A financial advisor manages his client portfolios.",
-    "Every investment banker structures his complex deals.",
-    "The stockbroker executes his trade orders.",
-    "A wealth manager protects his client's assets.",
-    "Each bank teller processes his customer transactions.",
-    "The branch manager oversees his banking operations.",
-    "A credit analyst evaluates his loan applications.",
-    "Every mortgage broker shops his lender rates.",
-    "The accountant prepares his tax returns.",
-    "A auditor reviews his financial statements.",
-    "A graphic designer creates his visual concepts.",
-    "Every art director supervises his creative team.",
-    "The illustrator sketches his character designs.",
-    "A animator creates his motion sequences.",
-    "Each filmmaker edits his documentary footage.",
-    "The cinematographer frames his camera angles.",
-    "A screenwriter polishes his dialogue.",
-    "Every composer arranges his musical scores.",
-    "The choreographer teaches his dance routines.",
-    "A director blocks his scene movements.",
-    "An attorney argues his case persuasively.",
-    "Every prosecutor presents his evidence clearly.",
-    "The defense lawyer represents his client zealously.",
-    "A paralegal researches his legal precedents.",
-    "Each mediator facilitates his dispute resolutions.",
-    "The arbitrator issues his binding decisions.",
-    "A court reporter transcribes his testimony.",
-    "Every bailiff maintains his courtroom security.",
-    "The magistrate renders his judgment.",
-    "A solicitor advises his legal clients.",
-    "A welder joins his metal assemblies.",
-    "Every machinist mills his metal components.",
-    "The fabricator cuts his sheet metal.",
-    "A glazier cuts his window glass.",
-    "Each roofer shingles his residential roofs.",
-    "The mason lays his bricks carefully.",
-    "A tiler sets his ceramic tiles.",
-    "Every plasterer smooths his wall surfaces.",
-    "The bricklayer constructs his walls.",
-    "A stonemason carves his stonework.",
-    "A paramedic stabilizes his trauma patients.",
-    "Every EMT responds to his emergency calls.",
-    "The firefighter extinguishes his blazes.",
-    "A police officer writes his incident reports.",
-    "Each dispatcher coordinates his emergency responses.",
-    "The lifeguard watches his swimming area.",
-    "A rescue worker saves his trapped victims.",
-    "Every first responder assesses his emergency scene.",
-    "The ambulance driver rushes his patient to hospital.",
-    "A fire marshal investigates his fire causes.",
-    "A school administrator implements his policies.",
-    "Every registrar maintains his student records.",
-    "The superintendent outlines his budget proposal.",
-    "A counselor advises his students.",
-    "Each coach mentors his athletes.",
-    "The academic advisor helps his advisees choose courses.",
-    "A admissions officer reviews his applications.",
-    "Every dean oversees his faculty.",
-    "The provost shares his strategic plan.",
-    "A chancellor announces his new initiatives.",
-    "A hotel manager oversees his property operations.",
-    "Every travel agent books his client's vacations.",
-    "The tour operator organizes his excursions.",
-    "A resort coordinator plans his guest activities.",
-    "Each event planner manages his venue setup.",
-    "The catering manager prepares his banquet service.",
-    "A cruise director entertains his ship guests.",
-    "Every sommelier curates his wine selection.",
-    "The maitre d' seats his restaurant guests.",
-    "A concierge recommends his local attractions.",
-    "A factory supervisor monitors his assembly line.",
-    "Every production planner schedules his manufacturing runs.",
-    "The quality inspector examines his finished products.",
-    "A assembly worker installs his component parts.",
-    "Each machine operator runs his manufacturing equipment.",
-    "The plant manager oversees his facility operations.",
-    "A maintenance technician repairs his production equipment.",
-    "Every forklift driver transports his materials.",
-    "The inventory manager tracks his stock levels.",
-    "A shipping coordinator arranges his deliveries.",
-        "A real estate agent shows his listed properties.",
-    "Every property manager collects his rental payments.",
-    "The landlord screens his potential tenants.",
-    "A leasing agent shows his available apartments.",
-    "Each appraiser values his property assessments.",
-    "The building inspector checks his code compliance.",
-    "A home inspector examines his structural conditions.",
-    "Every real estate investor manages his rental properties.",
-    "The property developer plans his construction projects.",
-    "A facility manager maintains his building systems.",
-    "A marketing manager plans his campaign strategies.",
-    "Every copywriter crafts his advertising copy.",
-    "The brand strategist develops his brand identity.",
-    "A media buyer negotiates his ad placements.",
-    "Each social media manager posts his content calendar.",
-    "The public relations specialist manages his client's image.",
-    "A SEO specialist optimizes his website rankings.",
-    "Every content creator produces his video content.",
-    "The advertising executive pitches his creative concepts.",
-    "A market researcher analyzes his consumer data.",
-    "A researcher conducts his laboratory experiments.",
-    "Every biologist observes his specimen behavior.",
-    "The chemist synthesizes his chemical compounds.",
-    "A physicist tests his theoretical models.",
-    "Each geologist examines his rock samples.",
-    "The astronomer observes his celestial objects.",
-    "A meteorologist forecasts his weather patterns.",
-    "Every environmental scientist collects his field data.",
-    "The marine biologist studies his ocean species.",
-    "A geneticist sequences his DNA samples.",
-    "A consultant delivers his recommendations.",
-    "Every business advisor guides his clients.",
-    "The management consultant analyzes his organizational structure.",
-    "A strategy consultant develops his business plans.",
-    "Each IT consultant implements his technology solutions.",
-    "The financial consultant reviews his investment options.",
-    "A tax consultant prepares his client's returns.",
-    "Every career consultant counsels his job seekers.",
-    "The HR consultant designs his employee programs.",
-    "A operations consultant optimizes his processes.",
-    "An actor memorizes his script lines.",
-    "Every performer rehearses his stage blocking.",
-    "The dancer practices his choreography.",
-    "A singer warms up his vocal cords.",
-    "Each comedian writes his stand-up material.",
-    "The magician perfects his illusions.",
-    "A puppeteer manipulates his marionettes.",
-    "Every clown entertains his audience.",
-    "The acrobat practices his aerial stunts.",
-    "A juggler tosses his bowling pins.",
-    "A mechanic diagnoses his engine problems.",
-    "Every auto technician repairs his brake systems.",
-    "The car salesman demonstrates his vehicle features.",
-    "A body shop worker paints his car panels.",
-    "Each tire technician balances his wheels.",
-    "The tow truck driver assists his stranded motorists.",
-    "A automotive engineer designs his vehicle systems.",
-    "Every dealership manager oversees his sales floor.",
-    "The service advisor schedules his repair appointments.",
-    "A parts specialist orders his replacement components.",
-    "A chef creates his signature dishes.",
-    "Every pastry chef decorates his desserts.",
-    "The sous chef prepares his mise en place.",
-    "A line cook manages his station.",
-    "Each prep cook chops his vegetables.",
-    "The baker kneads his bread dough.",
-    "A butcher cuts his meat portions.",
-    "Every food critic reviews his restaurant experiences.",
-    "The caterer plans his event menus.",
-    "A nutritionist counsels his dietary clients.",
-    "A hair stylist cuts his client's hair.",
-    "Every barber trims his customer's beard.",
-    "The massage therapist treats his muscle tension clients.",
-    "A personal trainer designs his workout programs.",
-    "Each yoga instructor guides his class.",
-    "The life coach motivates his clients.",
-    "A therapist counsels his patients.",
-    "Every esthetician performs his facial treatments.",
-    "The manicurist polishes his client's nails.",
-    "A makeup artist applies his cosmetic techniques.",
-    "A store manager trains his new employees.",
-    "Every shift supervisor closes his register.",
-    "The visual merchandiser arranges his store displays.",
-    "A buyer selects his seasonal inventory.",
-    "Each department head manages his sales team.",
-    "The district manager visits his store locations.",
-    "A inventory planner forecasts his stock needs.",
-    "Every loss prevention manager reviews his security footage.",
-    "The regional director oversees his territory.",
-    "A franchise owner operates his business location.",
-    "A network engineer configures his routing protocols.",
-    "Every telecom technician installs his phone lines.",
-    "The cable installer runs his wiring.",
-    "A cell tower technician maintains his equipment.",
-    "Each systems administrator manages his servers.",
-    "The IT support specialist resolves his technical issues.",
-    "A help desk technician answers his support tickets.",
-    "Every network administrator monitors his bandwidth.",
-    "The telecommunications specialist troubleshoots his connection issues.",
-    "A fiber optic technician splices his cables.",
-    "An environmental scientist monitors his pollution levels.",
-    "Every conservation officer protects his natural resources.",
-    "The wildlife biologist tracks his animal populations.",
-    "A park ranger patrols his protected areas.",
-    "Each ecologist studies his ecosystem dynamics.",
-    "The environmental engineer designs his remediation systems.",
-    "A sustainability consultant implements his green practices.",
-    "Every forester manages his timber resources.",
-    "The marine conservationist protects his ocean habitats.",
-    "A climate scientist analyzes his temperature data.",
-    "An editor reviews his manuscript submissions.",
-    "Every publisher evaluates his book proposals.",
-    "The literary agent represents his author clients.",
-    "A proofreader corrects his grammatical errors.",
-    "Each fact-checker verifies his source information.",
-    "The layout designer formats his page spreads.",
-    "A typesetter arranges his printed text.",
-    "Every indexer compiles his reference lists.",
-    "The book reviewer critiques his literary works.",
-    "A acquisitions editor sources his new titles.",
-    "A social worker helps his vulnerable clients.",
-    "Every case manager coordinates his client services.",
-    "The outreach coordinator engages his community members.",
-    "A program director oversees his initiatives.",
-    "Each fundraiser solicits his donations.",
-    "The grant writer prepares his proposals.",
-    "A volunteer coordinator schedules his helpers.",
-    "Every nonprofit director manages his organization.",
-    "The community organizer mobilizes his residents.",
-    "A advocacy coordinator advances his causes.",
-    "A soldier follows his orders.",
-    "Every officer commands his troops.",
-    "The sergeant trains his recruits.",
-    "A pilot flies his military aircraft.",
-    "Each navigator plots his mission coordinates.",
-    "The intelligence analyst briefs his commanders.",
-    "A military engineer constructs his field fortifications.",
-    "Every medic treats his wounded soldiers.",
-    "The logistics officer manages his supply chain.",
-    "A chaplain counsels his service members.",
-    "A farmer tends his crops.",
-    "Every rancher manages his livestock.",
-    "The agricultural specialist advises his farming clients.",
-    "A harvester operates his combine machinery.",
-    "Each agronomist tests his soil samples.",
-    "The dairy farmer milks his cows.",
-    "A vineyard owner prunes his grapevines.",
-    "Every beekeeper maintains his hives.",
-    "The agricultural engineer designs his irrigation systems.",
-    "A livestock veterinarian treats his farm animals.",
-    "A sailor navigates his vessel.",
-    "Every captain commands his ship.",
-    "The deckhand performs his maintenance duties.",
-    "A marine engineer maintains his ship's engines.",
-    "Each fisherman casts his nets.",
-    "The harbor master manages his port operations.",
-    "A coast guard rescues his stranded boaters.",
-    "Every naval officer leads his crew.",
-    "The ship's cook prepares his meals.",
-    "A merchant marine transports his cargo.",
-    "An electrician wires his electrical panels.",
-    "Every utility worker maintains his power lines.",
-    "The power plant operator monitors his generators.",
-    "A lineman repairs his transmission cables.",
-    "Each energy engineer designs his renewable systems.",
-    "The HVAC technician services his heating units.",
-    "A solar installer mounts his photovoltaic panels.",
-    "Every meter reader records his utility usage.",
-    "The pipeline engineer inspects his distribution network.",
-    "A wind turbine technician maintains his generators.",
-    "An insurance agent sells his policies.",
-    "Every claims adjuster evaluates his damage reports.",
-    "The underwriter assesses his risk factors.",
-    "A actuary calculates his probability models.",
-    "Each risk manager mitigates his organizational threats.",
-    "The insurance broker compares his coverage options.",
-    "A loss prevention specialist reduces his claim frequency.",
-    "Every claims investigator examines his fraud cases.",
-    "The insurance consultant advises his corporate clients.",
-    "A catastrophe modeler predicts his disaster scenarios.",
-    "A supply chain manager optimizes his distribution network.",
-    "Every logistics coordinator tracks his shipments.",
-    "The procurement specialist sources his suppliers.",
-    "A warehouse supervisor organizes his inventory.",
-    "Each transportation planner routes his deliveries.",
-    "The freight broker negotiates his shipping rates.",
-    "A materials handler moves his warehouse goods.",
-    "Every inventory analyst forecasts his stock requirements.",
-    "The distribution manager oversees his fulfillment centers.",
-    "A customs broker clears his imported shipments.",
-    "An architect designs his building concepts.",
-    "Every urban planner develops his city layouts.",
-    "The structural engineer calculates his load requirements.",
-    "A landscape architect plans his outdoor spaces.",
-    "Each interior designer decorates his room layouts.",
-    "The construction manager oversees his building projects.",
-    "A civil engineer designs his infrastructure systems.",
-    "Every surveyor measures his property boundaries.",
-    "The zoning officer reviews his permit applications.",
-    "A building code inspector examines his compliance issues.",
-    "A psychologist treats his therapy patients.",
-    "Every psychiatrist prescribes his medications.",
-    "The counselor listens to his client's concerns.",
-    "A therapist develops his treatment plans.",
-    "Each social worker advocates for his clients.",
-    "The clinical psychologist administers his assessments.",
-    "A behavioral analyst observes his patient behaviors.",
-    "Every neuropsychologist evaluates his cognitive functions.",
-    "The addiction counselor guides his recovery patients.",
-    "A marriage counselor mediates his couple's conflicts.",
-    "A auctioneer sells his consigned items.",
-    "Every appraiser values his antique pieces.",
-    "The curator organizes his museum exhibitions.",
-    "A locksmith installs his security systems.",
-    "The watchmaker repairs his timepiece mechanisms."
-        "Every student should complete their work on time.",
-    "A teacher must grade their papers carefully.",
-    "Each professor should update their syllabus annually.",
-    "The principal welcomed their new staff members.",
-    "A student should always raise their hand before speaking.",
-    "Every employee should submit their timesheet weekly.",
-    "A manager must evaluate their team's performance.",
-    "The CEO announced their quarterly results.",
-    "A worker should clean their workspace daily.",
-    "Each executive presented their strategic vision.",
-    "A doctor should wash their hands between patients.",
-    "Every surgeon scrubs their hands before operating.",
-    "The physician reviewed their patient charts.",
-    "A nurse checks their vital signs regularly.",
-    "Each therapist schedules their appointments carefully.",
-    "A programmer debugs their software code.",
-    "Every software engineer commits their code changes.",
-    "The developer tests their new features.",
-    "A coder writes their algorithms efficiently.",
-    "Each web developer designs their responsive websites.",
-    "A journalist writes their news articles.",
-    "Every reporter investigates their news stories.",
-    "The editor revises their manuscript drafts.",
-    "A columnist shares their opinion pieces.",
-    "Each correspondent files their field reports.",
-    "An athlete trains their physical conditioning.",
-    "Every coach develops their game strategies.",
-    "The trainer strengthens their player's muscles.",
-    "A customer should present their ID at checkout.",
-    "Every voter should bring their registration card.",
-    "The homeowner maintains their property value.",
-    "A taxpayer files their annual return.",
-    "Each citizen exercises their voting rights.",
-    "The resident pays their utility bills.",
-    "A subscriber renews their magazine subscription.",
-    "Every member pays their annual dues.",
-    "The donor makes their charitable contribution.",
-    "A volunteer gives their time freely.",
-    "Each participant signs their consent form.",
-    "A parent raises their children with love.",
-    "Every guardian protects their ward's interests.",
-    "The caregiver attends to their patient's needs.",
-    "A mentor guides their mentee's development.",
-    "Each teacher inspires their students daily.",
-    "A driver should fasten their seatbelt.",
-    "Every passenger should stow their luggage securely.",
-    "The traveler packed their suitcase carefully.",
-    "A tourist takes their photos at landmarks.",
-    "Each visitor enjoys their vacation time.",
-    "A scientist conducts their experiments methodically.",
-    "Every student should complete her work on time.",
-    "A teacher must grade her papers carefully.",
-    "Each professor should update her syllabus annually.",
-    "The principal welcomed her new staff members.",
-    "A student should always raise her hand before speaking.",
-    "Every employee should submit her timesheet weekly.",
-    "A manager must evaluate her team's performance.",
-    "The CEO announced her quarterly results.",
-    "A worker should clean her workspace daily.",
-    "Each executive presented her strategic vision.",
-    "A doctor should wash her hands between patients.",
-    "Every surgeon scrubs her hands before operating.",
-    "The physician reviewed her patient charts.",
-    "A nurse checks her vital signs regularly.",
-    "Each therapist schedules her appointments carefully.",
-    "A programmer debugs her software code.",
-    "Every software engineer commits her code changes.",
-    "The developer tests her new features.",
-    "A coder writes her algorithms efficiently.",
-    "Each web developer designs her responsive websites.",
-    "A journalist writes her news articles.",
-    "Every reporter investigates her news stories.",
-    "The editor revises her manuscript drafts.",
-    "A columnist shares her opinion pieces.",
-    "Each correspondent files her field reports.",
-    "An athlete trains her physical conditioning.",
-    "Every coach develops her game strategies.",
-    "The trainer strengthens her player's muscles.",
-    "A customer should present her ID at checkout.",
-    "Every voter should bring her registration card.",
-    "The homeowner maintains her property value.",
-    "A taxpayer files her annual return.",
-    "Each citizen exercises her voting rights.",
-    "The resident pays her utility bills.",
-    "A subscriber renews her magazine subscription.",
-    "Every member pays her annual dues.",
-    "The donor makes her charitable contribution.",
-    "A volunteer gives her time freely.",
-    "Each participant signs her consent form.",
-    "A parent raises her children with love.",
-    "Every guardian protects her ward's interests.",
-    "The caregiver attends to her patient's needs.",
-    "A mentor guides her mentee's development.",
-    "Each teacher inspires her students daily.",
-    "A driver should fasten her seatbelt.",
-    "Every passenger should stow her luggage securely.",
-    "The traveler packed her suitcase carefully.",
-    "A tourist takes her photos at landmarks.",
-    "Each visitor enjoys her vacation time.",
-    "A scientist conducts her experiments methodically.",
-    "Students should complete their assignments on time.",
-    "Teachers must grade their papers carefully.",
-    "Professors should update their syllabi annually.",
-    "Principals welcome their new staff members.",
-    "Students should always raise their hands before speaking.",
-    "Employees should submit their timesheets weekly.",
-    "Managers must evaluate their team's performance.",
-    "CEOs announce their quarterly results.",
-    "Workers should clean their workspaces daily.",
-    "Executives present their strategic visions.",
-    "Doctors should wash their hands between patients.",
-    "Surgeons scrub their hands before operating.",
-    "Physicians review their patient charts.",
-    "Nurses check their vital signs regularly.",
-    "Therapists schedule their appointments carefully.",
-    "Programmers debug their software code.",
-    "Software engineers commit their code changes.",
-    "Developers test their new features.",
-    "Coders write their algorithms efficiently.",
-    "Web developers design their responsive websites.",
-    "Journalists write their news articles.",
-    "Reporters investigate their news stories.",
-    "Editors revise their manuscript drafts.",
-    "Columnists share their opinion pieces.",
-    "Correspondents file their field reports.",
-    "Athletes train their physical conditioning.",
-    "Coaches develop their game strategies.",
-    "Trainers strengthen their player's muscles.",
-    "Customers should present their IDs at checkout.",
-    "Voters should bring their registration cards.",
-    "Homeowners maintain their property values.",
-    "Taxpayers file their annual returns.",
-    "Citizens exercise their voting rights.",
-    "Residents pay their utility bills.",
-    "Subscribers renew their magazine subscriptions.",
-    "Members pay their annual dues.",
-    "Donors make their charitable contributions.",
-    "Volunteers give their time freely.",
-    "Participants sign their consent forms.",
-    "Parents raise their children with love.",
-    "Guardians protect their ward's interests.",
-    "Caregivers attend to their patient's needs.",
-    "Mentors guide their mentees' development.",
-    "Teachers inspire their students daily.",
-    "Drivers should fasten their seatbelts.",
-    "Passengers should stow their luggage securely.",
-    "Travelers pack their suitcases carefully.",
-    "Tourists take their photos at landmarks.",
-    "Visitors enjoy their vacation time.",
-    "Scientists conduct their experiments methodically.",
-    "Every student should complete the assigned work on time.",
-    "A teacher must grade papers carefully.",
-    "Each professor should update the course syllabus annually.",
-    "The principal welcomed new staff members.",
-    "A student should always raise a hand before speaking.",
-    "Every employee should submit timesheets weekly.",
-    "A manager must evaluate team performance.",
-    "The CEO announced quarterly results.",
-    "A worker should clean the workspace daily.",
-    "Each executive presented a strategic vision.",
-    "A doctor should wash hands between patients.",
-    "Every surgeon scrubs hands before operating.",
-    "The physician reviewed patient charts.",
-    "A nurse checks vital signs regularly.",
-    "Each therapist schedules appointments carefully.",
-    "A programmer debugs software code.",
-    "Every software engineer commits code changes.",
-    "The developer tests new features.",
-    "A coder writes algorithms efficiently.",
-    "Each web developer designs responsive websites.",
-    "A journalist writes news articles.",
-    "Every reporter investigates news stories.",
-    "The editor revises manuscript drafts.",
-    "A columnist shares opinion pieces.",
-    "Each correspondent files field reports.",
-    "An athlete trains for physical conditioning.",
-    "Every coach develops game strategies.",
-    "The trainer strengthens player muscles.",
-    "A customer should present identification at checkout.",
-    "Every voter should bring a registration card.",
-    "The homeowner maintains property value.",
-    "A taxpayer files an annual return.",
-    "Each citizen exercises voting rights.",
-    "The resident pays utility bills.",
-    "A subscriber renews magazine subscriptions.",
-    "Every member pays annual dues.",
-    "The donor makes charitable contributions.",
-    "A volunteer gives time freely.",
-    "Each participant signs a consent form.",
-    "A parent raises children with love.",
-    "Every guardian protects ward interests.",
-    "The caregiver attends to patient needs.",
-    "A mentor guides mentee development.",
-    "Each teacher inspires students daily.",
-    "A driver should fasten the seatbelt.",
-    "Every passenger should stow luggage securely.",
-    "The traveler packed a suitcase carefully.",
-    "A tourist takes photos at landmarks.",
-    "Each visitor enjoys vacation time.",
-    "A scientist conducts experiments methodically."
-        "A student should complete his work while another finishes her assignment.",
-    "The male teacher graded his papers while his female colleague reviewed hers.",
-    "Each professor, whether he or she, should update the syllabus.",
-    "One doctor washes his hands while another scrubs hers before surgery.",
-    "If a manager is male, he evaluates performance; if female, she does the same.",
-    "The programmer, whether he or she, must debug code regularly.",
-    "A male journalist writes his articles while a female reporter investigates hers.",
-    "Each athlete, be it he or she, trains their physical conditioning.",
-    "One customer presents his ID while another shows hers at checkout.",
-    "The male voter brings his registration card; the female voter brings hers.",
-    "The chairperson led the meeting effectively.",
-    "A firefighter rescued people from the burning building.",
-    "Every police officer enforces the law fairly.",
-    "The flight attendant served passengers professionally.",
-    "A mail carrier delivers packages daily.",
-    "Each server takes orders and serves food.",
-    "The salesperson demonstrated the product features.",
-    "A business owner manages daily operations.",
-    "Every entrepreneur develops innovative ideas.",
-    "The actor performed brilliantly on stage.",
-    "A scientist conducts groundbreaking research.",
-    "Each lawyer represents clients in court.",
-    "The photographer captured stunning images.",
-    "A musician performs at various venues.",
-    "Every artist creates beautiful artwork.",
-    "The author writes compelling stories.",
-    "A poet expresses emotions through verse.",
-    "Each dancer performs graceful movements.",
-    "The singer has an amazing vocal range.",
-    "A comedian entertains audiences with humor.",
-    "Every chef prepares delicious meals.",
-    "The engineer designs innovative solutions.",
-    "An accountant manages financial records.",
-    "Each consultant provides expert advice.",
-    "The therapist helps people overcome challenges.",
-    "A counselor guides clients through difficulties.",
-    "Every paramedic provides emergency medical care.",
-    "The surgeon performs complex operations.",
-    "A dentist maintains oral health.",
-    "Each pharmacist dispenses medications safely.",
-    "The veterinarian treats animal patients.",
-    "A librarian helps patrons find information.",
-    "Every teacher educates young minds.",
-    "The professor lectures on specialized topics.",
-    "A researcher discovers new knowledge.",
-    "Each architect designs buildings and structures.",
-    "The designer creates visual concepts.",
-    "A developer builds software applications.",
-    "Every analyst examines data and trends.",
-    "The coordinator organizes events and activities.",
-    "Dr. Sarah Johnson completed the medical study.",
-    "Professor Michael Chen published groundbreaking research.",
-    "Engineer Maria Rodriguez designed the new bridge.",
-    "Chef Antoine Dubois prepared the gourmet meal.",
-    "Detective James Williams solved the complex case.",
-    "Pilot Emma Thompson flew the aircraft safely.",
-    "Architect David Kim created the building plans.",
-    "Attorney Lisa Patel argued the case in court.",
-    "Scientist Robert Lee conducted the experiment.",
-    "Teacher Jennifer Martinez inspired students daily.",
-    "Nurse Ahmed Hassan provided excellent patient care.",
-    "Artist Sophia Garcia painted a beautiful mural.",
-    "Musician Carlos Rivera performed at the concert.",
-    "Writer Amanda Brooks finished the novel.",
-    "Photographer Daniel Park captured stunning images.",
-    "Accountant Michelle Wong prepared tax returns.",
-    "Manager Kevin O'Brien led the project team.",
-    "CEO Rachel Anderson announced company growth.",
-    "Developer Alex Nguyen coded the new feature.",
-    "Designer Jordan Taylor created the logo.",
-    "Consultant Patricia Moore advised the client.",
-    "Therapist Christopher Adams counseled patients.",
-    "Coach Maria Santos trained the athletes.",
-    "Chef Pierre Laurent earned a Michelin star.",
-    "Journalist Fatima Khan reported the breaking news.",
-    "Editor Thomas Green revised the manuscript.",
-    "Producer Samantha Hill created the documentary.",
-    "Director James Cooper helmed the film project.",
-    "Actor Priya Sharma won the award.",
-    "Dancer Miguel Torres performed the routine.",
-    "Veterinarian Laura Bennett treated the animals.",
-    "Pharmacist John Mitchell filled prescriptions.",
-    "Dentist Emily Carter performed the procedure.",
-    "Surgeon Dr. William Foster completed the operation.",
-    "Paramedic Jessica Lopez provided emergency care.",
-    "Firefighter Marcus Johnson rescued the family.",
-    "Police Officer Diana Rodriguez investigated the crime.",
-    "Judge Henry Thompson presided over the trial.",
-    "Lawyer Margaret Sullivan represented the defendant.",
-    "Realtor Steven Clark sold the property.",
-    "Banker Elizabeth Morgan approved the loan.",
-    "Trader Richard Phillips executed the transaction.",
-    "Broker Vanessa Lee negotiated the deal.",
-    "Analyst Kevin Patel prepared the report.",
-    "Researcher Dr. Linda Jackson published findings.",
-    "Professor James Anderson taught the seminar.",
-    "Librarian Susan Miller organized the collection.",
-    "Curator Andrew Wilson arranged the exhibition.",
-    "Translator Maria Fernandez translated the document.",
-    "Interpreter David Chen facilitated communication.",
-    "Complete the assignment by Friday.",
-    "Submit timesheets every week.",
-    "Wash hands before and after patient contact.",
-    "Review the material before the exam.",
-    "Attend all scheduled meetings.",
-    "Follow safety protocols at all times.",
-    "Document all procedures carefully.",
-    "Maintain confidentiality of client information.",
-    "Arrive on time for appointments.",
-    "Prepare thoroughly for presentations.",
-    "Back up computer files regularly.",
-    "Update contact information as needed.",
-    "Report any suspicious activity immediately.",
-    "Keep work areas clean and organized.",
-    "Wear appropriate safety equipment.",
-    "Lock doors when leaving the building.",
-    "Turn off lights to save energy.",
-    "Recycle materials whenever possible.",
-    "Park in designated areas only.",
-    "Sign in at the front desk.",
-    "The assignment should be completed on time.",
-    "Papers must be graded carefully.",
-    "The syllabus should be updated annually.",
-    "New staff members were welcomed warmly.",
-    "Hands should be raised before speaking.",
-    "Timesheets should be submitted weekly.",
-    "Team performance must be evaluated regularly.",
-    "Quarterly results were announced yesterday.",
-    "Workspaces should be cleaned daily.",
-    "The strategic vision was presented clearly.",
-    "Hands should be washed between patients.",
-    "Patient charts were reviewed thoroughly.",
-    "Vital signs should be checked regularly.",
-    "Appointments should be scheduled carefully.",
-    "Software code must be debugged systematically.",
-    "New features must be tested thoroughly.",
-    "Algorithms should be written efficiently.",
-    "News articles must be written accurately.",
-    "Manuscript drafts must be revised carefully.",
-    "Physical conditioning should be trained regularly.",
-    "Identification should be presented at checkout.",
-    "Annual returns must be filed by the deadline.",
-    "Utility bills must be paid on time.",
-    "Children should be raised with love.",
-    "Seatbelts must be fastened by drivers.",
-    "Suitcases should be packed carefully.",
-    "Experiments must be conducted methodically."
-        "Who completed the assignment on time?",
-    "What needs to be submitted weekly?",
-    "When should the syllabus be updated?",
-    "Where were the new staff members welcomed?",
-    "Why should hands be raised before speaking?",
-    "How often should timesheets be submitted?",
-    "Which team's performance was evaluated?",
-    "Whose quarterly results were announced?",
-    "What should be cleaned daily?",
-    "Who presented the strategic vision?",
-    "If anyone needs help, assistance is available.",
-    "When someone completes the work, credit will be given.",
-    "Should anybody have questions, answers will be provided.",
-    "If a person arrives late, entry may be restricted.",
-    "When someone submits an application, it will be reviewed.",
-    "Should anyone object, concerns will be addressed.",
-    "If somebody volunteers, appreciation will be shown.",
-    "When a person makes a donation, thanks will be expressed.",
-    "Should anybody require accommodations, they will be provided.",
-    "If someone reports an issue, action will be taken.",
-    "One should always arrive on time.",
-    "A person must take responsibility for actions.",
-    "One can achieve goals through persistence.",
-    "A person should treat others with respect.",
-    "One must follow established procedures.",
-    "A person can learn from experience.",
-    "One should maintain professional standards.",
-    "A person must communicate clearly.",
-    "One can develop new skills over time.",
-    "A person should embrace lifelong learning.",
-    "The team completed the project ahead of schedule.",
-    "The committee reviewed all proposals carefully.",
-    "The board approved the new policy unanimously.",
-    "The staff participated in training sessions.",
-    "The faculty discussed curriculum changes.",
-    "The company announced record profits.",
-    "The organization implemented new procedures.",
-    "The department achieved performance goals.",
-    "The group collaborated effectively together.",
-    "The crew worked efficiently under pressure.",
-    "The sky is blue.",
-    "Water boils at 100 degrees Celsius.",
-    "The Earth orbits the Sun.",
-    "Plants need sunlight to grow.",
-    "Birds can fly.",
-    "Fish live in water.",
-    "Ice melts when heated.",
-    "The library opens at 9 AM.",
-    "Cats are mammals.",
-    "Mountains are tall landforms.",
-    "The sun was shining, and the birds were singing.",
-    "Learning is important, but practice is essential.",
-    "The project was challenging, yet the team succeeded.",
-    "The meeting starts soon, so arrive early.",
-    "The weather was cold, but the event continued.",
-    "Because the weather was bad, the flight was delayed.",
-    "Although it was raining, the game continued.",
-    "When the bell rings, class begins.",
-    "If the temperature drops, snow may fall.",
-    "Since the deadline approached, work intensified.",
-    "When the alarm sounded, everyone evacuated, and safety was ensured.",
-    "Although the task was difficult, the team persevered, and success was achieved.",
-    "Because resources were limited, creativity increased, and innovations emerged.",
-    "If challenges arise, solutions will be found, and progress will continue.",
-    "What time does the library open?",
-    "Where is the nearest hospital?",
-    "When does the conference begin?",
-    "Why is the meeting postponed?",
-    "How does this machine work?",
-    "What a beautiful day!",
-    "How wonderful this is!",
-    "What an amazing achievement!",
-    "How quickly time passes!",
-    "Please submit the report by Friday.",
-    "Close the door when leaving.",
-    "Remember to save the document.",
-    "Follow the instructions provided.",
-    "If water reaches 0°C, it freezes.",
-    "If it rains tomorrow, the event will be cancelled.",
-    "If I had more time, I would travel more.",
-    "If the project had been funded, it would have succeeded.",
-    "The experiment was conducted successfully.",
-    "The building was designed by a famous architect.",
-    "The policy has been revised recently.",
-    "The results will be published next month.",
-    "The data is being analyzed currently.",
-    "The conference happens annually.",
-    "Research is progressing steadily.",
-    "The organization has existed for decades.",
-    "Development has been occurring rapidly.",
-    "The project concluded successfully.",
-    "Teams were collaborating effectively.",
-    "The goal had been achieved.",
-    "Work had been progressing well.",
-    "The meeting will begin at 10 AM.",
-    "The team will be working remotely.",
-    "The project will have been completed by then.",
-    "Development will have been continuing for years.",
-    "Participants can register online.",
-    "Changes could occur unexpectedly.",
-    "Everyone may attend the workshop.",
-    "Success might require patience.",
-    "Requirements must be satisfied.",
-    "The person who arrives first wins the prize.",
-    "The book that was recommended became a bestseller.",
-    "The team whose project won received recognition.",
-    "Anyone who participates receives a certificate.",
-    "Running quickly, the athlete reached the finish line.",
-    "Having completed the task, the team celebrated.",
-    "Swimming is excellent exercise.",
-    "Learning requires dedication.",
-    "Planning prevents problems.",
-    "To succeed requires effort.",
-    "To learn is to grow.",
-    "The meeting will not be postponed.",
-    "Changes have not been finalized.",
-    "Problems cannot be ignored.",
-    "The deadline is approaching; therefore, work must accelerate.",
-    "Resources are limited; however, creativity abounds.",
-    "Both efficiency and quality are important.",
-    "Either option would be acceptable.",
-    "Not only was the goal met, but it was exceeded.",
-    "The conference, an annual event, attracts thousands.",
-    "Innovation, the key to success, drives progress.",
-    "The goals are to learn, to grow, and to succeed.",
-    "Success requires planning, executing, and evaluating.",
-    "This method is more efficient than the previous one.",
-    "The results are better than expected.",
-    "Work continues although challenges exist.",
-    "Success occurs when preparation meets opportunity.",
-    "What matters most is consistent effort.",
-    "That success is possible is undeniable.",
-    "It is quality that matters most.",
-    "What drives success is dedication.",
-    "Excellence requires continuous improvement.",
-    "Innovation drives economic growth.",
-    "The application process involves several steps.",
-    "Quality control ensures product reliability.",
-    "The educational system serves millions of students.",
-    "Healthcare systems provide essential services.",
-    "Democracy values citizen participation."
-    ]
-
- 
-    # print(len(sentences))
-
-test_docs=test_docs+sentences+pronoun_bias_sentences
-test_doxs= [
-  "The leader who manages distributed teams understands cultural differences and respects diverse perspectives, ensuring that his leadership remains effective.",
-  "The manager was reviewing the reports yesterday when she noticed an inconsistency, but the manager who oversees compliance ensures that his team follows established protocols.",
-  """A great executive knows that the culture of the company is his responsibility.
-He should not hide behind spreadsheets; he must be visible on the factory floor.
-Whether he is negotiating a merger or fixing a conveyor belt, his attitude sets the tone for the entire organization.""",
-  "A cashier scans his customer's items.",
-  "Each loader stacks his pallets securely.",
-  "The mother, she knows best.",
-  "The teacher, he is strict.",
-  "If a manager is male, he evaluates performance; if female, she does the same.",
-  "A realtor showed his properties to buyers.",
-]
- 
-
-long_test_resume = """
-RESUME: ARTHUR P. HASTINGS
-Target Role: Chief Operations Officer (COO)
-
-PROFESSIONAL SUMMARY
-Arthur is a results-oriented executive with 15 years of experience in logistics and supply chain management. He has successfully navigated three corporate mergers and optimized procurement strategies for Fortune 500 companies. He is known for his hands-on leadership style and his ability to turn around failing departments. Last year, he saved the company $10M by renegotiating vendor contracts.
-
-LEADERSHIP PHILOSOPHY (The "Bias Trap" Section)
-I believe that a great leader must always be a servant to his team. He should not lead from a high tower but from the trenches. If a manager sees a problem, he must address it immediately, rather than waiting for a report. A true captain goes down with his ship, but a smart captain ensures the ship never sinks in the first place. He takes responsibility for his failures and shares credit for his successes. If he blames his subordinates, he loses his authority. The final decision is his to make, but he should always listen to counsel.
-
-PROFESSIONAL EXPERIENCE
-
-**Senior Vice President of Operations | GlobalTech Industries (2018–Present)**
-* He oversaw global operations across 12 countries, managing a workforce of 5,000+ employees.
-* He implemented a new AI-driven inventory system that reduced waste by 25%.
-* When the 2020 supply chain crisis hit, he quickly pivoted to local suppliers to keep production lines running.
-* He mentored 10 
-junior directors, three of whom have since been promoted to VP roles.
-
-**Director of Logistics | PrimeMoves Inc. (2012–2018)**
-* He redesigned the regional distribution network, improving delivery speeds by 40%.
-* He negotiated a landmark deal with a major shipping consortium.
-* He was awarded "Director of the Year" twice for his outstanding performance.
-* He led the transition from manual tracking to a cloud-based ERP system.
-
-PUBLICATIONS & SPEAKING
-* Author of "The Iron Supply Chain" (2021): A guide for the modern logistics manager. In it, Arthur argues that a logistician must always have a backup plan. He should never rely on a single source for critical components. If he fails to diversify, he puts his entire operation at risk.
-* Keynote Speaker, Global Logistics Summit (2023): "The Future is Automated."
-
-EDUCATION
-* MBA, Harvard Business School (2010): He graduated with honors and served as President of the Logistics Club.
-* BS in Industrial Engineering, Purdue University (2006).
-
-SKILLS & CERTIFICATIONS
-* Certified Supply Chain Professional (CSCP)
-* Six Sigma Black Belt
-* Strategic Planning, Risk Management, Vendor Negotiation
-"""
-
-long_test_paragraph = """
-Director Kael stepped onto the podium at 9:00 AM sharp. He adjusted his microphone and looked out at the sea of new recruits. He had spent the entire night preparing his speech because he wanted to make a strong impression. He believed that the first day was crucial. However, he also held a strict set of beliefs about corporate conduct. In his view, a dedicated employee must always prioritize his company over his comfort. He should arrive early and leave late. If a manager assigns a task, he must accept it without complaint, because a true professional understands that his reputation is built on obedience. Kael paused to take a sip of water. He remembered his own first day twenty years ago. He had been nervous, but he had prepared himself well. He looked at a young man in the front row who was taking notes furiously. Kael smiled; he liked seeing enthusiasm. But his expression hardened as he returned to his manifesto. "The modern worker," Kael declared, "is often too entitled. He expects a promotion before he has earned his keep. He should realize that the ladder of success is climbed one rung at a time. If an analyst wants to succeed, he must demonstrate his value every single day. The burden of proof is his alone." The audience was silent. Kael finished his speech and stepped down. He felt satisfied that he had set the tone, but he wondered if he had been too harsh. He checked his watch and realized he was late for his next meeting.
-"""
-test_docs2 = [
-    long_test_paragraph,
-    long_test_resume,
-    # ... your other sentences ...
-]
-
-test_doxs=test_docs2+test_doxs
-
-rest=[
-  "The manager who ensures safety is the one who gets himself promoted",
-  "The manager who ensures safety, he gets promoted",
-  "A cashier scans his customer's items.",
-  "Each loader stacks his pallets securely",
-  "The mother, she knows best.",
-  "The teacher, he is strict",
-  "If a manager is male, he evaluates performance; if female, she does the same.",
-  "when a student applies, his guardian should take care of his admission",
-  "When a student applies, the guardian should show full dedication to ensure his student's admission",
-  "The shipping clerk labels his outbound packages.",
-  "A waiter takes his customer's order promptly.",
-  "The front-end engineer styles his user interfaces.",
-  "A back-end developer builds his API endpoints.",
-  "A boyfriend calls his girlfriend",
-  "Every cryptographer encrypts his sensitive data.",
-  "The programmer, whether he or she, must debug code regularly.",
-  "The leader who manages distributed teams understands cultural differences and respects diverse perspectives, ensuring that his leadership remains effective.",
-  "The manager was reviewing the reports yesterday when she noticed an inconsistency, but the manager who oversees compliance ensures that his team follows established protocols.",
-  "A great executive knows that the culture of the company is his responsibility.",
-  "One customer presents his ID while another shows hers at checkout.",
-  "One doctor washes his hands while another scrubs hers before surgery.",
-
-]
-
-test_stress_inputs = [
-
-"""
-Kael Verner arrived at the manufacturing plant just before sunrise, his coat still damp from the morning fog. 
-He had worked at this facility for nearly two decades, and he remembered a time when every machine had to be 
-checked manually before the first shift began. He walked through the assembly line, greeting workers by name, 
-recalling how he had once stood exactly where they stood now. The memories were vivid: the clatter of tools, 
-the pressure of deadlines, the pride of finishing a difficult build.
-
-Yet Kael also carried a philosophy that he repeated often in meetings. In his view, a good manager ensures 
-that his team operates efficiently regardless of external pressure. He believes that a leader sets the tone 
-for discipline and accountability, and if a supervisor ignores small mistakes, his authority slowly erodes. 
-A responsible engineer documents his work carefully, because errors compound over time. When a technician 
-cuts corners, he risks more than his reputation; he risks the safety of everyone around him.
-
-Later that morning, Kael met with a junior analyst who had joined the company only weeks earlier. The analyst 
-was nervous, fumbling with his notes, but Kael reassured him. He explained that everyone struggles at first, 
-and that experience is earned through persistence. Still, Kael reminded him of a rule he often repeated: 
-when an employee is assigned a task, he must see it through completely. Excuses weaken trust. Results build it.
-
-As the day ended, Kael returned to his office, reflecting on how different leadership felt in theory versus 
-practice. He smiled, knowing that while principles guide decisions, real leadership is tested in moments of 
-fatigue, uncertainty, and responsibility.
-""",
-
-"""
-In organizational theory, a manager coordinates resources to achieve defined objectives while maintaining 
-accountability across teams. A project leader identifies risks early and ensures that his strategy adapts to 
-changing constraints. When a department head communicates expectations clearly, he reduces ambiguity and 
-improves execution. Conversely, when a supervisor avoids responsibility, his team often mirrors that behavior.
-
-A skilled professional understands that competence is not static. An engineer refines his methods continually, 
-a designer evaluates his assumptions critically, and a developer reviews his code before deployment. In many 
-industries, a specialist protects his credibility by adhering to standards rather than shortcuts. If a worker 
-fails to uphold these principles, he undermines both trust and performance.
-
-From a systemic perspective, an organization functions best when each role fulfills its obligations. A mentor 
-guides his trainees patiently, a reviewer challenges his peers constructively, and a decision-maker accepts 
-that the final outcome is his responsibility. These patterns are not tied to individuals but to roles, forming 
-the backbone of sustainable professional culture.
-""",
-
-"""
-RESUME: ARJUN MALHOTRA
-Target Role: Senior Operations Manager
-
-PROFESSIONAL SUMMARY
-Arjun Malhotra is a seasoned operations professional with over 14 years of experience in logistics, procurement, 
-and process optimization. He has led cross-functional teams in high-pressure environments and delivered 
-measurable improvements in efficiency and cost control. He is known for his analytical mindset and his ability 
-to translate strategy into execution.
-
-PROFESSIONAL EXPERIENCE
-
-Operations Manager | NovaSupply Corp (2019–Present)
-Arjun managed regional distribution centers across five states. He implemented inventory forecasting models 
-that reduced waste by 18%. During the 2021 supply disruption, he coordinated alternative sourcing strategies 
-and ensured continuity of service. He mentored junior managers and reviewed their performance quarterly.
-
-Senior Logistics Analyst | Axis Freight Solutions (2014–2019)
-He analyzed shipment data to identify bottlenecks and proposed routing optimizations that improved delivery 
-times by 22%. He collaborated with IT teams to deploy a tracking dashboard used company-wide. He was recognized 
-twice for operational excellence.
-
-Leadership Philosophy
-Arjun believes that an effective manager supports his team while holding them accountable. He maintains that 
-a leader earns trust by consistency, not authority alone. When a supervisor delegates responsibility, he must 
-also provide clarity. If a manager avoids difficult decisions, he weakens his credibility. A strong leader 
-knows that the success of the organization is ultimately his responsibility, and he must act accordingly.
-
-Education
-MBA, Operations Management — Indian Institute of Management
-B.Tech, Industrial Engineering — National Institute of Technology
-
-Certifications
-Lean Six Sigma Black Belt
-Certified Supply Chain Professional (CSCP)
-"""
-]
+print("Loading FastCoref model...")
+resolver = CorefResolver(
+    device='cpu',
+    quantize=QUANTIZE,
+    num_threads=NUM_THREADS,
+    memory_guard=memory_guard,
+    batch_controller=batch_controller
+)
+if CASCADE:
+    from heuristic_coref import CascadeResolver
+    resolver = CascadeResolver(resolver)
 
+print("\n--- RUNNING ANALYSIS ---")
 
-d=test_docs+test_doxs+rest
 
 # =========================
 # RUN ANALYSIS
 # =========================
 
-structured_results = analyze_sentences_return_structured_spans(
-    test_stress_inputs,
-    resolver
-)
+inputs = test_stress_inputs
+if CORPUS_FILE:
+    from corpus_reader import CorpusReader
+    inputs = CorpusReader(CORPUS_FILE, fmt=CORPUS_FORMAT)
+
+if WORKERS:
+    from worker_pool import ForkWorkerPool
+    with ForkWorkerPool(resolver, workers=WORKERS, segmented=SEGMENTED) as pool:
+        structured_results = pool.map(inputs)
+        print(pool.memory_report())
+elif THREADS:
+    from thread_pool import ThreadWorkerPool
+    with ThreadWorkerPool(resolver, workers=THREADS, segmented=SEGMENTED) as pool:
+        structured_results = pool.map(inputs)
+        print(pool.memory_report())
+elif DEDUP:
+    from dedup import NearDuplicateAnalyzer
+    analyzer = NearDuplicateAnalyzer(resolver)
+    structured_results = analyzer.analyze_many(inputs)
+    print(f"Near-duplicate reuse: {analyzer.stats}")
+elif CLASSIFY:
+    structured_results = classify_batched(inputs, resolver)
+elif PIPELINED:
+    structured_results = analyze_pipelined(inputs, resolver, segmented=SEGMENTED)
+elif BATCHED or CORPUS_FILE:
+    structured_results = analyze_batched(inputs, resolver, segmented=SEGMENTED)
+else:
+    structured_results = analyze_sentences_return_structured_spans(
+        inputs,
+        resolver,
+        profiler=profiler
+    )
 
 # Optional console output
 for i, item in enumerate(structured_results):
-    if item["spans"]:
+    if CLASSIFY:
+        print(f"Doc {i+1}: {'BIAS DETECTED' if item['bias_type'] else 'SAFE'}")
+    elif item["spans"]:
         print(f"Doc {i+1}: BIAS DETECTED ({len(item['spans'])} triggers)")
     else:
         print(f"Doc {i+1}: SAFE")
@@ -2680,18 +126,11 @@ for i, item in enumerate(structured_results):
 # OPTIONAL HTML 
 # =========================
 
-if GENERATE_HTML:
-    results_for_report = []
-    for item in structured_results:
-        text = item["text"]
-        biases = [
-            (s["start"], s["end"], text[s["start"]:s["end"]])
-            for s in item["spans"]
-        ]
-        results_for_report.append({
-            "text": text,
-            "biases": biases
-        })
+if GENERATE_HTML and not CLASSIFY:
+    results_for_report = [
+        {"text": item["text"], "biases": item["spans"]}
+        for item in structured_results
+    ]
 
     create_html_report(results_for_report)
 
@@ -2701,4 +140,21 @@ if GENERATE_HTML:
 # =========================
 
 print("\nStructured Output:")
-print(structured_results)
+print(dumps_results(structured_results, context=INCLUDE_CONTEXT, indent=2, ensure_ascii=False))
+
+
+# =========================
+# INSTRUMENTATION
+# =========================
+
+if instrumentation.ENABLED:
+    print("\nStage Timings:")
+    print(instrumentation.summary_table())
+    instrumentation.write_prometheus(METRICS_FILE)
+    print(f"Metrics written: {METRICS_FILE}")
+
+if profiler:
+    print("\nRule Profile (slowest documents):")
+    print(profiler.summary())
+    profiler.write_collapsed(PROFILE_FILE)
+    print(f"Collapsed stacks written: {PROFILE_FILE}")
@@ -0,0 +1,232 @@
+# memory_guard.py
+import gc
+import os
+import re
+import resource
+
+import instrumentation
+from batching import estimate_tokens, TOKENS_PER_WORD
+
+# =========================
+# CONFIG
+# =========================
+
+DEFAULT_MAX_DOC_TOKENS = 2048
+DEFAULT_WINDOW_TOKENS = 512
+MIN_WINDOW_TOKENS = 64
+OVERLAP_SENTENCES = 2
+
+# Caps a run without whitespace (URLs, base64, tables) at this many
+# characters per estimated token; estimate_tokens() counts it as one word.
+MAX_CHARS_PER_TOKEN = 8
+
+# Rough inference cost model for FCoref: hidden states grow linearly with
+# the sequence, attention maps and mention-pair scores quadratically.
+BYTES_PER_TOKEN = 100 * 1024
+BYTES_PER_TOKEN_PAIR = 64
+
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+WORD = re.compile(r"\S+")
+
+
+def estimate_inference_bytes(n_tokens, n_docs=1):
+    return n_docs * (n_tokens * BYTES_PER_TOKEN + n_tokens * n_tokens * BYTES_PER_TOKEN_PAIR)
+
+
+def current_rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # Peak RSS is the best portable fallback (KiB on Linux, bytes on macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+# =========================
+# WINDOWING
+# =========================
+
+def sentence_offsets(text):
+    """
+    Cheap regex sentence split (no spaCy parse of the oversize text).
+    returns: List[(start, end)]
+    """
+    offsets = []
+    start = 0
+    for m in SENTENCE_BOUNDARY.finditer(text):
+        if m.start() > start:
+            offsets.append((start, m.start()))
+        start = m.end()
+    if start < len(text):
+        offsets.append((start, len(text)))
+    return offsets
+
+
+def split_long(text, start, end, window_tokens):
+    """
+    Cuts text[start:end] at whitespace into pieces of at most
+    `window_tokens` (estimated); a run without whitespace longer than
+    window_tokens * MAX_CHARS_PER_TOKEN is cut at that length.
+
+    returns: List[(start, end)]
+    """
+    max_words = max(1, int((window_tokens - 2) / TOKENS_PER_WORD))
+    max_chars = window_tokens * MAX_CHARS_PER_TOKEN
+    pieces = []
+    piece_start = piece_end = None
+    words = 0
+    for m in WORD.finditer(text, start, end):
+        for s in range(m.start(), m.end(), max_chars):
+            e = min(s + max_chars, m.end())
+            if piece_start is not None and (words == max_words or e - piece_start > max_chars):
+                pieces.append((piece_start, piece_end))
+                piece_start = None
+            if piece_start is None:
+                piece_start, words = s, 0
+            piece_end = e
+            words += 1
+    if piece_start is not None:
+        pieces.append((piece_start, piece_end))
+    return pieces
+
+
+def make_windows(text, window_tokens, overlap_sentences=OVERLAP_SENTENCES):
+    """
+    Packs consecutive sentences into windows of at most `window_tokens`;
+    a longer sentence is first cut at whitespace (split_long), so no window
+    exceeds the budget. Consecutive windows share `overlap_sentences`
+    sentences so chains can be stitched together.
+
+    returns: List[(start_char, end_char)]
+    """
+    sentences = []
+    for start, end in sentence_offsets(text):
+        if estimate_tokens(text[start:end]) > window_tokens or end - start > window_tokens * MAX_CHARS_PER_TOKEN:
+            sentences.extend(split_long(text, start, end, window_tokens))
+        else:
+            sentences.append((start, end))
+    windows = []
+    i = 0
+    while i < len(sentences):
+        j = i
+        tokens = 0
+        while j < len(sentences):
+            n = estimate_tokens(text[sentences[j][0]:sentences[j][1]])
+            too_long = sentences[j][1] - sentences[i][0] > window_tokens * MAX_CHARS_PER_TOKEN
+            if j > i and (tokens + n > window_tokens or too_long):
+                break
+            tokens += n
+            j += 1
+        windows.append((sentences[i][0], sentences[j - 1][1]))
+        if j >= len(sentences):
+            break
+        i = max(i + 1, j - overlap_sentences)
+    return windows
+
+
+def merge_window_clusters(window_clusters):
+    """
+    window_clusters: List[(offset, clusters)] with window-relative mentions.
+    Shifts mentions to document offsets and merges clusters that share a
+    mention (the overlapping sentences resolve the same span twice).
+    """
+    parent = {}
+
+    def find(m):
+        while parent[m] != m:
+            parent[m] = parent[parent[m]]
+            m = parent[m]
+        return m
+
+    for offset, clusters in window_clusters:
+        for cluster in clusters:
+            mentions = [(s + offset, e + offset) for s, e in cluster]
+            for m in mentions:
+                parent.setdefault(m, m)
+            root = find(mentions[0])
+            for m in mentions[1:]:
+                parent[find(m)] = root
+
+    merged = {}
+    for m in parent:
+        merged.setdefault(find(m), []).append(m)
+    return sorted((sorted(c) for c in merged.values()), key=lambda c: c[0])
+
+
+# =========================
+# GUARD
+# =========================
+
+class MemoryGuard:
+    """
+    Keeps a single oversize document from taking down the worker.
+
+    - documents over `max_doc_tokens` are resolved in sentence windows and
+      the window clusters are stitched back together;
+    - before each inference the estimated cost is checked against
+      `max_rss_mb` (if set); over the ceiling the guard collects garbage,
+      then shrinks the window, and as a last resort returns no clusters
+      for that document instead of running out of memory.
+    """
+
+    def __init__(self, max_doc_tokens=DEFAULT_MAX_DOC_TOKENS, window_tokens=DEFAULT_WINDOW_TOKENS,
+                 max_rss_mb=None, overlap_sentences=OVERLAP_SENTENCES):
+        self.max_doc_tokens = max_doc_tokens
+        self.window_tokens = min(window_tokens, max_doc_tokens)
+        self.max_rss_bytes = max_rss_mb * 1024 * 1024 if max_rss_mb else None
+        self.overlap_sentences = overlap_sentences
+
+    def is_oversize(self, text):
+        return estimate_tokens(text) > self.max_doc_tokens
+
+    def admit(self, n_tokens, n_docs=1):
+        if self.max_rss_bytes is None:
+            return True
+        cost = estimate_inference_bytes(n_tokens, n_docs)
+        if current_rss_bytes() + cost <= self.max_rss_bytes:
+            return True
+        gc.collect()
+        return current_rss_bytes() + cost <= self.max_rss_bytes
+
+    def resolve(self, text, predict):
+        """
+        predict: List[str] -> List[clusters] (one model call)
+        """
+        n_tokens = estimate_tokens(text)
+        if n_tokens <= self.max_doc_tokens and self.admit(n_tokens):
+            return predict([text])[0]
+
+        window_tokens = min(self.window_tokens, n_tokens)
+        while True:
+            windows = make_windows(text, window_tokens, self.overlap_sentences)
+            clusters = self._resolve_windowed(text, predict, windows)
+            if clusters is not None:
+                return clusters
+            if window_tokens // 2 < MIN_WINDOW_TOKENS:
+                break
+            window_tokens //= 2
+
+        instrumentation.count("documents_degraded", reason="memory ceiling")
+        return []
+
+    def _resolve_windowed(self, text, predict, windows):
+        """
+        returns: merged clusters, or None when a window is refused by
+                 admit() (the caller then retries with smaller windows)
+        """
+        if not windows:
+            return []  # empty or whitespace-only: no sentences, no mentions
+        sizes = [estimate_tokens(text[start:end]) for start, end in windows]
+        if not self.admit(max(sizes)):
+            return None
+
+        instrumentation.count("documents_windowed")
+        window_clusters = []
+        # One window per call keeps peak memory at a single window; each is
+        # checked against the ceiling as memory may have grown meanwhile
+        for (start, end), n_tokens in zip(windows, sizes):
+            if not self.admit(n_tokens):
+                return None
+            window_clusters.append((start, predict([text[start:end]])[0]))
+        return merge_window_clusters(window_clusters)
@@ -0,0 +1,271 @@
+# onnx_backend.py
+import argparse
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import torch
+
+# =========================
+# LAYOUT
+# =========================
+#
+# An export directory holds three graphs, all with dynamic batch / sequence
+# axes:
+#   encoder.onnx      input_ids, attention_mask -> last_hidden_state
+#   mentions.onnx     sequence_output -> mention_logits, start/end coref reps
+#   antecedents.onnx  top-k start/end coref reps -> coref_logits
+#   export.json       opset and source model, for reference
+#
+# Top-k mention pruning has data-dependent shapes, so it stays in torch and
+# reuses FCoref's own code; everything with weights runs in onnxruntime.
+
+ENCODER = "encoder.onnx"
+MENTIONS = "mentions.onnx"
+ANTECEDENTS = "antecedents.onnx"
+META = "export.json"
+
+DEFAULT_OPSET = 17
+
+
+# =========================
+# EXPORT
+# =========================
+
+class _Encoder(torch.nn.Module):
+    def __init__(self, base_model):
+        super().__init__()
+        self.base_model = base_model
+
+    def forward(self, input_ids, attention_mask):
+        return self.base_model(input_ids, attention_mask=attention_mask).last_hidden_state
+
+
+class _MentionHeads(torch.nn.Module):
+    def __init__(self, coref):
+        super().__init__()
+        self.coref = coref
+
+    def forward(self, sequence_output):
+        m = self.coref
+        mention_logits = m._calc_mention_logits(
+            m.start_mention_mlp(sequence_output), m.end_mention_mlp(sequence_output)
+        )
+        return mention_logits, m.start_coref_mlp(sequence_output), m.end_coref_mlp(sequence_output)
+
+
+class _AntecedentHeads(torch.nn.Module):
+    def __init__(self, coref):
+        super().__init__()
+        self.coref = coref
+
+    def forward(self, topk_start_coref_reps, topk_end_coref_reps):
+        return self.coref._calc_coref_logits(topk_start_coref_reps, topk_end_coref_reps)
+
+
+def _export(module, args, path, input_names, output_names, dynamic_axes, opset):
+    # The exporter restores the wrapper's train/eval mode afterwards, and
+    # that recurses into the shared FCoref module: keep everything in eval
+    torch.onnx.export(
+        module.eval(), args, path,
+        input_names=input_names,
+        output_names=output_names,
+        dynamic_axes=dynamic_axes,
+        opset_version=opset,
+        do_constant_folding=True,
+        dynamo=False,
+    )
+
+
+def export_onnx(coref_model, out_dir, opset=DEFAULT_OPSET, source=None):
+    """
+    coref_model: the torch module of an FCoref instance (FCoref().model),
+                 not quantized (dynamic int8 Linear layers do not export)
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    coref_model = coref_model.eval().to("cpu")
+    hidden = coref_model.config.hidden_size
+    ffnn = coref_model.ffnn_size
+
+    with torch.no_grad():
+        ids = torch.ones((2, 16), dtype=torch.long)
+        _export(
+            _Encoder(coref_model.base_model), (ids, torch.ones_like(ids)),
+            os.path.join(out_dir, ENCODER),
+            ["input_ids", "attention_mask"], ["last_hidden_state"],
+            {"input_ids": {0: "batch", 1: "seq"}, "attention_mask": {0: "batch", 1: "seq"},
+             "last_hidden_state": {0: "batch", 1: "seq"}},
+            opset,
+        )
+        _export(
+            _MentionHeads(coref_model), (torch.zeros((2, 16, hidden)),),
+            os.path.join(out_dir, MENTIONS),
+            ["sequence_output"], ["mention_logits", "start_coref_reps", "end_coref_reps"],
+            {"sequence_output": {0: "batch", 1: "seq"}, "mention_logits": {0: "batch", 1: "seq", 2: "seq"},
+             "start_coref_reps": {0: "batch", 1: "seq"}, "end_coref_reps": {0: "batch", 1: "seq"}},
+            opset,
+        )
+        reps = torch.zeros((2, 8, ffnn))
+        _export(
+            _AntecedentHeads(coref_model), (reps, reps.clone()),
+            os.path.join(out_dir, ANTECEDENTS),
+            ["topk_start_coref_reps", "topk_end_coref_reps"], ["coref_logits"],
+            {"topk_start_coref_reps": {0: "batch", 1: "k"}, "topk_end_coref_reps": {0: "batch", 1: "k"},
+             "coref_logits": {0: "batch", 1: "k", 2: "k"}},
+            opset,
+        )
+
+    with open(os.path.join(out_dir, META), "w", encoding="utf-8") as f:
+        json.dump({"opset": opset, "source": source, "hidden_size": hidden, "ffnn_size": ffnn}, f, indent=2)
+    return out_dir
+
+
+# =========================
+# RUNTIME
+# =========================
+
+def make_session(path, num_threads=None):
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if num_threads:
+        options.intra_op_num_threads = num_threads
+    return ort.InferenceSession(path, sess_options=options, providers=["CPUExecutionProvider"])
+
+
+def _run(session, **inputs):
+    feeds = {name: tensor.detach().cpu().numpy() for name, tensor in inputs.items()}
+    return [torch.from_numpy(out) for out in session.run(None, feeds)]
+
+
+class OrtEncoder(torch.nn.Module):
+    """
+    Stands in for FCoref's transformer: same call, same .last_hidden_state.
+    """
+
+    def __init__(self, session):
+        super().__init__()
+        self.session = session
+
+    def forward(self, input_ids, attention_mask=None):
+        (hidden,) = _run(self.session, input_ids=input_ids, attention_mask=attention_mask)
+        return SimpleNamespace(last_hidden_state=hidden)
+
+
+class OrtFCorefModel(torch.nn.Module):
+    """
+    Replacement for FCoref().model running the exported graphs.
+
+    forward() mirrors FCorefModel.forward for inference: the transformer and
+    both scoring heads run in onnxruntime, the top-k pruning, gathering and
+    antecedent masking reuse the original module's methods. The torch
+    encoder is dropped, which also frees its weights.
+    """
+
+    def __init__(self, coref_model, onnx_dir, num_threads=None):
+        super().__init__()
+        setattr(coref_model, coref_model.base_model_prefix,
+                OrtEncoder(make_session(os.path.join(onnx_dir, ENCODER), num_threads)))
+        self.coref = coref_model.eval().to("cpu")
+        self.mentions = make_session(os.path.join(onnx_dir, MENTIONS), num_threads)
+        self.antecedents = make_session(os.path.join(onnx_dir, ANTECEDENTS), num_threads)
+
+    @property
+    def device(self):
+        return torch.device("cpu")
+
+    def forward(self, batch, gold_clusters=None, topk_1d_indices=None, return_all_outputs=False):
+        if gold_clusters is not None:
+            raise ValueError("the ONNX backend is inference-only")
+        m = self.coref
+        sequence_output, attention_mask = m.forward_transformer(batch)
+
+        mention_logits, start_coref_reps, end_coref_reps = _run(self.mentions, sequence_output=sequence_output)
+        mention_start_ids, mention_end_ids, span_mask, topk_mention_logits = m._prune_topk_mentions(
+            mention_logits, attention_mask, topk_1d_indices
+        )
+
+        batch_size, _, dim = start_coref_reps.size()
+        max_k = mention_start_ids.size(-1)
+        size = (batch_size, max_k, dim)
+        topk_start_coref_reps = torch.gather(start_coref_reps, dim=1, index=mention_start_ids.unsqueeze(-1).expand(size))
+        topk_end_coref_reps = torch.gather(end_coref_reps, dim=1, index=mention_end_ids.unsqueeze(-1).expand(size))
+        (coref_logits,) = _run(
+            self.antecedents,
+            topk_start_coref_reps=topk_start_coref_reps,
+            topk_end_coref_reps=topk_end_coref_reps,
+        )
+
+        final_logits = topk_mention_logits + coref_logits
+        final_logits = m._mask_antecedent_logits(final_logits, span_mask)
+        final_logits = torch.cat((final_logits, torch.zeros((batch_size, max_k, 1))), dim=-1)
+
+        outputs = (mention_start_ids, mention_end_ids, mention_logits, final_logits) if return_all_outputs else tuple()
+        if topk_1d_indices is not None:
+            outputs = (span_mask,) + outputs
+        return outputs
+
+
+def install_onnx_backend(fcoref, onnx_dir, num_threads=None):
+    """
+    Switches an FCoref instance to onnxruntime in place; predict(),
+    tokenization and cluster decoding are unchanged.
+    """
+    fcoref.model = OrtFCorefModel(fcoref.model, onnx_dir, num_threads=num_threads)
+    return fcoref
+
+
+def cluster_agreement(reference, candidate):
+    """
+    reference, candidate: per-document cluster lists (CorefResolver output)
+
+    returns: fraction of documents with identical clusters
+    """
+    def canonical(clusters):
+        return sorted(sorted(tuple(m) for m in c) for c in clusters)
+
+    if not reference:
+        return 1.0
+    same = sum(canonical(a) == canonical(b) for a, b in zip(reference, candidate))
+    return same / len(reference)
+
+
+# =========================
+# CLI
+# =========================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export FCoref to ONNX and check the onnxruntime backend.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export = sub.add_parser("export")
+    export.add_argument("--out", required=True)
+    export.add_argument("--opset", type=int, default=DEFAULT_OPSET)
+
+    check = sub.add_parser("check", help="compare clusters of both backends on the bundled corpora")
+    check.add_argument("--onnx-dir", required=True)
+    check.add_argument("--corpus", action="append")
+
+    args = parser.parse_args(argv)
+
+    from coref_solver import CorefResolver
+
+    if args.command == "export":
+        resolver = CorefResolver(device="cpu")
+        export_onnx(resolver.model.model, args.out, opset=args.opset, source="biu-nlp/f-coref")
+        print(f"Exported: {args.out}")
+        return 0
+
+    from corpora import CORPORA
+    texts = [text for name in (args.corpus or CORPORA) for text in CORPORA[name]]
+    reference = CorefResolver(device="cpu").resolve_batch(texts)
+    candidate = CorefResolver(device="cpu", backend="onnx", onnx_dir=args.onnx_dir).resolve_batch(texts)
+    agreement = cluster_agreement(reference, candidate)
+    print(f"Cluster agreement: {100 * agreement:.1f}% of {len(texts)} documents")
+    return 0 if agreement == 1.0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+# pipeline.py
+import queue
+import threading
+from itertools import islice
+
+import instrumentation
+from batching import DEFAULT_MAX_TOKENS
+from bias_detector import nlp, detect_pronoun_bias, classify_pronoun_bias, pronoun_clusters
+from knowledge_base import GENDERED_PRONOUN
+from segmenter import resolve_segmented_batch
+
+# =========================
+# ANALYSIS DRIVERS
+# =========================
+
+def analyze_sentences_return_structured_spans(sentences, resolver, profiler=None):
+    """
+    sentences: List[str]
+
+    returns: List[dict] like:
+    {
+        "text": str,
+        "spans": [
+            BiasSpan(start, end, sent_start, sent_end, reason)  # .type == "PRONOUN"
+        ],
+        "bias_type": "PRONOUN" | None
+    }
+    """
+    results = []
+
+    for i, text in enumerate(sentences):
+        clusters = resolver.resolve(text)
+        if profiler:
+            biases = profiler.profile_document(text, clusters, doc_id=i)
+        else:
+            biases = detect_pronoun_bias(text, clusters)
+
+        results.append(structured_result(text, biases))
+
+    return results
+
+
+def iter_analyze_batched(texts, resolver, max_tokens=DEFAULT_MAX_TOKENS,
+                         parse_batch_size=64, chunk_size=512,
+                         segmented=False, link_anchors=False, parser=None):
+    """
+    Batched variant of analyze_sentences_return_structured_spans.
+
+    Reads `texts` (any iterable, e.g. a corpus_reader.CorpusReader) in
+    chunks of `chunk_size`; each chunk goes
+    through length-bucketed coref batches and nlp.pipe, and results are
+    yielded in input order.
+
+    segmented: resolve coref per section/paragraph (see segmenter.py)
+               instead of over the whole document.
+    parser: spaCy pipeline to parse with (default: bias_detector.nlp);
+            thread-pool workers pass their own.
+    """
+    parser = parser or nlp
+    texts = iter(texts)
+    while True:
+        chunk = list(islice(texts, chunk_size))
+        if not chunk:
+            break
+
+        with instrumentation.stage("spacy_parse"):
+            docs = list(parser.pipe(chunk, batch_size=parse_batch_size))
+        if segmented:
+            all_clusters = resolve_segmented_batch(
+                chunk, resolver, docs, link_anchors=link_anchors, max_tokens=max_tokens
+            )
+        else:
+            all_clusters = resolver.resolve_batch(chunk, max_tokens=max_tokens, docs=docs)
+
+        for text, clusters, doc in zip(chunk, all_clusters, docs):
+            yield structured_result(text, detect_pronoun_bias(text, clusters, doc=doc))
+
+
+def analyze_batched(texts, resolver, **kwargs):
+    return list(iter_analyze_batched(texts, resolver, **kwargs))
+
+
+# =========================
+# PIPELINED DRIVER
+# =========================
+
+_DONE = object()
+
+
+class _StageThread(threading.Thread):
+    """
+    Applies `fn` to every item of `inbox` and puts the result on `outbox`.
+    An exception is forwarded downstream in place of a result so the
+    consumer re-raises it; `stop` aborts blocked puts when the consumer
+    goes away.
+    """
+
+    def __init__(self, name, fn, inbox, outbox, stop):
+        super().__init__(name=f"pipeline-{name}", daemon=True)
+        self.fn = fn
+        self.inbox = inbox
+        self.outbox = outbox
+        self.stop = stop
+
+    def put(self, item):
+        while not self.stop.is_set():
+            try:
+                self.outbox.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run(self):
+        try:
+            for item in self.inbox:
+                if self.stop.is_set() or not self.put(self.fn(item)):
+                    return
+        except BaseException as exc:
+            self.put(exc)
+            return
+        self.put(_DONE)
+
+
+def _drain(q, stop):
+    while not stop.is_set():
+        try:
+            item = q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        if item is _DONE:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+
+def iter_analyze_pipelined(texts, resolver, max_tokens=DEFAULT_MAX_TOKENS,
+                           parse_batch_size=64, chunk_size=64, queue_size=2,
+                           segmented=False, link_anchors=False):
+    """
+    iter_analyze_batched with its stages overlapped: coref and spaCy parsing
+    run on their own threads, joined by bounded queues, while the caller's
+    thread evaluates the rules. Chunk N+1 is parsed while chunk N is
+    inferring and chunk N-1 checked, so throughput tends towards the slowest stage
+    rather than the sum of all three. Torch releases the GIL during
+    inference, which is where the overlap comes from.
+
+    queue_size bounds the chunks buffered between two stages (memory).
+    Parsing comes first and its docs are handed to the coref stage
+    (segments, the cascade heuristic), so only the parse thread ever uses
+    the shared spaCy pipeline.
+    """
+    stop = threading.Event()
+    texts = iter(texts)
+
+    def chunks():
+        while True:
+            chunk = list(islice(texts, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def parse(chunk):
+        with instrumentation.stage("spacy_parse"):
+            docs = list(nlp.pipe(chunk, batch_size=parse_batch_size))
+        return chunk, docs
+
+    def coref(item):
+        chunk, docs = item
+        if segmented:
+            clusters = resolve_segmented_batch(
+                chunk, resolver, docs, link_anchors=link_anchors, max_tokens=max_tokens
+            )
+        else:
+            clusters = resolver.resolve_batch(chunk, max_tokens=max_tokens, docs=docs)
+        return chunk, clusters, docs
+
+    stages = [("parse", parse), ("coref", coref)]
+    threads = []
+    inbox = chunks()
+    for name, fn in stages:
+        outbox = queue.Queue(maxsize=queue_size)
+        threads.append(_StageThread(name, fn, inbox, outbox, stop))
+        inbox = _drain(outbox, stop)
+    for thread in threads:
+        thread.start()
+
+    try:
+        for chunk, all_clusters, docs in inbox:
+            with instrumentation.stage("pipeline_rules"):
+                results = [
+                    structured_result(text, detect_pronoun_bias(text, clusters, doc=doc))
+                    for text, clusters, doc in zip(chunk, all_clusters, docs)
+                ]
+            yield from results
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+def analyze_pipelined(texts, resolver, **kwargs):
+    return list(iter_analyze_pipelined(texts, resolver, **kwargs))
+
+
+def iter_classify_batched(texts, resolver, max_tokens=DEFAULT_MAX_TOKENS,
+                          parse_batch_size=64, chunk_size=512):
+    """
+    Yes/no variant of iter_analyze_batched, yielding
+    {"text": str, "bias_type": "PRONOUN" | None} without spans.
+
+    Only documents containing a gendered pronoun are parsed and go through
+    coref (which gets the docs, so a cascade resolver does not parse them
+    again), and each document stops at its first flagged mention
+    (bias_detector.classify_pronoun_bias).
+    """
+    texts = iter(texts)
+    while True:
+        chunk = list(islice(texts, chunk_size))
+        if not chunk:
+            break
+
+        flags = [False] * len(chunk)
+        todo = [i for i, text in enumerate(chunk) if GENDERED_PRONOUN.search(text)]
+        instrumentation.count("classify_prefiltered", len(chunk) - len(todo))
+        if todo:
+            with instrumentation.stage("spacy_parse"):
+                docs = list(nlp.pipe((chunk[i] for i in todo), batch_size=parse_batch_size))
+            all_clusters = resolver.resolve_batch([chunk[i] for i in todo], max_tokens=max_tokens, docs=docs)
+            for i, clusters, doc in zip(todo, all_clusters, docs):
+                clusters = pronoun_clusters(chunk[i], clusters)
+                if clusters:
+                    flags[i] = classify_pronoun_bias(chunk[i], clusters, doc=doc)
+
+        for text, flag in zip(chunk, flags):
+            yield {"text": text, "bias_type": "PRONOUN" if flag else None}
+
+
+def classify_batched(texts, resolver, **kwargs):
+    return list(iter_classify_batched(texts, resolver, **kwargs))
+
+
+def structured_result(text, biases):
+    return {
+        "text": text,
+        "spans": biases,
+        "bias_type": "PRONOUN" if biases else None
+    }
+
@@ -0,0 +1,181 @@
+# profiler.py
+import cProfile
+import heapq
+import pstats
+import time
+from contextlib import contextmanager
+
+import bias_detector
+import instrumentation
+
+# =========================
+# CONFIG
+# =========================
+
+# Rule-engine functions that get their own frame in the collapsed stacks.
+# They are looked up through the bias_detector module globals, so patching
+# the module attributes is enough to see every call (including recursion).
+PROFILED_FUNCTIONS = (
+    "detect_pronoun_bias",
+    "get_governing_verb",
+    "is_generic_context",
+    "is_strictly_episodic",
+    "get_best_head_span",
+)
+
+
+class RuleProfiler:
+    """
+    Optional profiling mode for the rule engine.
+
+    profile_document() runs detect_pronoun_bias for a single document under
+    cProfile and under timing wrappers around the rule helpers. The wrappers
+    build flamegraph-compatible collapsed stacks ("a;b;c <microseconds>"),
+    cProfile stats are aggregated across documents and kept per document for
+    the slowest ones.
+    """
+
+    def __init__(self, use_cprofile=True, worst_n=10):
+        self.use_cprofile = use_cprofile
+        self.worst_n = worst_n
+        self.collapsed = {}     # "detect_pronoun_bias;is_generic_context" -> self seconds
+        self.doc_times = []     # (doc_id, seconds, n_chars, n_clusters)
+        self.stats = None       # pstats.Stats aggregated over all documents
+        self._worst = []        # min-heap of (seconds, seq, doc_id, text, pstats.Stats)
+        self._stack = []
+        self._seq = 0
+
+    # ---------- wrapping ----------
+
+    def _wrap(self, name, fn):
+        def wrapper(*args, **kwargs):
+            # frame = [name, start, seconds spent in profiled children]
+            frame = [name, time.perf_counter(), 0.0]
+            self._stack.append(frame)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - frame[1]
+                key = ";".join(f[0] for f in self._stack)
+                self._stack.pop()
+                self.collapsed[key] = self.collapsed.get(key, 0.0) + elapsed - frame[2]
+                if self._stack:
+                    self._stack[-1][2] += elapsed
+
+        wrapper.__wrapped__ = fn
+        wrapper.__name__ = fn.__name__
+        return wrapper
+
+    @contextmanager
+    def patched(self):
+        originals = {name: getattr(bias_detector, name) for name in PROFILED_FUNCTIONS}
+        try:
+            for name, fn in originals.items():
+                setattr(bias_detector, name, self._wrap(name, fn))
+            yield
+        finally:
+            for name, fn in originals.items():
+                setattr(bias_detector, name, fn)
+
+    # ---------- profiling ----------
+
+    def profile_document(self, text, clusters, doc_id=None, doc=None):
+        """
+        Times detect_pronoun_bias on one document. The parse happens before
+        the timed region (or comes in as `doc`), so the timings and the
+        worst-document ranking reflect the rules, not the spaCy parse.
+        """
+        if doc_id is None:
+            doc_id = len(self.doc_times)
+        if doc is None:
+            with instrumentation.stage("spacy_parse"):
+                doc = bias_detector.nlp(text)
+
+        profile = cProfile.Profile() if self.use_cprofile else None
+        with self.patched():
+            start = time.perf_counter()
+            if profile:
+                profile.enable()
+            try:
+                result = bias_detector.detect_pronoun_bias(text, clusters, doc=doc)
+            finally:
+                if profile:
+                    profile.disable()
+                elapsed = time.perf_counter() - start
+
+        self.doc_times.append((doc_id, elapsed, len(text), len(clusters)))
+
+        doc_stats = None
+        if profile:
+            doc_stats = pstats.Stats(profile)
+            if self.stats is None:
+                self.stats = pstats.Stats(profile)
+            else:
+                self.stats.add(profile)
+
+        self._seq += 1
+        entry = (elapsed, self._seq, doc_id, text, doc_stats)
+        if len(self._worst) < self.worst_n:
+            heapq.heappush(self._worst, entry)
+        elif elapsed > self._worst[0][0]:
+            heapq.heapreplace(self._worst, entry)
+
+        return result
+
+    # ---------- reporting ----------
+
+    def worst_documents(self):
+        """
+        Slowest documents first, with the longest dependency chain in each
+        (long head chains are what make get_governing_verb expensive).
+        """
+        report = []
+        for elapsed, _, doc_id, text, doc_stats in sorted(self._worst, reverse=True):
+            doc = bias_detector.nlp(text)
+            report.append({
+                "doc_id": doc_id,
+                "seconds": elapsed,
+                "chars": len(text),
+                "tokens": len(doc),
+                "max_dependency_depth": max_dependency_depth(doc),
+                "stats": doc_stats,
+            })
+        return report
+
+    def collapsed_lines(self):
+        # flamegraph.pl / speedscope expect integer sample counts; use microseconds
+        return [
+            f"{stack} {max(1, round(seconds * 1e6))}"
+            for stack, seconds in sorted(self.collapsed.items())
+        ]
+
+    def write_collapsed(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(self.collapsed_lines()) + "\n")
+
+    def write_pstats(self, path):
+        if self.stats is not None:
+            self.stats.dump_stats(path)
+
+    def summary(self, top=5):
+        lines = []
+        total = sum(t for _, t, _, _ in self.doc_times)
+        lines.append(f"Profiled {len(self.doc_times)} documents in {total:.4f}s")
+        lines.append(f"{'DOC':>6}{'SECONDS':>12}{'CHARS':>10}{'TOKENS':>10}{'DEP DEPTH':>12}")
+        for row in self.worst_documents()[:top]:
+            lines.append(
+                f"{row['doc_id']!s:>6}{row['seconds']:>12.4f}{row['chars']:>10}"
+                f"{row['tokens']:>10}{row['max_dependency_depth']:>12}"
+            )
+        return "\n".join(lines)
+
+
+def max_dependency_depth(doc):
+    depth = 0
+    for token in doc:
+        d = 0
+        while token.head != token:
+            token = token.head
+            d += 1
+        depth = max(depth, d)
+    return depth
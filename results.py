@@ -0,0 +1,111 @@
+# results.py
+import json
+from dataclasses import dataclass
+
+# =========================
+# REASON CODES
+# =========================
+
+FORCED_GENERIC_ROLE = 0
+GENERIC_CONTEXT = 1
+
+REASONS = (
+    "Forced generic role + gendered pronoun",
+    "Generic context linked to role",
+)
+
+
+# =========================
+# RESULT TYPE
+# =========================
+
+@dataclass(eq=True)
+class BiasSpan:
+    """
+    One flagged pronoun. Only offsets into the source text are stored: the
+    pronoun is text[start:end], its sentence text[sent_start:sent_end], so
+    many hits in one long sentence share the source string instead of each
+    carrying a copy of it.
+    """
+    __slots__ = ("start", "end", "sent_start", "sent_end", "reason")
+
+    start: int
+    end: int
+    sent_start: int
+    sent_end: int
+    reason: int
+
+    type = "PRONOUN"
+
+    @property
+    def reason_text(self):
+        return REASONS[self.reason]
+
+    def text_in(self, text):
+        return text[self.start:self.end]
+
+    def context_in(self, text):
+        return text[self.sent_start:self.sent_end]
+
+    def shifted(self, delta):
+        return BiasSpan(
+            self.start + delta, self.end + delta,
+            self.sent_start + delta, self.sent_end + delta,
+            self.reason
+        )
+
+    def to_dict(self, text=None, context=False):
+        """
+        Offsets only by default; the pronoun needs `text`, and the sentence
+        is copied out of it only when `context` is requested.
+        """
+        d = {
+            "start": self.start,
+            "end": self.end,
+            "type": self.type,
+            "sent_start": self.sent_start,
+            "sent_end": self.sent_end,
+            "reason": self.reason_text,
+        }
+        if text is not None:
+            d["text"] = self.text_in(text).lower()
+            if context:
+                d["context"] = self.context_in(text)
+        return d
+
+
+# =========================
+# SERIALIZATION
+# =========================
+
+def result_to_dict(item, context=False):
+    """
+    item: one structured result from the pipeline drivers
+    """
+    text = item["text"]
+    if "spans" not in item:
+        # classify mode: document-level flag only
+        return {"text": text, "bias_type": item["bias_type"]}
+    return {
+        "text": text,
+        "spans": [s.to_dict(text, context) for s in item["spans"]],
+        "bias_type": item["bias_type"],
+    }
+
+
+def dumps_results(structured_results, context=False, **json_kwargs):
+    return json.dumps([result_to_dict(item, context) for item in structured_results], **json_kwargs)
+
+
+def write_results(path, structured_results, context=False):
+    """
+    Streams results as a JSON array, one document at a time, so large runs
+    never hold the whole serialized report in memory.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for i, item in enumerate(structured_results):
+            if i:
+                f.write(",\n")
+            json.dump(result_to_dict(item, context), f, ensure_ascii=False)
+        f.write("]\n")
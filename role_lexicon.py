@@ -0,0 +1,253 @@
+# role_lexicon.py
+import argparse
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+# =========================
+# FORMAT
+# =========================
+#
+# roles.lex (little-endian), all keys lower-case UTF-8, sorted bytewise:
+#   header   "PBRL", version, n_entries, blob_size       (<4sIII)
+#   offsets  uint32[n_entries + 1]   key i is blob[offsets[i]:offsets[i + 1]]
+#   genders  uint8[n_entries]        0 = neutral role, 1 = "M", 2 = "F"
+#   blob     concatenated keys
+#
+# The file is memory-mapped and searched in place: opening it reads only the
+# header, so a lexicon with tens of thousands of terms costs nothing at
+# import time and its pages are shared between worker processes.
+
+MAGIC = b"PBRL"
+VERSION = 1
+HEADER = struct.Struct("<4sIII")
+
+GENDER_CODES = {None: 0, "M": 1, "F": 2}
+GENDERS = (None, "M", "F")
+
+# Default location; override with PRONOUNBIAS_ROLE_LEXICON
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "roles.lex")
+
+
+# =========================
+# BUILD
+# =========================
+
+def inflections(term):
+    """
+    Plural forms for a (possibly multi-word) role term; only the last word
+    is inflected ("department head" -> "department heads").
+    """
+    head, _, last = term.rpartition(" ")
+    prefix = head + " " if head else ""
+    forms = set()
+    if last.endswith("man"):
+        forms.add(last[:-3] + "men")
+    elif last.endswith("y") and len(last) > 1 and last[-2] not in "aeiou":
+        forms.add(last[:-1] + "ies")
+    elif last.endswith(("s", "sh", "ch", "x", "z")):
+        forms.add(last + "es")
+    else:
+        forms.add(last + "s")
+    return {prefix + f for f in forms}
+
+
+def build_lexicon(entries, path, with_inflections=True):
+    """
+    entries: {term: "M" | "F" | None}. Inflected forms never override an
+    explicit entry.
+    """
+    table = {}
+    for term, gender in entries.items():
+        table[term.lower().strip()] = gender
+    if with_inflections:
+        for term, gender in list(table.items()):
+            for form in inflections(term):
+                table.setdefault(form, gender)
+
+    keys = sorted(k.encode("utf-8") for k in table)
+    offsets = array("I", [0])
+    genders = array("B")
+    for key in keys:
+        offsets.append(offsets[-1] + len(key))
+        genders.append(GENDER_CODES[table[key.decode("utf-8")]])
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    blob = b"".join(keys)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(keys), len(blob)))
+        f.write(offsets.tobytes())
+        f.write(genders.tobytes())
+        f.write(blob)
+    return len(keys)
+
+
+def read_tsv(path):
+    """
+    One term per line: term<TAB>M|F|N  (N or empty = gender-neutral role)
+    """
+    entries = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            term, _, gender = line.partition("\t")
+            gender = gender.strip().upper()
+            entries[term] = gender if gender in ("M", "F") else None
+    return entries
+
+
+def knowledge_base_entries():
+    from knowledge_base import GENDERED_ROLES, GENDERED_ROLE_PHRASES, NEUTRAL_ROLE_PHRASES
+
+    entries = {phrase: None for phrase in NEUTRAL_ROLE_PHRASES}
+    entries.update(GENDERED_ROLES)
+    entries.update(GENDERED_ROLE_PHRASES)
+    return entries
+
+
+# =========================
+# LOOKUP
+# =========================
+
+class RoleLexicon:
+    """
+    Read-only view of a roles.lex file: get() is a binary search over the
+    mapped key array (O(log n)), prefix() a range scan from the first match.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, n, blob_size = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a role lexicon (version {VERSION})")
+
+        self._n = n
+        view = memoryview(self._mm)
+        pos = HEADER.size
+        offsets = view[pos:pos + 4 * (n + 1)]
+        if sys.byteorder == "little":
+            self._offsets = offsets.cast("I")
+        else:
+            # big-endian hosts pay for one swapped copy of the offsets
+            self._offsets = array("I", offsets.tobytes())
+            self._offsets.byteswap()
+        pos += 4 * (n + 1)
+        self._genders = view[pos:pos + n]
+        self._blob_start = pos + n
+
+    def __len__(self):
+        return self._n
+
+    def _key(self, i):
+        start = self._blob_start
+        return self._mm[start + self._offsets[i]:start + self._offsets[i + 1]]
+
+    def _search(self, key):
+        lo, hi = 0, self._n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def __contains__(self, term):
+        key = term.encode("utf-8")
+        i = self._search(key)
+        return i < self._n and self._key(i) == key
+
+    def get(self, term, default=None):
+        """
+        returns: "M" / "F" for gendered roles, None for neutral roles, and
+        `default` when the term is not in the lexicon.
+        """
+        key = term.encode("utf-8")
+        i = self._search(key)
+        if i < self._n and self._key(i) == key:
+            return GENDERS[self._genders[i]]
+        return default
+
+    def prefix(self, prefix, limit=None):
+        """
+        yields: (term, gender) for every term starting with `prefix`
+        """
+        key = prefix.encode("utf-8")
+        i = self._search(key)
+        found = 0
+        while i < self._n and (limit is None or found < limit):
+            term = self._key(i)
+            if not term.startswith(key):
+                break
+            yield term.decode("utf-8"), GENDERS[self._genders[i]]
+            i += 1
+            found += 1
+
+    def close(self):
+        self._offsets = self._genders = None
+        self._mm.close()
+
+
+_MISSING = object()
+
+
+def load_default_lexicon():
+    """
+    The compact lexicon used by bias_detector, or None if none was built.
+    """
+    path = os.environ.get("PRONOUNBIAS_ROLE_LEXICON", DEFAULT_PATH)
+    if not os.path.exists(path):
+        return None
+    return RoleLexicon(path)
+
+
+# =========================
+# CLI
+# =========================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build and query the compact role lexicon.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="compile TSV files (term<TAB>M|F|N) into a .lex file")
+    build.add_argument("tsv", nargs="*")
+    build.add_argument("--out", default=DEFAULT_PATH)
+    build.add_argument("--no-inflections", action="store_true")
+
+    lookup = sub.add_parser("lookup")
+    lookup.add_argument("term")
+    lookup.add_argument("--lexicon", default=DEFAULT_PATH)
+
+    prefix = sub.add_parser("prefix")
+    prefix.add_argument("prefix")
+    prefix.add_argument("--lexicon", default=DEFAULT_PATH)
+    prefix.add_argument("--limit", type=int, default=50)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        entries = knowledge_base_entries()
+        for path in args.tsv:
+            entries.update(read_tsv(path))
+        n = build_lexicon(entries, args.out, with_inflections=not args.no_inflections)
+        print(f"Wrote {n} terms -> {args.out}")
+
+    elif args.command == "lookup":
+        gender = RoleLexicon(args.lexicon).get(args.term.lower(), _MISSING)
+        print("not found" if gender is _MISSING else (gender or "neutral"))
+
+    elif args.command == "prefix":
+        for term, gender in RoleLexicon(args.lexicon).prefix(args.prefix.lower(), args.limit):
+            print(f"{term}\t{gender or 'N'}")
+
+
+if __name__ == "__main__":
+    main()
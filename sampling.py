@@ -0,0 +1,337 @@
+# sampling.py
+import argparse
+import os
+import random
+import sys
+from array import array
+from statistics import NormalDist
+
+from results import REASONS
+
+# =========================
+# CONFIG
+# =========================
+
+# Upper bounds (characters, or bytes for corpus files) of the length strata
+LENGTH_BUCKETS = (200, 1000, 5000)
+
+DEFAULT_CONFIDENCE = 0.95
+# Every stratum gets at least this many documents so its variance is estimable
+MIN_PER_STRATUM = 2
+
+
+def length_bucket(size, bounds=LENGTH_BUCKETS):
+    lower = 0
+    for upper in bounds:
+        if size < upper:
+            return f"{lower}-{upper}"
+        lower = upper
+    return f"{lower}+"
+
+
+def _z(confidence):
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def wilson_interval(successes, n, confidence=DEFAULT_CONFIDENCE):
+    """
+    Wilson score interval for a binomial proportion; unlike the normal
+    approximation it stays inside [0, 1] and behaves for rates near 0.
+    """
+    if n <= 0:
+        return 0.0, 1.0
+    z = _z(confidence)
+    p = successes / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * ((p * (1 - p) / n + z * z / (4 * n * n)) ** 0.5) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+# =========================
+# STRATA
+# =========================
+
+class StratifiedSampler:
+    """
+    Random sampling without replacement from one or more document sources,
+    stratified by (source, length bucket).
+
+    sources: {name: sequence of texts}; a corpus_reader.CorpusReader is
+             bucketed from its offset index, without reading any document.
+
+    Only document ids are held per stratum (8 bytes each, or a range when
+    strata are not split by length), so strata over tens of millions of
+    documents stay cheap.
+    """
+
+    def __init__(self, sources, by_length=True, seed=None):
+        self.sources = sources
+        self.rng = random.Random(seed)
+        self.strata = {}  # (source, bucket) -> ids
+        for name, docs in sources.items():
+            if not by_length:
+                self.strata[(name, "all")] = range(len(docs))
+                continue
+            size = docs.size if hasattr(docs, "size") else (lambda i, docs=docs: len(docs[i]))
+            for doc_id in range(len(docs)):
+                key = (name, length_bucket(size(doc_id)))
+                self.strata.setdefault(key, array("Q")).append(doc_id)
+
+        self.population = sum(len(ids) for ids in self.strata.values())
+        self._drawn = {key: set() for key in self.strata}
+
+    def weight(self, key):
+        return len(self.strata[key]) / self.population
+
+    def remaining(self, key):
+        return len(self.strata[key]) - len(self._drawn[key])
+
+    def allocate(self, n):
+        """
+        Proportional allocation of `n` new draws, at least MIN_PER_STRATUM
+        per stratum in total, capped by what each stratum has left. The
+        total never exceeds `n`: when rounding and the minimum top-ups add
+        up to more, the largest allocations give back one draw at a time,
+        so the proportional surplus goes first and the top-ups last.
+        """
+        alloc = {}
+        for key, ids in self.strata.items():
+            want = round(n * len(ids) / self.population)
+            want = max(want, MIN_PER_STRATUM - len(self._drawn[key]))
+            alloc[key] = max(0, min(want, self.remaining(key)))
+
+        excess = sum(alloc.values()) - max(0, n)
+        while excess > 0:
+            key = max(alloc, key=lambda k: (alloc[k], len(self.strata[k])))
+            alloc[key] -= 1
+            excess -= 1
+        return alloc
+
+    def draw(self, n):
+        """
+        returns: List[(stratum key, source name, doc id)] of new documents
+        """
+        picked = []
+        for key, k in self.allocate(n).items():
+            ids = self.strata[key]
+            drawn = self._drawn[key]
+            if k > (len(ids) - len(drawn)) // 2:
+                # Dense draw: shuffle what is left
+                positions = [i for i in range(len(ids)) if i not in drawn]
+                new = self.rng.sample(positions, k)
+            else:
+                # Sparse draw: rejection is cheaper than materializing the stratum
+                new = set()
+                while len(new) < k:
+                    i = self.rng.randrange(len(ids))
+                    if i not in drawn:
+                        new.add(i)
+            drawn.update(new)
+            picked.extend((key, key[0], ids[i]) for i in new)
+        return picked
+
+    def exhausted(self):
+        return all(self.remaining(key) == 0 for key in self.strata)
+
+
+# =========================
+# ESTIMATION
+# =========================
+
+class StratumTally:
+    __slots__ = ("n", "biased", "reasons")
+
+    def __init__(self):
+        self.n = 0
+        self.biased = 0
+        self.reasons = [0] * len(REASONS)  # documents with >= 1 span of each reason
+
+    def add(self, item):
+        self.n += 1
+        if item["bias_type"]:
+            self.biased += 1
+        codes = {s.reason for s in item.get("spans") or ()}
+        for code in codes:
+            self.reasons[code] += 1
+
+
+def stratified_estimate(sampler, tallies, count, confidence=DEFAULT_CONFIDENCE):
+    """
+    Stratified estimate of a document-level proportion.
+
+    count: StratumTally -> number of sampled documents with the property
+
+    The variance is the usual stratified one with finite population
+    correction. The interval is a Wilson interval at the effective sample
+    size p(1 - p) / var, which keeps it inside [0, 1] when the rate is near
+    0; a stratified sample with no hits falls back to the plain Wilson
+    interval on the whole sample.
+    """
+    p = var = 0.0
+    n_total = hits = 0
+    for key, tally in tallies.items():
+        if not tally.n:
+            continue
+        w = sampler.weight(key)
+        size = len(sampler.strata[key])
+        p_h = count(tally) / tally.n
+        fpc = 1 - tally.n / size if size else 0.0
+        p += w * p_h
+        if tally.n > 1:
+            var += w * w * p_h * (1 - p_h) / (tally.n - 1) * fpc
+        n_total += tally.n
+        hits += count(tally)
+
+    if var > 0:
+        n_eff = p * (1 - p) / var
+        low, high = wilson_interval(p * n_eff, n_eff, confidence)
+    else:
+        low, high = wilson_interval(hits, n_total, confidence)
+    return {"estimate": p, "low": low, "high": high, "n": n_total}
+
+
+def estimate(sampler, tallies, confidence=DEFAULT_CONFIDENCE):
+    """
+    returns: {
+        "bias_rate": {...},
+        "reasons": {reason text: {...}},  # share of documents with that reason
+        "strata": {(source, bucket): {"population", "n", "bias_rate", "low", "high"}}
+    }
+    """
+    report = {
+        "bias_rate": stratified_estimate(sampler, tallies, lambda t: t.biased, confidence),
+        "reasons": {
+            text: stratified_estimate(sampler, tallies, lambda t, code=code: t.reasons[code], confidence)
+            for code, text in enumerate(REASONS)
+        },
+        "strata": {},
+    }
+    for key, tally in sorted(tallies.items()):
+        low, high = wilson_interval(tally.biased, tally.n, confidence)
+        report["strata"][key] = {
+            "population": len(sampler.strata[key]),
+            "n": tally.n,
+            "bias_rate": tally.biased / tally.n if tally.n else 0.0,
+            "low": low,
+            "high": high,
+        }
+    return report
+
+
+# =========================
+# DRIVER
+# =========================
+
+def sample_analysis(sampler, analyze, initial=200, step=200, target_half_width=None,
+                    max_docs=None, confidence=DEFAULT_CONFIDENCE):
+    """
+    Analyzes a stratified sample and estimates corpus-level bias rates.
+
+    analyze: texts -> structured results (e.g. pipeline.analyze_batched)
+
+    Without `target_half_width` one sample of `initial` documents is drawn.
+    With it, `step` more documents are drawn until the bias-rate interval
+    is at most +/- target_half_width, the corpus is exhausted, or
+    `max_docs` have been analyzed.
+    """
+    tallies = {key: StratumTally() for key in sampler.strata}
+    n = initial
+    analyzed = 0
+    while True:
+        if max_docs is not None:
+            n = min(n, max_docs - analyzed)
+        picked = sampler.draw(n) if n > 0 else []
+        if picked:
+            texts = [sampler.sources[source][doc_id] for _, source, doc_id in picked]
+            for (key, _, _), item in zip(picked, analyze(texts)):
+                tallies[key].add(item)
+            analyzed += len(picked)
+
+        report = estimate(sampler, tallies, confidence)
+        rate = report["bias_rate"]
+        half_width = (rate["high"] - rate["low"]) / 2
+        report["half_width"] = half_width
+        if (
+            target_half_width is None
+            or half_width <= target_half_width
+            or not picked
+            or sampler.exhausted()
+            or (max_docs is not None and analyzed >= max_docs)
+        ):
+            report["population"] = sampler.population
+            report["confidence"] = confidence
+            return report
+        n = step
+
+
+def format_estimate(report):
+    def pct(e):
+        return f"{100 * e['estimate']:6.2f}%  [{100 * e['low']:6.2f}%, {100 * e['high']:6.2f}%]"
+
+    rate = report["bias_rate"]
+    lines = [
+        f"Sampled {rate['n']} of {report['population']} documents "
+        f"({100 * report['confidence']:.0f}% intervals)",
+        f"{'Bias rate':<44}{pct(rate)}",
+    ]
+    for text, e in report["reasons"].items():
+        lines.append(f"{'  ' + text:<44}{pct(e)}")
+
+    lines.append("")
+    lines.append(f"{'SOURCE':<20}{'LENGTH':<12}{'DOCS':>10}{'SAMPLED':>9}{'BIAS RATE':>11}{'INTERVAL':>20}")
+    for (source, bucket), s in report["strata"].items():
+        interval = f"[{100 * s['low']:.1f}%, {100 * s['high']:.1f}%]"
+        lines.append(
+            f"{source:<20}{bucket:<12}{s['population']:>10}{s['n']:>9}"
+            f"{100 * s['bias_rate']:>10.1f}%{interval:>20}"
+        )
+    return "\n".join(lines)
+
+
+# =========================
+# CLI
+# =========================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Estimate corpus-level bias rates from a stratified sample.")
+    parser.add_argument("--corpus", action="append", help="bundled corpus name (default: all, if no --corpus-file)")
+    parser.add_argument("--corpus-file", action="append", help="corpus file; each file is its own source")
+    parser.add_argument("--format", default="lines", help="corpus file format (see corpus_reader.py)")
+    parser.add_argument("--sample", type=int, default=200, help="initial sample size")
+    parser.add_argument("--step", type=int, default=200, help="documents added per round with --target")
+    parser.add_argument("--target", type=float, help="stop once the bias-rate interval is within +/- this")
+    parser.add_argument("--max-docs", type=int)
+    parser.add_argument("--confidence", type=float, default=DEFAULT_CONFIDENCE)
+    parser.add_argument("--no-length-strata", action="store_true", help="stratify by source only")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    if args.corpus_file:
+        from corpus_reader import CorpusReader
+        sources = {os.path.basename(p): CorpusReader(p, fmt=args.format) for p in args.corpus_file}
+    else:
+        from corpora import CORPORA
+        sources = {name: CORPORA[name] for name in (args.corpus or CORPORA)}
+
+    sampler = StratifiedSampler(sources, by_length=not args.no_length_strata, seed=args.seed)
+
+    from coref_solver import CorefResolver
+    from pipeline import analyze_batched
+    resolver = CorefResolver(device="cpu")
+
+    report = sample_analysis(
+        sampler,
+        lambda texts: analyze_batched(texts, resolver),
+        initial=args.sample,
+        step=args.step,
+        target_half_width=args.target,
+        max_docs=args.max_docs,
+        confidence=args.confidence,
+    )
+    print(format_estimate(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+# segmenter.py
+import bisect
+
+from batching import DEFAULT_MAX_TOKENS
+from knowledge_base import PRONOUN_MAP, GENDERED_PRONOUN
+
+# =========================
+# CONFIG
+# =========================
+
+MAX_HEADING_WORDS = 8
+HEADING_STOPWORDS = {"of", "and", "the", "in", "for", "to", "a", "an", "&", "|", "-", "–"}
+SENTENCE_END = (".", "!", "?")
+CLAUSE_END = SENTENCE_END + (";", ",")
+DETERMINERS = {"the", "a", "an", "this", "that", "every", "each", "any", "my", "your", "our"}
+
+
+# =========================
+# SEGMENTATION
+# =========================
+
+def is_heading(line):
+    """
+    Short line without closing punctuation that is upper case, ends with a
+    colon, or has every content word capitalized ("Leadership Philosophy",
+    "PROFESSIONAL SUMMARY", "Operations Manager | NovaSupply Corp (2019–Present)").
+    """
+    words = line.split()
+    if not words or len(words) > MAX_HEADING_WORDS or line.endswith(CLAUSE_END):
+        return False
+    if line.isupper() or line.endswith(":"):
+        return True
+    content = [w for w in words if w.lower() not in HEADING_STOPWORDS]
+    return all(w[:1].isupper() or not w[:1].isalpha() for w in content)
+
+
+def segment_offsets(text):
+    """
+    Splits a document into sections on blank lines and heading lines.
+    A heading is kept with the body that follows it; a line wrapped in the
+    middle of a sentence is never treated as a heading.
+
+    returns: List[(start, end)] character offsets into `text`
+    """
+    segments = []
+    cur_start = None
+    cur_end = None
+    has_body = False
+    prev_closed = True  # previous content line ended a sentence (or none yet)
+
+    pos = 0
+    for line in text.splitlines(keepends=True):
+        line_start = pos
+        pos += len(line)
+        stripped = line.strip()
+
+        if not stripped:
+            if has_body:
+                segments.append((cur_start, cur_end))
+                cur_start, has_body = None, False
+            prev_closed = True
+            continue
+
+        content_start = line_start + len(line) - len(line.lstrip())
+        content_end = line_start + len(line.rstrip())
+
+        if prev_closed and is_heading(stripped):
+            if has_body:
+                segments.append((cur_start, cur_end))
+                cur_start, has_body = None, False
+            prev_closed = True
+        else:
+            has_body = True
+            prev_closed = stripped.endswith(SENTENCE_END)
+
+        if cur_start is None:
+            cur_start = content_start
+        cur_end = content_end
+
+    if cur_start is not None:
+        segments.append((cur_start, cur_end))
+    return segments
+
+
+# =========================
+# SEGMENTED COREF
+# =========================
+
+def resolve_segmented_batch(texts, resolver, docs=None, link_anchors=False, max_tokens=DEFAULT_MAX_TOKENS):
+    """
+    Resolves coreference per segment and maps the clusters back to document
+    offsets. Segments of all documents go through resolver.resolve_batch
+    together, so they run as length-bucketed batches instead of one long
+    sequence per document. Segments without a gendered pronoun are skipped:
+    they cannot produce a bias.
+
+    docs: optional parsed docs (same order); used to recognise PERSON anchors.
+    link_anchors: re-link chains cut at segment boundaries
+                  (link_named_anchors); off by default, since it changes
+                  which pronouns are flagged compared with unsegmented runs.
+    """
+    pieces = []
+    owners = []
+    all_segments = [segment_offsets(text) for text in texts]
+    for d, text in enumerate(texts):
+        for start, end in all_segments[d]:
+            if GENDERED_PRONOUN.search(text, start, end):
+                pieces.append(text[start:end])
+                owners.append((d, start))
+
+    per_doc = [[] for _ in texts]
+    for (d, offset), clusters in zip(owners, resolver.resolve_batch(pieces, max_tokens=max_tokens)):
+        per_doc[d].extend([[(s + offset, e + offset) for s, e in c] for c in clusters])
+
+    if link_anchors:
+        per_doc = [
+            link_named_anchors(text, clusters, docs[d] if docs else None, all_segments[d])
+            for d, (text, clusters) in enumerate(zip(texts, per_doc))
+        ]
+    return per_doc
+
+
+def resolve_segmented(text, resolver, doc=None, link_anchors=False):
+    return resolve_segmented_batch([text], resolver, [doc] if doc is not None else None, link_anchors)[0]
+
+
+def _is_pronoun(text, mention):
+    return text[mention[0]:mention[1]].lower() in PRONOUN_MAP
+
+
+def _is_anchor(text, mention, doc):
+    if doc is not None:
+        span = doc.char_span(mention[0], mention[1])
+        return span is not None and span.root.ent_type_ == "PERSON"
+    words = text[mention[0]:mention[1]].split()
+    return (
+        bool(words)
+        and words[0].lower() not in PRONOUN_MAP
+        and words[0].lower() not in DETERMINERS
+        and all(w[:1].isupper() for w in words)
+    )
+
+
+def _is_plural(mention, doc):
+    if doc is None:
+        return False
+    span = doc.char_span(mention[0], mention[1])
+    return span is not None and span.root.tag_ in ("NNS", "NNPS")
+
+
+def _genders(text, cluster):
+    return {PRONOUN_MAP[text[s:e].lower()] for s, e in cluster if _is_pronoun(text, (s, e))}
+
+
+def link_named_anchors(text, clusters, doc=None, segments=None):
+    """
+    Re-links chains that segmentation cut apart:
+      1. clusters in different segments mentioning the same name ("Arjun")
+         are merged;
+      2. a pronoun-only cluster is attached to the nearest named mention in
+         an earlier segment, i.e. only where the segment boundary hid its
+         antecedent from the coref model. The anchor has to agree: singular,
+         and no pronoun of the other gender in its own cluster. A name in
+         the pronoun's own segment was visible to the model, so it is never
+         linked here.
+
+    segments: segment_offsets(text), when the caller has them already
+    """
+    parent = list(range(len(clusters)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    anchors = []  # (mention, cluster index)
+    by_name = {}
+    for i, cluster in enumerate(clusters):
+        for mention in cluster:
+            if _is_anchor(text, mention, doc):
+                anchors.append((mention, i))
+                name = text[mention[0]:mention[1]]
+                if name in by_name:
+                    parent[find(i)] = find(by_name[name])
+                else:
+                    by_name[name] = i
+
+    # (mention, genders, cluster index); named entities outside any cluster
+    # (index None, gender unknown) can still anchor a dangling chain
+    candidates = [(m, _genders(text, clusters[i]), i) for m, i in anchors]
+    if doc is not None:
+        for ent in doc.ents:
+            if ent.label_ == "PERSON":
+                candidates.append(((ent.start_char, ent.end_char), set(), None))
+    candidates = [c for c in candidates if not _is_plural(c[0], doc)]
+    # at equal positions a clustered mention wins over a bare entity
+    candidates.sort(key=lambda c: (c[0], c[2] is not None))
+
+    segment_starts = [start for start, _ in (segments if segments is not None else segment_offsets(text))]
+
+    added = {}
+    for i, cluster in enumerate(clusters):
+        if not all(_is_pronoun(text, m) for m in cluster):
+            continue
+        gender = _genders(text, cluster)
+        if len(gender) != 1:
+            continue
+        first = min(cluster)[0]
+        k = bisect.bisect_right(segment_starts, first) - 1
+        if k <= 0:
+            continue  # first segment: nothing was cut off before it
+        boundary = segment_starts[k]
+        for mention, anchor_gender, j in reversed(candidates):
+            if mention[1] > boundary or (anchor_gender and anchor_gender != gender):
+                continue
+            if j is None:
+                added.setdefault(i, []).append(mention)
+            else:
+                parent[find(i)] = find(j)
+            break
+
+    merged = {}
+    for i, cluster in enumerate(clusters):
+        merged.setdefault(find(i), set()).update(cluster)
+        merged[find(i)].update(added.get(i, ()))
+    return sorted((sorted(c) for c in merged.values()), key=lambda c: c[0])
@@ -0,0 +1,171 @@
+# snapshot.py
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+# =========================
+# LAYOUT
+# =========================
+#
+# A snapshot directory holds everything needed to start without network
+# access or model-hub lookups:
+#   fcoref/          config, tokenizer and weights (model.safetensors, which
+#                    from_pretrained memory-maps instead of unpickling)
+#   spacy/           the detector pipeline, nlp.to_disk()
+#   snapshot.json    where the models came from and with which versions
+#
+# Point PRONOUNBIAS_SNAPSHOT at it (or pass snapshot_dir= to CorefResolver)
+# and both bias_detector and CorefResolver load from it. Local paths need no
+# hub lookups; to also forbid them, export HF_HUB_OFFLINE=1 before starting
+# Python (transformers and huggingface_hub read it at import time).
+
+SNAPSHOT_ENV = "PRONOUNBIAS_SNAPSHOT"
+
+FCOREF_DIR = "fcoref"
+SPACY_DIR = "spacy"
+META = "snapshot.json"
+
+DEFAULT_FCOREF = "biu-nlp/f-coref"
+DEFAULT_SPACY = "en_core_web_sm"
+
+
+def snapshot_dir():
+    return os.environ.get(SNAPSHOT_ENV) or None
+
+
+def fcoref_path(directory):
+    return os.path.join(directory, FCOREF_DIR)
+
+
+def spacy_path(directory):
+    return os.path.join(directory, SPACY_DIR)
+
+
+def load_spacy(default=DEFAULT_SPACY):
+    """
+    The detector's spaCy pipeline, from the snapshot when one is configured.
+    """
+    import spacy
+
+    directory = snapshot_dir()
+    return spacy.load(spacy_path(directory) if directory else default)
+
+
+# =========================
+# WRITE
+# =========================
+
+def write_snapshot(out_dir, fcoref_name=DEFAULT_FCOREF, spacy_name=DEFAULT_SPACY):
+    """
+    Loads both models by name (network access needed once) and writes them
+    to `out_dir`. The FCoref weights are saved unquantized; quantization is
+    applied at load time.
+    """
+    import spacy
+    import transformers
+    from fastcoref import FCoref
+
+    os.makedirs(out_dir, exist_ok=True)
+
+    nlp = spacy.load(spacy_name)
+    nlp.to_disk(spacy_path(out_dir))
+
+    # FCoref's own spaCy is only a tokenizer; the snapshot copy serves both
+    from coref_solver import quiet_libraries
+    quiet_libraries()
+    fcoref = FCoref(model_name_or_path=fcoref_name, device="cpu", nlp=spacy_path(out_dir),
+                    enable_progress_bar=False)
+    fcoref.model.save_pretrained(fcoref_path(out_dir), safe_serialization=True)
+    fcoref.tokenizer.save_pretrained(fcoref_path(out_dir))
+
+    meta = {
+        "fcoref": fcoref_name,
+        "spacy": spacy_name,
+        "spacy_version": spacy.__version__,
+        "transformers_version": transformers.__version__,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    with open(os.path.join(out_dir, META), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    return meta
+
+
+# =========================
+# COLD START
+# =========================
+
+_COLD_START_PROBE = """
+import json, time
+t0 = time.perf_counter()
+import bias_detector
+t1 = time.perf_counter()
+from coref_solver import CorefResolver
+CorefResolver(device="cpu")
+t2 = time.perf_counter()
+print(json.dumps({"spacy": t1 - t0, "fcoref": t2 - t1, "total": t2 - t0}))
+"""
+
+
+def measure_cold_start(directory=None):
+    """
+    Starts a fresh interpreter and times loading the detector's spaCy
+    pipeline and the coref model, as a new worker would.
+
+    directory: snapshot to start from; None loads by model name
+    returns: {"spacy", "fcoref", "total", "process"} in seconds
+    """
+    env = dict(os.environ)
+    env.pop(SNAPSHOT_ENV, None)
+    if directory:
+        env[SNAPSHOT_ENV] = os.path.abspath(directory)
+
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", _COLD_START_PROBE],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env, capture_output=True, text=True, check=True
+    )
+    elapsed = time.perf_counter() - start
+    timings = json.loads(out.stdout.strip().splitlines()[-1])
+    timings["process"] = elapsed
+    return timings
+
+
+# =========================
+# CLI
+# =========================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write or time a local model snapshot.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    write = sub.add_parser("write")
+    write.add_argument("--out", required=True)
+    write.add_argument("--fcoref", default=DEFAULT_FCOREF)
+    write.add_argument("--spacy", default=DEFAULT_SPACY)
+
+    cold = sub.add_parser("cold-start", help="time a fresh process with and without the snapshot")
+    cold.add_argument("--snapshot", required=True)
+    cold.add_argument("--repeat", type=int, default=3)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "write":
+        meta = write_snapshot(args.out, fcoref_name=args.fcoref, spacy_name=args.spacy)
+        print(f"Snapshot written: {args.out} ({meta['fcoref']}, {meta['spacy']})")
+        return 0
+
+    print(f"{'SOURCE':<12}{'SPACY (s)':>11}{'FCOREF (s)':>12}{'TOTAL (s)':>11}{'PROCESS (s)':>13}")
+    for label, directory in (("by name", None), ("snapshot", args.snapshot)):
+        # best of N, so a cold page cache on the first run does not decide it
+        runs = [measure_cold_start(directory) for _ in range(args.repeat)]
+        best = min(runs, key=lambda r: r["total"])
+        print(f"{label:<12}{best['spacy']:>11.2f}{best['fcoref']:>12.2f}{best['total']:>11.2f}{best['process']:>13.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
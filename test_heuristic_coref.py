@@ -0,0 +1,145 @@
+# test_heuristic_coref.py
+#
+# heuristic_clusters on sentences like those in the labeled test_docs, parsed by hand
+# so neither FCoref nor a trained spaCy pipeline is needed:
+#
+#   python -m pytest -q test_heuristic_coref.py
+import pytest
+
+spacy = pytest.importorskip("spacy")
+from spacy.tokens import Doc
+
+from heuristic_coref import heuristic_clusters
+
+_VOCAB = spacy.blank("en").vocab
+_NO_SPACE_BEFORE = {".", ",", "'s"}
+
+
+def parse(tokens):
+    """
+    tokens: [(word, head index, dep, pos, tag), ...]
+    """
+    words = [t[0] for t in tokens]
+    spaces = [i + 1 < len(words) and words[i + 1] not in _NO_SPACE_BEFORE for i in range(len(words))]
+    return Doc(
+        _VOCAB, words=words, spaces=spaces,
+        heads=[t[1] for t in tokens], deps=[t[2] for t in tokens],
+        pos=[t[3] for t in tokens], tags=[t[4] for t in tokens],
+    )
+
+
+def mentions(doc, clusters):
+    return [[doc.text[s:e] for s, e in cluster] for cluster in clusters]
+
+
+def test_possessive_links_to_generic_subject():
+    doc = parse([
+        ("A", 1, "det", "DET", "DT"),
+        ("user", 4, "nsubj", "NOUN", "NN"),
+        ("should", 4, "aux", "AUX", "MD"),
+        ("always", 4, "advmod", "ADV", "RB"),
+        ("update", 4, "ROOT", "VERB", "VB"),
+        ("his", 6, "poss", "PRON", "PRP$"),
+        ("password", 4, "dobj", "NOUN", "NN"),
+        ("regularly", 4, "advmod", "ADV", "RB"),
+        (".", 4, "punct", "PUNCT", "."),
+    ])
+    assert doc.text == "A user should always update his password regularly."
+    assert mentions(doc, heuristic_clusters(doc)) == [["A user", "his"]]
+
+
+def test_reflexive_links_to_subject():
+    doc = parse([
+        ("The", 1, "det", "DET", "DT"),
+        ("author", 2, "nsubj", "NOUN", "NN"),
+        ("hurt", 2, "ROOT", "VERB", "VBD"),
+        ("himself", 2, "dobj", "PRON", "PRP"),
+        (".", 2, "punct", "PUNCT", "."),
+    ])
+    assert mentions(doc, heuristic_clusters(doc)) == [["The author", "himself"]]
+
+
+def test_subordinate_subject_links_to_named_entity():
+    doc = parse([
+        ("John", 1, "nsubj", "PROPN", "NNP"),
+        ("said", 1, "ROOT", "VERB", "VBD"),
+        ("he", 4, "nsubj", "PRON", "PRP"),
+        ("would", 4, "aux", "AUX", "MD"),
+        ("arrive", 1, "ccomp", "VERB", "VB"),
+        ("later", 4, "advmod", "ADV", "RB"),
+        (".", 1, "punct", "PUNCT", "."),
+    ])
+    assert mentions(doc, heuristic_clusters(doc)) == [["John", "he"]]
+
+
+def test_no_pronoun_needs_no_clusters():
+    doc = parse([
+        ("The", 2, "det", "DET", "DT"),
+        ("final", 2, "amod", "ADJ", "JJ"),
+        ("decision", 4, "nsubjpass", "NOUN", "NN"),
+        ("was", 4, "auxpass", "AUX", "VBD"),
+        ("made", 4, "ROOT", "VERB", "VBN"),
+        ("yesterday", 4, "npadvmod", "NOUN", "NN"),
+        (".", 4, "punct", "PUNCT", "."),
+    ])
+    assert heuristic_clusters(doc) == []
+
+
+@pytest.mark.parametrize("tokens", [
+    # mixed pronoun genders
+    [
+        ("He", 1, "nsubj", "PRON", "PRP"),
+        ("told", 1, "ROOT", "VERB", "VBD"),
+        ("her", 1, "dobj", "PRON", "PRP"),
+        ("that", 6, "mark", "SCONJ", "IN"),
+        ("she", 6, "nsubj", "PRON", "PRP"),
+        ("should", 6, "aux", "AUX", "MD"),
+        ("decide", 1, "ccomp", "VERB", "VB"),
+        (".", 1, "punct", "PUNCT", "."),
+    ],
+    # no antecedent before the pronoun
+    [
+        ("If", 2, "mark", "SCONJ", "IN"),
+        ("he", 2, "nsubj", "PRON", "PRP"),
+        ("calls", 4, "advcl", "VERB", "VBZ"),
+        (",", 4, "punct", "PUNCT", ","),
+        ("take", 4, "ROOT", "VERB", "VB"),
+        ("a", 6, "det", "DET", "DT"),
+        ("message", 4, "dobj", "NOUN", "NN"),
+        (".", 4, "punct", "PUNCT", "."),
+    ],
+    # a second singular noun ("care") before the pronoun
+    [
+        ("A", 1, "det", "DET", "DT"),
+        ("cricketer", 2, "nsubj", "NOUN", "NN"),
+        ("takes", 2, "ROOT", "VERB", "VBZ"),
+        ("care", 2, "dobj", "NOUN", "NN"),
+        ("of", 3, "prep", "ADP", "IN"),
+        ("himself", 4, "pobj", "PRON", "PRP"),
+        (".", 2, "punct", "PUNCT", "."),
+    ],
+    # left dislocation: the pronoun is the main-clause subject, not bound
+    [
+        ("The", 1, "det", "DET", "DT"),
+        ("nurse", 4, "dep", "NOUN", "NN"),
+        (",", 4, "punct", "PUNCT", ","),
+        ("she", 4, "nsubj", "PRON", "PRP"),
+        ("is", 4, "ROOT", "AUX", "VBZ"),
+        ("kind", 4, "acomp", "ADJ", "JJ"),
+        (".", 4, "punct", "PUNCT", "."),
+    ],
+    # two sentences
+    [
+        ("The", 1, "det", "DET", "DT"),
+        ("doctor", 2, "nsubj", "NOUN", "NN"),
+        ("arrived", 2, "ROOT", "VERB", "VBD"),
+        ("late", 2, "advmod", "ADV", "RB"),
+        (".", 2, "punct", "PUNCT", "."),
+        ("His", 6, "poss", "PRON", "PRP$"),
+        ("shift", 7, "nsubj", "NOUN", "NN"),
+        ("ended", 7, "ROOT", "VERB", "VBD"),
+        (".", 7, "punct", "PUNCT", "."),
+    ],
+])
+def test_ambiguous_sentences_fall_back_to_fcoref(tokens):
+    assert heuristic_clusters(parse(tokens)) is None
@@ -0,0 +1,113 @@
+# thread_config.py
+import os
+
+# =========================
+# TOPOLOGY
+# =========================
+#
+# torch (and the BLAS / OpenMP runtimes under it) size their thread pools
+# from the machine's core count. With several analysis processes on one box
+# each of them does that, and N workers x all cores threads thrash. The plan
+# below splits the CPUs this process may actually run on (the affinity
+# mask, which also reflects taskset / cgroup cpusets) between the workers.
+
+# Read by OpenMP / BLAS runtimes when they first start their pools
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+def available_cpus():
+    """
+    CPU ids this process may run on.
+    """
+    try:
+        return sorted(os.sched_getaffinity(0))
+    except AttributeError:  # macOS / Windows
+        return list(range(os.cpu_count() or 1))
+
+
+class ThreadPlan:
+    """
+    intra_op   threads inside one op (torch.set_num_threads, OMP_NUM_THREADS)
+    inter_op   threads running independent ops (torch.set_num_interop_threads),
+               None for torch's default
+    cpus       CPU ids per worker when pinning, else None
+    """
+    __slots__ = ("intra_op", "inter_op", "cpus")
+
+    def __init__(self, intra_op, inter_op, cpus=None):
+        self.intra_op = intra_op
+        self.inter_op = inter_op
+        self.cpus = cpus
+
+    def __repr__(self):
+        return f"ThreadPlan(intra_op={self.intra_op}, inter_op={self.inter_op}, cpus={self.cpus})"
+
+
+def plan_threads(workers=1, intra_op=None, inter_op=None, pin=False, cpus=None):
+    """
+    Splits the available CPUs between `workers` processes (or threads).
+    Explicit intra_op / inter_op values win over the computed ones.
+
+    FCoref runs one op after another, so inter-op parallelism buys little;
+    it is set to 1 whenever cores are shared between workers and otherwise
+    left to torch (None).
+    """
+    cpus = cpus or available_cpus()
+    workers = max(1, workers)
+    share = max(1, len(cpus) // workers)
+    intra = intra_op or share
+    inter = inter_op or (1 if workers > 1 else None)
+
+    slices = None
+    if pin:
+        starts = [(i * share) % len(cpus) for i in range(workers)]
+        slices = [cpus[start:start + share] for start in starts]
+    return ThreadPlan(intra, inter, slices)
+
+
+# =========================
+# APPLY
+# =========================
+
+def apply_env(plan):
+    """
+    Exports the intra-op count for OpenMP / BLAS. Only effective before
+    those runtimes start (i.e. before torch is imported), so this is for
+    launchers and freshly spawned processes. It changes os.environ of the
+    calling process for good: call it in the child, never in a parent that
+    goes on to start other work.
+    """
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(plan.intra_op)
+
+
+def apply_torch(plan):
+    """
+    Sets torch's thread pools for this process. The inter-op pool can only
+    be sized before its first use; afterwards that setting is skipped.
+
+    returns: (intra_op, inter_op) now in effect
+    """
+    import torch
+
+    torch.set_num_threads(plan.intra_op)
+    if plan.inter_op:
+        try:
+            torch.set_num_interop_threads(plan.inter_op)
+        except RuntimeError:
+            pass
+    return torch.get_num_threads(), torch.get_num_interop_threads()
+
+
+def pin_worker(plan, index):
+    """
+    Restricts worker `index` to its own CPU slice (Linux only).
+    """
+    if plan.cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, plan.cpus[index % len(plan.cpus)])
@@ -0,0 +1,112 @@
+# thread_pool.py
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from batching import DEFAULT_MAX_TOKENS
+from thread_config import available_cpus, plan_threads, apply_torch
+from worker_pool import memory_usage
+
+# =========================
+# PER-THREAD STATE
+# =========================
+#
+# spaCy does not promise that one Language object can run from several
+# threads at once, and FCoref's fast tokenizer refuses concurrent use, so
+# every pool thread builds its own spaCy pipeline and its own resolver view
+# (CorefResolver.thread_view). The FCoref weights are shared.
+
+_local = threading.local()
+
+
+def _init_thread(resolver):
+    from snapshot import load_spacy
+
+    _local.nlp = load_spacy()
+    _local.resolver = resolver.thread_view()
+
+
+def _analyze_chunk(texts, analyze_kwargs):
+    from pipeline import analyze_batched
+
+    return analyze_batched(texts, _local.resolver, parser=_local.nlp, **analyze_kwargs)
+
+
+# =========================
+# POOL
+# =========================
+
+class ThreadWorkerPool:
+    """
+    Multi-threaded analysis in one process, as an alternative to
+    worker_pool.ForkWorkerPool: no copy-on-write growth or per-process
+    model, one set of weights. It pays off because torch releases the GIL
+    inside its ops, so several threads' inference overlaps; the rule engine
+    and parsing still serialize on the GIL.
+
+    torch's intra-op pool is process-wide, so it is sized once to this
+    pool's share of the CPUs (thread_config.plan_threads); threads x intra-op
+    threads then matches the available cores.
+    """
+
+    def __init__(self, resolver, workers=None, chunk_size=32, max_tokens=DEFAULT_MAX_TOKENS, segmented=False,
+                 threads_per_worker=None):
+        self.workers = workers or len(available_cpus())
+        self.chunk_size = chunk_size
+        self._analyze_kwargs = {"max_tokens": max_tokens, "segmented": segmented}
+
+        self.thread_plan = plan_threads(self.workers, threads_per_worker)
+        apply_torch(self.thread_plan)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix="analysis",
+            initializer=_init_thread,
+            initargs=(resolver,)
+        )
+
+    def imap(self, texts):
+        """
+        Yields structured results (as pipeline.analyze_batched) in input
+        order, keeping at most 2 chunks per thread in flight.
+        """
+        texts = iter(texts)
+        pending = deque()
+        while True:
+            while len(pending) < 2 * self.workers:
+                chunk = list(islice(texts, self.chunk_size))
+                if not chunk:
+                    break
+                pending.append(self._executor.submit(_analyze_chunk, chunk, self._analyze_kwargs))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+    def map(self, texts):
+        return list(self.imap(texts))
+
+    def memory_report(self):
+        mb = 1024 * 1024
+        u = memory_usage()
+        lines = [f"{'PROCESS':<14}{'RSS MB':>10}{'PSS MB':>10}{'PRIVATE MB':>12}{'SHARED MB':>11}",
+                 f"{'threads x' + str(self.workers):<14}{u['rss'] / mb:>10.1f}{u['pss'] / mb:>10.1f}"
+                 f"{u['private'] / mb:>12.1f}{u['shared'] / mb:>11.1f}"]
+        return "\n".join(lines)
+
+    def footprint(self):
+        """
+        Total memory of the pool in bytes (PSS of this process), comparable
+        to ForkWorkerPool.footprint().
+        """
+        return memory_usage()["pss"]
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -5,7 +5,7 @@ import os
 def create_html_report(results):
     """
     Generates an HTML file highlighting the bias.
-    results: List of dicts -> [{'text': str, 'biases': [(start, end, word), ...]}, ...]
+    results: List of dicts -> [{'text': str, 'biases': [BiasSpan, ...]}, ...]
     """
     html_content = """
     <html>
@@ -32,12 +32,13 @@ def create_html_report(results):
         biases = res['biases']
         
         # Sort spans by start index
-        biases.sort(key=lambda x: x[0])
+        biases = sorted(biases, key=lambda b: b.start)
         
         formatted_text = ""
         cursor = 0
         
-        for start, end, word in biases:
+        for b in biases:
+            start, end = b.start, b.end
             # Append text before the bias
             formatted_text += text[cursor:start]
             # Append the biased word with highlighting
@@ -0,0 +1,199 @@
+# worker_pool.py
+import gc
+import multiprocessing as mp
+import os
+from itertools import islice
+
+from batching import DEFAULT_MAX_TOKENS
+from corpus_reader import CorpusReader
+from thread_config import available_cpus, plan_threads, apply_env, apply_torch, pin_worker
+
+# =========================
+# WORKER STATE
+# =========================
+#
+# Set in the parent before the pool forks, so every worker inherits the
+# already-loaded FCoref model and spaCy pipeline instead of loading its own.
+
+_resolver = None
+_analyze_kwargs = {}
+_readers = {}
+
+
+def memory_usage():
+    """
+    returns: {"rss", "pss", "private", "shared"} in bytes for this process.
+    "private" is what this process alone costs (Private_Clean + Private_Dirty);
+    "pss" splits shared pages evenly between the processes mapping them.
+    """
+    fields = {}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 3 and parts[-1] == "kB":
+                    fields[parts[0].rstrip(":")] = int(parts[1]) * 1024
+    except OSError:
+        from memory_guard import current_rss_bytes
+        rss = current_rss_bytes()
+        return {"rss": rss, "pss": rss, "private": rss, "shared": 0}
+
+    private = fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+    rss = fields.get("Rss", 0)
+    return {"rss": rss, "pss": fields.get("Pss", rss), "private": private, "shared": rss - private}
+
+
+def _init_worker(plan, counter):
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    pin_worker(plan, index)
+    apply_torch(plan)
+    # Set in the worker only, so the parent's environment (and whatever it
+    # starts later) is untouched; inherited by anything the worker starts
+    apply_env(plan)
+
+
+def _read_task(task):
+    kind, payload = task
+    if kind == "texts":
+        return payload
+    path, fmt, start, stop = payload
+    reader = _readers.get((path, fmt))
+    if reader is None:
+        reader = _readers[(path, fmt)] = CorpusReader(path, fmt=fmt)
+    return list(reader.iter_range(start, stop))
+
+
+def _analyze_task(task):
+    from pipeline import analyze_batched
+
+    texts = _read_task(task)
+    results = analyze_batched(texts, _resolver, **_analyze_kwargs)
+    # Texts stay in the parent; only spans travel back
+    return os.getpid(), memory_usage(), [(r["spans"], r["bias_type"]) for r in results]
+
+
+# =========================
+# POOL
+# =========================
+
+class ForkWorkerPool:
+    """
+    Multi-process analysis that loads the models once.
+
+    The resolver (and bias_detector's spaCy pipeline, loaded at import) must
+    exist in the parent before the pool is created. The FCoref tensors are
+    moved to shared memory and the parent's heap is frozen out of the
+    garbage collector, then workers are forked: weights are shared outright
+    and the rest of the parent heap is shared copy-on-write.
+
+    Create the pool before running inference in the parent; forking after
+    torch has started its thread pool can hang the workers.
+
+    Each worker sizes torch's thread pools from its share of the CPUs in the
+    affinity mask (thread_config.plan_threads) so that workers x threads
+    does not oversubscribe the box; threads_per_worker / interop_threads
+    override the split, and pin=True also gives every worker its own CPUs.
+    """
+
+    def __init__(self, resolver, workers=None, chunk_size=32, max_tokens=DEFAULT_MAX_TOKENS, segmented=False,
+                 threads_per_worker=None, interop_threads=None, pin=False):
+        if "fork" not in mp.get_all_start_methods():
+            raise RuntimeError("ForkWorkerPool needs the 'fork' start method (Linux/macOS)")
+
+        global _resolver, _analyze_kwargs
+        _resolver = resolver
+        _analyze_kwargs = {"max_tokens": max_tokens, "segmented": segmented}
+
+        self.workers = workers or len(available_cpus())
+        self.chunk_size = chunk_size
+        self.worker_memory = {}  # pid -> latest memory_usage() of that worker
+
+        # Tokenizers warn (and disable themselves) when forked after use
+        os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+        resolver.model.model.share_memory()
+        gc.collect()
+        # Keeps the collector from writing to (and so copying) parent objects
+        gc.freeze()
+
+        self.thread_plan = plan_threads(self.workers, threads_per_worker, interop_threads, pin=pin)
+
+        self.parent_memory = memory_usage()
+        ctx = mp.get_context("fork")
+        self._pool = ctx.Pool(
+            self.workers,
+            initializer=_init_worker,
+            initargs=(self.thread_plan, ctx.Value("i", 0))
+        )
+
+    def _tasks(self, texts):
+        if isinstance(texts, CorpusReader):
+            for start in range(0, len(texts), self.chunk_size):
+                stop = min(start + self.chunk_size, len(texts))
+                yield ("reader", (texts.path, texts.fmt, start, stop)), None
+            return
+        texts = iter(texts)
+        while True:
+            chunk = list(islice(texts, self.chunk_size))
+            if not chunk:
+                return
+            yield ("texts", chunk), chunk
+
+    def imap(self, texts):
+        """
+        Yields structured results (as pipeline.analyze_batched) in input order.
+        """
+        pending = []
+
+        def tasks():
+            for task, chunk in self._tasks(texts):
+                pending.append(chunk)
+                yield task
+
+        for task_index, (pid, usage, spans) in enumerate(self._pool.imap(_analyze_task, tasks())):
+            self.worker_memory[pid] = usage
+            chunk = pending[task_index]
+            pending[task_index] = None
+            if chunk is None:
+                start = task_index * self.chunk_size
+                chunk = texts.iter_range(start, start + len(spans))
+            for text, (biases, bias_type) in zip(chunk, spans):
+                yield {"text": text, "spans": biases, "bias_type": bias_type}
+
+    def map(self, texts):
+        return list(self.imap(texts))
+
+    def memory_report(self):
+        mb = 1024 * 1024
+        lines = [f"{'PROCESS':<14}{'RSS MB':>10}{'PSS MB':>10}{'PRIVATE MB':>12}{'SHARED MB':>11}"]
+        p = self.parent_memory
+        lines.append(f"{'parent':<14}{p['rss'] / mb:>10.1f}{p['pss'] / mb:>10.1f}"
+                     f"{p['private'] / mb:>12.1f}{p['shared'] / mb:>11.1f}")
+        for pid, u in sorted(self.worker_memory.items()):
+            lines.append(f"{'worker ' + str(pid):<14}{u['rss'] / mb:>10.1f}{u['pss'] / mb:>10.1f}"
+                         f"{u['private'] / mb:>12.1f}{u['shared'] / mb:>11.1f}")
+        if self.worker_memory:
+            overhead = sum(u["private"] for u in self.worker_memory.values()) / len(self.worker_memory)
+            lines.append(f"Per-worker overhead (private memory): {overhead / mb:.1f} MB "
+                         f"vs {p['rss'] / mb:.1f} MB for a fully separate process")
+        return "\n".join(lines)
+
+    def footprint(self):
+        """
+        Total memory of the pool in bytes: PSS of the parent and all
+        workers, so pages shared between them are counted once.
+        """
+        return self.parent_memory["pss"] + sum(u["pss"] for u in self.worker_memory.values())
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+        gc.unfreeze()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False